@@ -58,11 +58,26 @@ ON learning_chunks (concept_tag);
 CREATE INDEX IF NOT EXISTS learning_chunks_doc_source_idx 
 ON learning_chunks (doc_source);
 
+-- Create cached_lessons table for generated lesson reuse
+CREATE TABLE IF NOT EXISTS cached_lessons (
+    id SERIAL PRIMARY KEY,
+    concept_name TEXT NOT NULL,         -- Lowercased target concept
+    time_budget INTEGER NOT NULL,       -- Lesson length in minutes
+    content_markdown TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create lesson cache lookup index (plain equality on lowercased names); one lesson per key
+CREATE UNIQUE INDEX IF NOT EXISTS uq_cached_lessons_concept_budget
+ON cached_lessons (concept_name, time_budget);
+
 -- Grant permissions to learnfast user
 GRANT ALL PRIVILEGES ON TABLE documents TO learnfast;
 GRANT ALL PRIVILEGES ON TABLE learning_chunks TO learnfast;
+GRANT ALL PRIVILEGES ON TABLE cached_lessons TO learnfast;
 GRANT USAGE, SELECT ON SEQUENCE documents_id_seq TO learnfast;
 GRANT USAGE, SELECT ON SEQUENCE learning_chunks_id_seq TO learnfast;
+GRANT USAGE, SELECT ON SEQUENCE cached_lessons_id_seq TO learnfast;
 
 -- User settings for learning calibration
 CREATE TABLE IF NOT EXISTS user_settings (
@@ -67,7 +67,7 @@ const Analytics = () => {
     const [forgettingCurve, setForgettingCurve] = useState(null);
     const [streakStatus, setStreakStatus] = useState(null);
     const [goalProgress, setGoalProgress] = useState([]);
-    const [timeAllocation, setTimeAllocation] = useState([]);
+    const [timeAllocation, setTimeAllocation] = useState(null);
     const [consistency, setConsistency] = useState(null);
     const [recommendations, setRecommendations] = useState([]);
     const [goals, setGoals] = useState([]);
@@ -119,7 +119,7 @@ const Analytics = () => {
                     api.get('/analytics/forgetting-curve', { params }),
                     api.get('/analytics/streak-status'),
                     api.get('/analytics/goal-progress'),
-                    api.get('/analytics/time-allocation', { params }),
+                    api.get('/analytics/time-allocation/series', { params }),
                     api.get('/analytics/consistency', { params }),
                     api.get('/analytics/recommendations', { params })
                 ]);
@@ -131,7 +131,7 @@ const Analytics = () => {
                 setForgettingCurve(curveData);
                 setStreakStatus(streakData);
                 setGoalProgress(goalProgressData?.items || []);
-                setTimeAllocation(allocationData?.items || []);
+                setTimeAllocation(allocationData || null);
                 setConsistency(consistencyData || null);
                 setRecommendations(recommendationsData?.items || []);
             } catch (err) {
@@ -486,24 +486,24 @@ const Analytics = () => {
                     <Timer className="w-5 h-5 text-dark-500" />
                 </div>
                 <div className="h-[280px]">
-                    {timeAllocation.length > 0 ? (
+                    {timeAllocation?.dates?.length > 0 ? (
                         <Bar
                             data={{
-                                labels: timeAllocation.map((item) => new Date(item.date).toLocaleDateString(undefined, { month: 'short', day: 'numeric' })),
+                                labels: timeAllocation.dates.map((day) => new Date(day).toLocaleDateString(undefined, { month: 'short', day: 'numeric' })),
                                 datasets: [
                                     {
                                         label: 'Focus',
-                                        data: timeAllocation.map((item) => item.focus_minutes),
+                                        data: timeAllocation.focus_minutes,
                                         backgroundColor: 'rgba(220, 214, 247, 0.7)'
                                     },
                                     {
                                         label: 'Practice',
-                                        data: timeAllocation.map((item) => item.practice_minutes),
+                                        data: timeAllocation.practice_minutes,
                                         backgroundColor: 'rgba(194, 239, 179, 0.7)'
                                     },
                                     {
                                         label: 'Study',
-                                        data: timeAllocation.map((item) => item.study_minutes),
+                                        data: timeAllocation.study_minutes,
                                         backgroundColor: 'rgba(46, 196, 182, 0.7)'
                                     }
                                 ]
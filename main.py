@@ -3,7 +3,6 @@ import shutil
 import logging
 import subprocess
 import asyncio
-from datetime import datetime
 from typing import List, Optional
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, UploadFile, File, HTTPException, Body, Query, Request
@@ -16,6 +15,7 @@ from pydantic import BaseModel
 
 from src.storage.document_store import DocumentStore
 from src.utils.logger import logger
+from src.utils.time import utcnow
 
 # Configure logging (Removed old basicConfig)
 # logging.basicConfig(level=logging.INFO)
@@ -33,7 +33,7 @@ from src.ingestion.youtube_utils import extract_video_id, fetch_transcript
 from src.config import settings  # Added
 from src.services.weekly_digest_scheduler import run_weekly_digest_scheduler
 from src.services.negotiation_scheduler import run_negotiation_scheduler
-from src.database.connections import postgres_conn
+from src.database.connections import neo4j_conn, postgres_conn
 from src.database.orm import SessionLocal
 from src.models.orm import UserSettings
 from src.queue.ingestion_queue import get_redis, get_queue_health
@@ -148,7 +148,7 @@ async def lifespan(app: FastAPI):
     
     # Initialize components
     ingestion_engine = IngestionEngine()
-    navigation_engine = NavigationEngine()
+    navigation_engine = NavigationEngine.instance()
     user_tracker = UserProgressTracker()
     path_resolver = PathResolver()
     content_retriever = ContentRetriever()
@@ -204,6 +204,13 @@ async def lifespan(app: FastAPI):
     
     logger.info("Components initialized successfully")
 
+    # Build the OpenAPI document up front; generating JSON schemas for every
+    # route model takes ~0.5s, which otherwise lands on the first /docs request.
+    try:
+        app.openapi()
+    except Exception as e:
+        logger.warning(f"Failed to prebuild OpenAPI schema: {e}")
+
     # Start weekly digest scheduler (optional)
     weekly_task = None
     weekly_stop_event = None
@@ -272,6 +279,16 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
+    # Release the shared Bolt connection pools; each close runs even if the other fails
+    try:
+        await neo4j_conn.close_async()
+    except Exception as e:
+        logger.warning(f"Error closing async Neo4j driver: {e}")
+    try:
+        neo4j_conn.close()
+    except Exception as e:
+        logger.warning(f"Error closing Neo4j driver: {e}")
+
 
 
 
@@ -376,7 +393,7 @@ async def health():
     return {
         "ok": True,
         "service": "learnfast-core",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": utcnow().isoformat()
     }
 
 @app.get("/api/config")
@@ -0,0 +1,97 @@
+#!/bin/bash
+#
+# Build a profile-guided (PGO) + fat-LTO pydantic-core wheel trained on this
+# repo's schemas, and optionally install it into the active environment.
+#
+# Steps:
+#   1. ensure a Rust toolchain with llvm-tools (llvm-profdata) and maturin
+#   2. fetch the pydantic-core sdist matching the installed version
+#   3. build an instrumented wheel, install it into a scratch venv and run
+#      scripts/pydantic_pgo_train.py to collect profiles
+#   4. merge the profiles and rebuild with -Cprofile-use and LTO
+#   5. install the optimized wheel (INSTALL=1) or leave it in $OUT_DIR
+#
+# Usage:
+#   scripts/build_pydantic_pgo.sh                 # build into ./dist/pgo
+#   INSTALL=1 scripts/build_pydantic_pgo.sh       # build and install here
+#   TARGET_CPU=native TRAIN_ITERATIONS=100000 scripts/build_pydantic_pgo.sh
+#
+# TRAIN_ITERATIONS defaults to the same 2000 as scripts/pydantic_pgo_train.py;
+# raise it for a longer (not necessarily better) profile.
+#
+# TARGET_CPU is off by default: a native build only runs on CPUs like the
+# build host, so only set it when the wheel is built on the machine (or image
+# base) it will run on.
+
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+PYTHON="${PYTHON:-python}"
+OUT_DIR="${OUT_DIR:-$ROOT/dist/pgo}"
+TRAIN_ITERATIONS="${TRAIN_ITERATIONS:-2000}"
+TARGET_CPU="${TARGET_CPU:-}"
+INSTALL="${INSTALL:-0}"
+
+WORK_DIR="$(mktemp -d)"
+trap 'rm -rf "$WORK_DIR"' EXIT
+PROFILE_DIR="$WORK_DIR/profiles"
+mkdir -p "$PROFILE_DIR" "$OUT_DIR"
+
+# Build against the exact pydantic-core that pydantic (and uv.lock) pins
+CORE_VERSION="$("$PYTHON" -c 'import pydantic_core; print(pydantic_core.__version__)')"
+echo "Building pydantic-core $CORE_VERSION with PGO"
+
+# 1. Toolchain
+if ! command -v rustup &> /dev/null; then
+    echo "Error: rustup not found (https://rustup.rs)"
+    exit 1
+fi
+rustup component add llvm-tools-preview
+"$PYTHON" -m pip install --quiet "maturin>=1.5"
+
+SYSROOT="$(rustc --print sysroot)"
+LLVM_PROFDATA="$(find "$SYSROOT" -name llvm-profdata -type f | head -n 1)"
+if [ -z "$LLVM_PROFDATA" ]; then
+    echo "Error: llvm-profdata not found under $SYSROOT"
+    exit 1
+fi
+
+# 2. Sources
+"$PYTHON" -m pip download --quiet --no-deps --no-binary :all: \
+    "pydantic-core==$CORE_VERSION" -d "$WORK_DIR"
+tar -xzf "$WORK_DIR"/pydantic_core-"$CORE_VERSION".tar.gz -C "$WORK_DIR"
+SRC_DIR="$WORK_DIR/pydantic_core-$CORE_VERSION"
+
+BASE_RUSTFLAGS=""
+if [ -n "$TARGET_CPU" ]; then
+    BASE_RUSTFLAGS="-Ctarget-cpu=$TARGET_CPU"
+fi
+
+# 3. Instrumented build + training run
+echo "Building instrumented wheel..."
+(cd "$SRC_DIR" && RUSTFLAGS="$BASE_RUSTFLAGS -Cprofile-generate=$PROFILE_DIR" \
+    "$PYTHON" -m maturin build --release --out "$WORK_DIR/instrumented")
+
+"$PYTHON" -m venv --system-site-packages "$WORK_DIR/venv"
+"$WORK_DIR/venv/bin/pip" install --quiet --force-reinstall --no-deps "$WORK_DIR"/instrumented/*.whl
+
+echo "Training on repo schemas ($TRAIN_ITERATIONS iterations)..."
+(cd "$ROOT" && "$WORK_DIR/venv/bin/python" scripts/pydantic_pgo_train.py "$TRAIN_ITERATIONS")
+
+# 4. Optimized build
+"$LLVM_PROFDATA" merge -o "$WORK_DIR/merged.profdata" "$PROFILE_DIR"
+
+echo "Building optimized wheel..."
+(cd "$SRC_DIR" && \
+    CARGO_PROFILE_RELEASE_LTO=fat \
+    CARGO_PROFILE_RELEASE_CODEGEN_UNITS=1 \
+    RUSTFLAGS="$BASE_RUSTFLAGS -Cprofile-use=$WORK_DIR/merged.profdata -Cllvm-args=-pgo-warn-missing-function" \
+    "$PYTHON" -m maturin build --release --out "$OUT_DIR")
+
+# 5. Install
+if [ "$INSTALL" = "1" ]; then
+    "$PYTHON" -m pip install --force-reinstall --no-deps "$OUT_DIR"/pydantic_core-"$CORE_VERSION"-*.whl
+    echo "Installed PGO build of pydantic-core $CORE_VERSION"
+else
+    echo "Wheel written to $OUT_DIR"
+fi
@@ -0,0 +1,142 @@
+"""
+Training workload for a profile-guided pydantic-core build.
+
+Exercises the validator/serializer paths our API actually hits: ORM-style
+attribute loads into list DTOs, nested curriculum trees, graph payloads from
+the ingestion pipeline and JSON round trips. Run under an instrumented
+pydantic-core build (see build_pydantic_pgo.sh); the absolute timings are
+meaningless there, only the branch profile matters.
+
+Usage: python scripts/pydantic_pgo_train.py [iterations]
+"""
+import sys
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+from pydantic import TypeAdapter
+
+# Ensure repo root is on sys.path for absolute imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.models.schemas import (
+    ActivityLogResponse,
+    CurriculumWeekResponse,
+    DocumentListAdapter,
+    FlashcardResponse,
+    GraphSchema,
+    IngestionJobResponse,
+    KnowledgeGraphDataResponse,
+    StudySessionListAdapter,
+)
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+FLASHCARDS = TypeAdapter(List[FlashcardResponse])
+ACTIVITY = TypeAdapter(List[ActivityLogResponse])
+
+
+def _documents(n: int) -> list:
+    return [
+        SimpleNamespace(
+            id=i, title=f"Doc {i}", filename=f"doc_{i}.pdf", status="completed", tags=["ml", "notes"],
+            category=None, ai_summary="Summary " * 20, ingestion_step="complete", ingestion_progress=100.0,
+            file_type="pdf", display_type="pdf", file_path=f"/data/doc_{i}.pdf", upload_date=NOW,
+            extracted_text=None, raw_extracted_text=None, filtered_extracted_text=None,
+            reading_progress=0.4, folder_id=None, source_url=None, source_type="upload",
+            content_profile={"processing_recommendation": "standard", "pages": 12}, ocr_status=None,
+            ocr_provider=None, time_spent_reading=1200, last_opened=NOW, first_opened=NOW,
+            completion_estimate=30, page_count=12, reading_time_min=20, reading_time_max=40,
+            reading_time_median=30, word_count=8000, difficulty_score=0.6, language="en",
+            scanned_prob=0.0, ingestion_error=None, linked_to_graph=True, graph_link_count=4,
+        )
+        for i in range(n)
+    ]
+
+
+def _flashcards(n: int) -> list:
+    return [
+        SimpleNamespace(
+            id=f"card-{i}", front="What is a gradient?", back="Vector of partial derivatives", card_type="basic",
+            tags=["calculus"], document_id=i % 7, created_at=NOW, ease_factor=2.5, interval=i % 30,
+            repetitions=i % 5, next_review=NOW, last_review=None if i % 3 else NOW,
+        )
+        for i in range(n)
+    ]
+
+
+def _sessions(n: int) -> list:
+    return [
+        SimpleNamespace(
+            id=f"s-{i}", start_time=NOW, end_time=NOW, cards_reviewed=20, new_cards=5, review_cards=15,
+            average_rating=3.5, goal=None, study_type="deep", reflection=None, effectiveness_rating=4,
+        )
+        for i in range(n)
+    ]
+
+
+def _activity(n: int) -> list:
+    return [
+        {"id": i, "activity_type": "review", "description": "Reviewed a card", "timestamp": NOW,
+         "document_id": None, "extra_data": {"rating": 4}}
+        for i in range(n)
+    ]
+
+
+def _week() -> dict:
+    return {
+        "id": "w1", "curriculum_id": "c1", "week_index": 1, "goal": "Foundations",
+        "focus_concepts": ["limits", "derivatives"], "estimated_hours": 6.0, "start_date": date(2026, 1, 5),
+        "tasks": [
+            {"id": f"t{i}", "week_id": "w1", "title": f"Task {i}", "linked_doc_id": 3,
+             "action_metadata": {"concepts": ["limits"]}, "mastery_score": 0.4}
+            for i in range(8)
+        ],
+        "checkpoints": [{"id": "cp1", "week_id": "w1", "title": "Quiz", "linked_doc_ids": [3, 4]}],
+    }
+
+
+def _graph() -> dict:
+    concepts = [f"concept {i}" for i in range(60)]
+    return {
+        "concepts": concepts,
+        "prerequisites": [
+            {"source_concept": concepts[i], "target_concept": concepts[i + 1], "weight": 0.8,
+             "reasoning": "builds on"}
+            for i in range(59)
+        ],
+    }
+
+
+def main(iterations: int) -> None:
+    documents, flashcards, sessions = _documents(50), _flashcards(100), _sessions(20)
+    activity, week, graph = _activity(50), _week(), _graph()
+    kg_payload = {
+        "graph_id": "g1",
+        "nodes": [{"id": f"n{i}", "name": f"concept {i}"} for i in range(200)],
+        "links": [{"source": f"n{i}", "target": f"n{i + 1}", "weight": 0.5} for i in range(199)],
+        "node_count": 200, "relationship_count": 199, "graph_meta": {"id": "g1"},
+    }
+    job = SimpleNamespace(id="j1", document_id=1, status="running", phase="ingesting", progress=42.0,
+                          message=None, partial_ready=False, started_at=NOW, completed_at=None)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        DocumentListAdapter.dump_json(DocumentListAdapter.validate_python(documents, from_attributes=True))
+        FLASHCARDS.dump_json(FLASHCARDS.validate_python(flashcards, from_attributes=True))
+        StudySessionListAdapter.dump_json(StudySessionListAdapter.validate_python(sessions, from_attributes=True))
+        ACTIVITY.dump_json(ACTIVITY.validate_python(activity))
+        CurriculumWeekResponse.model_validate(week).model_dump(mode="json")
+        schema = GraphSchema.model_validate(graph)
+        GraphSchema.model_validate_json(schema.model_dump_json())
+        KnowledgeGraphDataResponse.model_validate(kg_payload).model_dump_json()
+        IngestionJobResponse.model_validate(job).model_dump_json()
+    print(f"{iterations} iterations in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -5,12 +5,12 @@ import subprocess
 import socket
 import time
 import logging
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
 from functools import lru_cache
 import psycopg2
 from psycopg2.extras import RealDictCursor
 from psycopg2.pool import SimpleConnectionPool
-from neo4j import GraphDatabase, Driver
+from neo4j import AsyncDriver, AsyncGraphDatabase, GraphDatabase, Driver, READ_ACCESS
 from neo4j.exceptions import ServiceUnavailable
 from dotenv import load_dotenv
 
@@ -333,7 +333,11 @@ class Neo4jConnection:
         self.user = user or os.getenv("NEO4J_USER", "neo4j")
         self.password = password or os.getenv("NEO4J_PASSWORD", "password")
         self._port = int(os.getenv("NEO4J_PORT", "7688"))
+        # Naming the database up front saves the driver a home-database
+        # lookup round trip on every session
+        self.database = os.getenv("NEO4J_DATABASE", "neo4j")
         self._driver: Optional[Driver] = None
+        self._async_driver: Optional[AsyncDriver] = None
         self._verified_uri: Optional[str] = None
 
     def _get_uri(self) -> str:
@@ -354,12 +358,29 @@ class Neo4jConnection:
         self._verified_uri = uri
         return uri
 
+    @staticmethod
+    def _pool_config() -> dict:
+        return {
+            "max_connection_pool_size": int(os.getenv("NEO4J_MAX_POOL", "100")),
+            "connection_acquisition_timeout": float(os.getenv("NEO4J_ACQ_TIMEOUT", "60")),
+            "max_connection_lifetime": float(os.getenv("NEO4J_MAX_LIFETIME", "3600")),
+        }
+
+    def _create_driver(self, uri: str) -> Driver:
+        """Create the long-lived pooled driver, closing any previous one."""
+        if self._driver is not None:
+            self._driver.close()
+        self._driver = GraphDatabase.driver(uri, auth=(self.user, self.password), **self._pool_config())
+        # One id per process is expected; repeated lines mean the driver is being rebuilt
+        logger.info(f"Created Neo4j driver {id(self._driver):#x} for {uri}")
+        return self._driver
+
     def connect(self, verify: bool = False) -> Driver:
         """Establish connection to Neo4j database."""
         if self._driver is None or verify:
             uri = self._get_uri()
             try:
-                self._driver = GraphDatabase.driver(uri, auth=(self.user, self.password))
+                self._create_driver(uri)
                 # Verify connection works
                 with self._driver.session() as session:
                     session.run("RETURN 1")
@@ -369,27 +390,95 @@ class Neo4jConnection:
                 ConnectionCache.clear()
                 self._verified_uri = None
                 uri = find_working_neo4j_uri(self.user, self.password, self._port)
-                self._driver = GraphDatabase.driver(uri, auth=(self.user, self.password))
+                self._create_driver(uri)
 
         return self._driver
 
+    def connect_async(self) -> AsyncDriver:
+        """
+        Get the async driver, for use from the event loop.
+
+        Reuses the URI the sync driver resolved (connecting it first if needed)
+        so endpoint auto-detection only ever runs on the sync path.
+        """
+        if self._async_driver is None:
+            uri = self._explicit_uri or os.getenv("NEO4J_URI") or self._verified_uri
+            if not uri:
+                self.connect()
+                uri = self._get_uri()
+            self._async_driver = AsyncGraphDatabase.driver(
+                uri, auth=(self.user, self.password), **self._pool_config()
+            )
+        return self._async_driver
+
     def close(self):
         """Close the Neo4j connection."""
         if self._driver:
             self._driver.close()
             self._driver = None
 
-    def execute_query(self, query: str, parameters: Optional[dict] = None):
-        """Execute a Cypher query and return results."""
+    async def close_async(self):
+        """Close the async driver."""
+        if self._async_driver:
+            await self._async_driver.close()
+            self._async_driver = None
+
+    def execute_query(self, query: str, parameters: Optional[dict] = None, fetch: str = "records"):
+        """
+        Execute a Cypher query and return results.
+
+        With fetch="values" only the first column of each row is returned,
+        e.g. a plain list of names instead of Record objects.
+        """
         driver = self.connect()
-        with driver.session() as session:
+        with driver.session(database=self.database) as session:
             result = session.run(query, parameters or {})
-            return [record for record in result]
+            return result.value() if fetch == "values" else [record for record in result]
+
+    def execute_read(self, query: str, parameters: Optional[dict] = None, fetch: str = "records") -> list:
+        """
+        Run a read-only Cypher query in a managed transaction.
+
+        The driver retries transient failures and routes to readers in a
+        cluster; records are buffered inside the transaction function.
+        fetch="values" works as in execute_query.
+        """
+        def work(tx):
+            result = tx.run(query, parameters or {})
+            return result.value() if fetch == "values" else list(result)
+
+        driver = self.connect()
+        with driver.session(database=self.database, default_access_mode=READ_ACCESS) as session:
+            return session.execute_read(work)
+
+    async def execute_read_async(self, query: str, parameters: Optional[dict] = None, fetch: str = "records") -> list:
+        """Async counterpart of execute_read, releasing the event loop during Bolt I/O."""
+        async def work(tx):
+            result = await tx.run(query, parameters or {})
+            return await result.value() if fetch == "values" else [record async for record in result]
+
+        async with self.connect_async().session(database=self.database, default_access_mode=READ_ACCESS) as session:
+            return await session.execute_read(work)
+
+    def execute_stream(self, query: str, parameters: Optional[dict] = None, fetch: str = "records") -> Iterator:
+        """
+        Run a read-only Cypher query and yield rows as the driver receives them.
+
+        fetch="values" yields the first column of each row instead of the record.
+        """
+        driver = self.connect()
+        with driver.session(database=self.database, default_access_mode=READ_ACCESS) as session:
+            with session.begin_transaction() as tx:
+                result = tx.run(query, parameters or {})
+                if fetch == "values":
+                    yield from (record[0] for record in result)
+                else:
+                    yield from result
 
     def execute_write_query(self, query: str, parameters: Optional[dict] = None):
         """Execute a write Cypher query."""
         driver = self.connect()
-        with driver.session() as session:
+        with driver.session(database=self.database) as session:
             return session.run(query, parameters or {})
 
 
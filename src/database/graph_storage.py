@@ -1,6 +1,8 @@
 """Knowledge graph storage operations for Neo4j database."""
 
 import logging
+import sys
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -10,6 +12,23 @@ from .connections import neo4j_conn
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=100_000)
+def normalize_name(raw: str) -> str:
+    """Normalize a concept name for storage and lookup (trimmed, lowercase)."""
+    return sys.intern(raw.strip().lower())
+
+
+@lru_cache(maxsize=100_000)
+def scoped_id(document_id: int, concept_name: str) -> str:
+    """
+    Build the document-scoped concept ID ``doc{id}_{normalized_name}``.
+
+    Results are interned, so repeated IDs share one string object and dict
+    lookups keyed by them hit the identity fast path.
+    """
+    return sys.intern(f"doc{document_id}_{normalize_name(concept_name).replace(' ', '_')}")
+
+
 class GraphStorage:
     """
     Handles all Neo4j knowledge graph storage operations.
@@ -48,6 +67,17 @@ class GraphStorage:
                 "FOR (u:User) REQUIRE u.uid IS UNIQUE"
             )
             
+            # Case-insensitive lookup key used by the navigation queries; backfill
+            # nodes written before the key existed
+            self.connection.execute_write_query(
+                "CREATE INDEX concept_name_key IF NOT EXISTS "
+                "FOR (c:Concept) ON (c.name_key)"
+            )
+            self.connection.execute_write_query(
+                "MATCH (c:Concept) WHERE c.name_key IS NULL "
+                "SET c.name_key = toLower(trim(c.name))"
+            )
+            
             # Create index for faster prerequisite relationship queries
             self.connection.execute_write_query(
                 "CREATE INDEX prerequisite_weight_index IF NOT EXISTS "
@@ -59,7 +89,21 @@ class GraphStorage:
                 "CREATE INDEX completed_timestamp_index IF NOT EXISTS "
                 "FOR ()-[r:COMPLETED]-() ON (r.finished_at)"
             )
-            
+
+            # Lookup keys used by the multi-document navigation queries
+            self.connection.execute_write_query(
+                "CREATE INDEX document_id_index IF NOT EXISTS "
+                "FOR (d:Document) ON (d.id)"
+            )
+            self.connection.execute_write_query(
+                "CREATE INDEX document_concept_id_index IF NOT EXISTS "
+                "FOR (dc:DocumentConcept) ON (dc.id)"
+            )
+            self.connection.execute_write_query(
+                "CREATE INDEX document_concept_normalized_name_index IF NOT EXISTS "
+                "FOR (dc:DocumentConcept) ON (dc.normalized_name)"
+            )
+
             # Schema Nudge: Mention properties/labels that cause warnings if not present (Neo4j 5.x)
             # This "teaches" the metadata about these elements even when the DB is empty.
             # We create dummy nodes/rels and then immediately delete ALL of them (including the User).
@@ -187,11 +231,13 @@ class GraphStorage:
             query = """
                 MERGE (c:Concept {name: $name})
                 ON CREATE SET 
+                    c.name_key = $name,
                     c.description = $description,
                     c.depth_level = $depth_level,
                     c.created_at = datetime(),
                     c.source_docs = CASE WHEN $doc_id IS NOT NULL THEN [$doc_id] ELSE [] END
                 ON MATCH SET
+                    c.name_key = $name,
                     c.description = COALESCE($description, c.description),
                     c.depth_level = COALESCE($depth_level, c.depth_level),
                     c.updated_at = datetime(),
@@ -562,8 +608,7 @@ class MultiDocGraphStorage:
     @staticmethod
     def generate_scoped_id(document_id: int, concept_name: str) -> str:
         """Generate a document-scoped concept ID."""
-        normalized = concept_name.strip().lower().replace(" ", "_")
-        return f"doc{document_id}_{normalized}"
+        return scoped_id(document_id, concept_name)
     
     def store_document_concept(
         self,
@@ -578,8 +623,8 @@ class MultiDocGraphStorage:
         
         Creates: doc{id}_concept_name node with document relationship.
         """
-        scoped_id = self.generate_scoped_id(document_id, concept_name)
-        normalized = concept_name.strip().lower()
+        concept_scoped_id = self.generate_scoped_id(document_id, concept_name)
+        normalized = normalize_name(concept_name)
         
         try:
             query = """
@@ -608,7 +653,7 @@ class MultiDocGraphStorage:
             """
             
             result = self.connection.execute_query(query, {
-                "scoped_id": scoped_id,
+                "scoped_id": concept_scoped_id,
                 "global_name": concept_name.strip(),
                 "normalized": normalized,
                 "description": description,
@@ -79,6 +79,8 @@ def initialize_orm_tables():
         migrate_document_sections_table()
         # Manually migrate quiz submissions table/columns
         migrate_document_quiz_submissions_table()
+        # Enforce (user_id, key) uniqueness on agent_memory for upserts
+        migrate_agent_memory_table()
         
         return True
     except Exception as e:
@@ -167,6 +169,26 @@ def migrate_document_quiz_submissions_table():
         pass
 
 
+def migrate_agent_memory_table():
+    """Deduplicate agent_memory rows and add the (user_id, key) unique index."""
+    try:
+        # Keep the most recently updated row for each (user_id, key) pair; a
+        # NULL updated_at counts as oldest and id only breaks ties
+        postgres_conn.execute_write("""
+            DELETE FROM agent_memory a
+            USING agent_memory b
+            WHERE a.user_id = b.user_id
+              AND a.key = b.key
+              AND (COALESCE(a.updated_at, '-infinity'::timestamp), a.id)
+                < (COALESCE(b.updated_at, '-infinity'::timestamp), b.id)
+        """)
+        postgres_conn.execute_write(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_agent_memory_user_key ON agent_memory(user_id, key)"
+        )
+    except Exception as e:
+        print(f"Could not add agent_memory unique index: {e}")
+
+
 def migrate_user_settings_table():
     """Add new columns to user_settings table if they are missing."""
     cols_to_add = [
@@ -406,6 +428,17 @@ def migrate_learning_chunks_table():
     except Exception:
         pass
 
+    # Concept tags are compared with plain equality so the concept_tag index is usable;
+    # lowercase rows written before ingestion normalized them.
+    try:
+        postgres_conn.execute_write("""
+            UPDATE learning_chunks
+            SET concept_tag = lower(concept_tag)
+            WHERE concept_tag <> lower(concept_tag)
+        """)
+    except Exception:
+        pass
+
     # Index for fast dimensionality filtering.
     try:
         postgres_conn.execute_write(
@@ -421,6 +454,39 @@ def migrate_learning_chunks_table():
         pass
 
 
+def migrate_cached_lessons_table():
+    """Ensure cached_lessons exists with lowercased, deduplicated concept names and its unique lookup index."""
+    try:
+        postgres_conn.execute_write("""
+            CREATE TABLE IF NOT EXISTS cached_lessons (
+                id SERIAL PRIMARY KEY,
+                concept_name TEXT NOT NULL,
+                time_budget INTEGER NOT NULL,
+                content_markdown TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        postgres_conn.execute_write("""
+            UPDATE cached_lessons
+            SET concept_name = lower(concept_name)
+            WHERE concept_name <> lower(concept_name)
+        """)
+        # Keep the oldest row for each (concept_name, time_budget) pair
+        postgres_conn.execute_write("""
+            DELETE FROM cached_lessons a
+            USING cached_lessons b
+            WHERE a.concept_name = b.concept_name
+              AND a.time_budget = b.time_budget
+              AND a.id > b.id
+        """)
+        postgres_conn.execute_write(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_cached_lessons_concept_budget ON cached_lessons (concept_name, time_budget)"
+        )
+        postgres_conn.execute_write("DROP INDEX IF EXISTS cached_lessons_concept_budget_idx")
+    except Exception as e:
+        print(f"Could not migrate cached_lessons table: {e}")
+
+
 def initialize_databases():
     """Initialize both Neo4j and PostgreSQL databases."""
     print("Initializing databases...")
@@ -437,6 +503,7 @@ def initialize_databases():
     
     # 2b. Ensure vector table supports mixed embedding dimensions
     migrate_learning_chunks_table()
+    migrate_cached_lessons_table()
 
     # 3. Initialize Neo4j constraints
     try:
@@ -19,7 +19,8 @@ from dotenv import load_dotenv
 
 from src.models.schemas import GraphSchema, PrerequisiteLink
 from src.database.neo4j_conn import neo4j_conn
-from src.database.graph_storage import graph_storage
+from src.database.graph_storage import graph_storage, normalize_name
+from src.navigation.navigation_engine import NavigationEngine
 from .vector_storage import VectorStorage, EmbeddingDimensionMismatchError
 from .document_processor import DocumentProcessor
 from src.services.llm_service import llm_service, RateLimitException
@@ -104,7 +105,7 @@ Content to analyze:
             return self._normalize_concept_name(name[0])
             
         # Convert to string and strip/lower
-        return str(name).strip().lower()
+        return normalize_name(str(name))
     
     MAX_EXTRACTION_CHARS = settings.extraction_max_chars  # Default limit for extraction windows
     MAX_WINDOW_FAILURE_RATIO = 0.4
@@ -456,6 +457,7 @@ Content to analyze:
         try:
             # Use the dedicated graph storage module
             result = graph_storage.store_graph_schema(schema, document_id)
+            NavigationEngine.invalidate_roots()
             
             logger.info(f"Stored {result['concepts_stored']} concepts and {result['relationships_stored']} prerequisites")
             
@@ -721,6 +723,7 @@ Content to analyze:
             )
             if success:
                 relationships_stored += 1
+        NavigationEngine.invalidate_roots()
         
         return {
             "document_id": document_id,
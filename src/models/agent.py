@@ -4,7 +4,9 @@ Defines the state, input/output structures, and configuration for the agent.
 """
 from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime, timezone
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.models.schemas import GoalDomain
 
 # --- Configuration ---
 
@@ -53,7 +55,7 @@ class AgentEmbeddingConfig(BaseModel):
 
 class AgentSettings(BaseModel):
     """Global settings for the Agent."""
-    model_config = {"extra": "ignore"}  # Ignore extra fields from UI
+    model_config = ConfigDict(extra="ignore")  # Ignore extra fields from UI
 
     llm_config: AgentLLMConfig = Field(default_factory=AgentLLMConfig)
     vision_llm_config: AgentLLMConfig = Field(default_factory=AgentLLMConfig)
@@ -183,7 +185,7 @@ class AgentResponse(BaseModel):
 class AgentOnboardingGoal(BaseModel):
     title: str
     description: Optional[str] = None
-    domain: str = "learning"
+    domain: GoalDomain = "learning"
     target_hours: float = 100.0
     deadline: Optional[datetime] = None
     priority: int = 1
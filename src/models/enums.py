@@ -16,3 +16,25 @@ class CardType(str, Enum):
     """Enum for flashcard types."""
     BASIC = "basic"
     CLOZE = "cloze"
+
+
+class IngestionStatus(str, Enum):
+    """Lifecycle states of an ingestion job."""
+    PENDING = "pending"
+    RUNNING = "running"
+    PAUSED = "paused"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class SessionMode(str, Enum):
+    """Practice session lengths offered by the practice engine."""
+    QUICK = "quick"
+    FOCUS = "focus"
+    DEEP = "deep"
+
+
+class Severity(str, Enum):
+    """Severity of dashboard insights and analytics recommendations."""
+    INFO = "info"
+    WARNING = "warning"
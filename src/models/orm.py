@@ -5,7 +5,7 @@ from datetime import datetime
 from src.utils.time import utcnow
 from typing import List, Optional
 import uuid
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Date, Float, Boolean, JSON, ARRAY
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Date, Float, Boolean, JSON, ARRAY, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from src.database.orm import Base
@@ -549,8 +549,10 @@ class AgentMemory(Base):
     category = Column(String, default="general") # general, scratchpad, preference
     updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
 
-    # Composite unique constraint on user_id and key could be added in __table_args__
-    # but for now we will handle it in application logic or assume uniqueness
+    # Enforced so writes can upsert with ON CONFLICT (user_id, key)
+    __table_args__ = (
+        UniqueConstraint("user_id", "key", name="uq_agent_memory_user_key"),
+    )
 
 
 class AgentMemoryEpisodic(Base):
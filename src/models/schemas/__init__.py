@@ -0,0 +1,190 @@
+"""
+Pydantic models for LearnFast Core Engine data structures.
+
+The schemas are split by domain into submodules and re-exported lazily:
+``from src.models.schemas import GoalResponse`` imports (and builds the core
+schemas of) ``goals`` only, so a worker that serves one route family never
+pays for the others.
+"""
+
+import importlib
+from typing import Any, Dict, List, Tuple
+
+_SUBMODULES: Dict[str, Tuple[str, ...]] = {
+    "common": (
+        "Probability",
+        "Rating0_5",
+        "Rating1_5",
+        "DepthLevel",
+        "StudyType",
+        "SessionType",
+        "GoalDomain",
+        "ReminderFrequency",
+        "JsonObject",
+        "JsonObjectList",
+        "EpochMs",
+        "LLMConfig",
+    ),
+    "graph": (
+        "PrerequisiteLink",
+        "ConceptChunkIndex",
+        "GraphSchema",
+        "DocumentScopedConcept",
+        "CrossDocumentConcept",
+        "DocumentGraph",
+        "GlobalConceptIndex",
+        "embedding_matrix",
+        "UserState",
+        "ConceptNode",
+        "UserNode",
+        "LearningChunk",
+        "LearningPath",
+        "DocumentMetadata",
+        "PathRequest",
+        "ProgressUpdate",
+    ),
+    "documents": (
+        "DocumentBase",
+        "DocumentCreate",
+        "DocumentLinkCreate",
+        "DocumentResponse",
+        "FolderBase",
+        "FolderCreate",
+        "FolderUpdate",
+        "FolderResponse",
+        "TimeTrackingRequest",
+        "DocumentSectionResponse",
+        "DocumentSectionUpdate",
+        "DocumentQualityResponse",
+        "IngestionJobResponse",
+        "DocumentQuizItem",
+        "DocumentQuizGenerateRequest",
+        "DocumentQuizSessionCreate",
+        "DocumentQuizSessionResponse",
+        "MarkdownExportResponse",
+        "MarkdownSaveRequest",
+        "ExercisePreviewRequest",
+        "ExerciseCandidate",
+        "ExerciseCreateItem",
+        "ExerciseCreateRequest",
+        "DocumentQuizGradeRequest",
+        "DocumentQuizGradeResponse",
+        "DocumentQuizBatchGradeItem",
+        "DocumentQuizBatchGradeResponse",
+        "HighlightActionRequest",
+        "HighlightActionResponse",
+        "DocumentStudySettingsPayload",
+        "DocumentStudySettingsResponse",
+        "DocumentQuizStatsResponse",
+        "DocumentListAdapter",
+        "DocumentSectionListAdapter",
+    ),
+    "study": (
+        "FlashcardBase",
+        "FlashcardCreate",
+        "FlashcardUpdate",
+        "SRSState",
+        "FlashcardResponse",
+        "StudyReviewCreate",
+        "StudySessionCreate",
+        "StudySessionEnd",
+        "StudySessionResponse",
+        "FlashcardListAdapter",
+        "StudySessionListAdapter",
+    ),
+    "analytics": (
+        "DashboardPlanItem",
+        "DashboardPlanSummary",
+        "DashboardUpcomingReview",
+        "DashboardGoalPacingItem",
+        "DashboardFocusSummary",
+        "DashboardInsight",
+        "DashboardOverviewResponse",
+        "AnalyticsGoalProgressItem",
+        "AnalyticsGoalProgressResponse",
+        "AnalyticsTimeAllocationItem",
+        "AnalyticsTimeAllocationResponse",
+        "AnalyticsTimeAllocationSeries",
+        "AnalyticsConsistencyResponse",
+        "AnalyticsRecommendation",
+        "AnalyticsRecommendationsResponse",
+        "ActivityLogResponse",
+        "AnalyticsOverview",
+        "StudyStats",
+        "ActivityLogListAdapter",
+    ),
+    "practice": (
+        "PracticeSessionCreate",
+        "PracticeSessionItem",
+        "PracticeSessionStartResponse",
+        "PracticeItemSubmit",
+        "PracticeItemResult",
+        "PracticeSessionEnd",
+        "PracticeSessionSummary",
+        "PracticeHistoryItem",
+        "PracticeHistoryResponse",
+    ),
+    "kg": (
+        "KnowledgeGraphBase",
+        "KnowledgeGraphCreate",
+        "KnowledgeGraphUpdate",
+        "KnowledgeGraphResponse",
+        "KnowledgeGraphBuildRequest",
+        "KnowledgeGraphConnectionSuggestion",
+        "KnowledgeGraphConnectionRequest",
+        "KnowledgeGraphSuggestionRequest",
+        "KnowledgeGraphDataResponse",
+        "KnowledgeGraphData",
+    ),
+    "curriculum": (
+        "CurriculumModuleBase",
+        "ModuleContent",
+        "CurriculumModuleResponse",
+        "CurriculumBase",
+        "CurriculumCreate",
+        "CurriculumGenerateRequest",
+        "CurriculumTaskResponse",
+        "CurriculumCheckpointResponse",
+        "CurriculumWeekResponse",
+        "CurriculumTimelineResponse",
+        "CurriculumMetricsResponse",
+        "CurriculumWeekReportResponse",
+        "CurriculumResponse",
+        "CurriculumListAdapter",
+    ),
+    "goals": (
+        "GoalBase",
+        "GoalCreate",
+        "GoalUpdate",
+        "GoalResponse",
+        "DailyPlanItem",
+        "DailyPlanResponse",
+        "DailyPlanEntryUpdate",
+        "DailyPlanEntryCreate",
+        "DailyPlanHistoryItem",
+        "DailyPlanHistoryResponse",
+        "FocusSessionCreate",
+        "FocusSessionEnd",
+        "FocusSessionResponse",
+        "FocusSessionListAdapter",
+    ),
+}
+
+_EXPORTS: Dict[str, str] = {
+    name: module for module, names in _SUBMODULES.items() for name in names
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
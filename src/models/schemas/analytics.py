@@ -0,0 +1,193 @@
+"""Dashboard and analytics API schemas."""
+
+from datetime import datetime, date
+from typing import List
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from src.models.enums import Severity
+from src.models.schemas.common import JsonObject, EpochMs
+
+
+# ========== Analytics Schemas ==========
+
+class DashboardPlanItem(BaseModel):
+    id: str
+    title: str
+    item_type: str
+    duration_minutes: int
+    goal_id: str | None = None
+    notes: str | None = None
+    completed: bool
+    completed_at: datetime | None = None
+
+
+class DashboardPlanSummary(BaseModel):
+    items: List[DashboardPlanItem] = Field(default_factory=list)
+    total_count: int = 0
+    completed_count: int = 0
+    minutes_planned: int = 0
+    minutes_completed: int = 0
+
+
+class DashboardUpcomingReview(BaseModel):
+    date: str
+    count: int
+
+
+class DashboardGoalPacingItem(BaseModel):
+    goal_id: str
+    title: str
+    deadline: datetime | None = None
+    target_hours: float
+    logged_hours: float
+    remaining_hours: float
+    required_minutes_per_day: int
+    status: str
+    days_remaining: int | None = None
+
+
+class DashboardFocusSummary(BaseModel):
+    minutes_today: int
+    minutes_last_7_days: int
+    practice_minutes_today: int
+    practice_minutes_last_7_days: int
+    study_minutes_today: int
+    study_minutes_last_7_days: int
+
+
+class DashboardInsight(BaseModel):
+    id: str
+    title: str
+    message: str
+    action_label: str | None = None
+    action_route: str | None = None
+    severity: Severity = Severity.INFO
+
+    model_config = ConfigDict(use_enum_values=True)
+
+
+class DashboardOverviewResponse(BaseModel):
+    today_plan: DashboardPlanSummary
+    due_today: int
+    upcoming_reviews: List[DashboardUpcomingReview] = Field(default_factory=list)
+    goal_pacing: List[DashboardGoalPacingItem] = Field(default_factory=list)
+    focus_summary: DashboardFocusSummary
+    insights: List[DashboardInsight] = Field(default_factory=list)
+    retention_rate: float
+    velocity: float
+    streak_status: dict
+
+    model_config = ConfigDict(frozen=True)
+
+
+class AnalyticsGoalProgressItem(BaseModel):
+    goal_id: str
+    title: str
+    deadline: datetime | None = None
+    target_hours: float
+    logged_hours: float
+    progress_pct: float
+    expected_progress_pct: float | None = None
+    pace_status: str
+    required_minutes_per_day: int
+    days_remaining: int | None = None
+
+
+class AnalyticsGoalProgressResponse(BaseModel):
+    items: List[AnalyticsGoalProgressItem]
+
+    model_config = ConfigDict(frozen=True)
+
+
+class AnalyticsTimeAllocationItem(BaseModel):
+    date: str
+    focus_minutes: int
+    practice_minutes: int
+    study_minutes: int
+    total_minutes: int
+
+
+class AnalyticsTimeAllocationResponse(BaseModel):
+    items: List[AnalyticsTimeAllocationItem]
+
+    model_config = ConfigDict(frozen=True)
+
+
+class AnalyticsTimeAllocationSeries(BaseModel):
+    """Time allocation as parallel per-day columns (index i of every list is one day)."""
+    dates: List[str] = Field(default_factory=list)
+    focus_minutes: List[int] = Field(default_factory=list)
+    practice_minutes: List[int] = Field(default_factory=list)
+    study_minutes: List[int] = Field(default_factory=list)
+    total_minutes: List[int] = Field(default_factory=list)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class AnalyticsConsistencyResponse(BaseModel):
+    active_days: int
+    total_days: int
+    longest_streak: int
+    missed_days: int
+
+    model_config = ConfigDict(frozen=True)
+
+
+class AnalyticsRecommendation(BaseModel):
+    id: str
+    title: str
+    message: str
+    action_label: str | None = None
+    action_route: str | None = None
+    severity: Severity = Severity.INFO
+
+    model_config = ConfigDict(use_enum_values=True)
+
+
+class AnalyticsRecommendationsResponse(BaseModel):
+    items: List[AnalyticsRecommendation]
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ActivityLogResponse(BaseModel):
+    """Schema for user activity log entries."""
+    id: int
+    activity_type: str
+    description: str
+    timestamp: EpochMs
+    document_id: int | None = None
+    extra_data: JsonObject = Field(default_factory=dict)
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+def _srs_default() -> dict:
+    return {"new": 0, "learning": 0, "mastered": 0}
+
+
+class AnalyticsOverview(BaseModel):
+    """Global statistics and overview data."""
+    total_documents: int
+    total_flashcards: int
+    total_reviews: int
+    cards_due_today: int
+    study_streak: int
+    retention_rate: float
+    total_time_spent: int = 0
+    avg_completion_time: float = 0
+    srs_distribution: dict = Field(default_factory=_srs_default)
+
+
+class StudyStats(BaseModel):
+    """Daily study performance statistics."""
+    date: str
+    cards_reviewed: int
+    new_cards: int
+    average_rating: float
+
+
+# ========== List Adapters ==========
+
+ActivityLogListAdapter = TypeAdapter(List[ActivityLogResponse])
@@ -0,0 +1,62 @@
+"""Shared field types and config models used across the schema modules."""
+
+from datetime import datetime, timezone
+from typing import Annotated, Any, Dict, List, Literal
+
+from pydantic import BaseModel, BeforeValidator, Field, PlainValidator, WithJsonSchema
+
+
+# Shared constrained types so repeated bounds reuse one validator definition
+Probability = Annotated[float, Field(ge=0.0, le=1.0)]
+Rating0_5 = Annotated[int, Field(ge=0, le=5)]
+Rating1_5 = Annotated[int, Field(ge=1, le=5)]
+DepthLevel = Annotated[int, Field(ge=0)]
+
+# Closed vocabularies accepted on input. Response models keep plain str so
+# rows written before these were enforced still serialize.
+StudyType = Literal["deep", "practice"]
+SessionType = Literal["focus", "break", "deep", "practice"]
+GoalDomain = Literal["learning", "health", "career", "project"]
+ReminderFrequency = Literal["daily", "weekly", "none"]
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+# Opaque JSON from DB columns / graph queries: accepted as-is instead of being
+# walked key by key. The declared type still drives the JSON schema.
+JsonObject = Annotated[Dict[str, Any], PlainValidator(_passthrough, json_schema_input_type=Dict[str, Any])]
+JsonObjectList = Annotated[
+    List[Dict[str, Any]],
+    PlainValidator(_passthrough, json_schema_input_type=List[Dict[str, Any]]),
+]
+
+
+def _to_epoch_ms(value: Any) -> Any:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            # Naive DB timestamps are stored in UTC
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1000)
+    return value
+
+
+# Timestamps in high-volume list DTOs go over the wire as integer Unix epoch
+# milliseconds (UTC). Datetimes are converted on load; queries that already
+# compute the epoch in SQL pass plain ints straight through.
+EpochMs = Annotated[
+    int,
+    BeforeValidator(_to_epoch_ms),
+    WithJsonSchema({"type": "integer", "format": "unix-time-ms"}),
+]
+
+
+# ========== Configuration Schemas ==========
+
+class LLMConfig(BaseModel):
+    """Configuration for LLM provider overrides."""
+    provider: str = "openai"
+    api_key: str | None = None
+    base_url: str | None = None
+    model: str | None = None
@@ -0,0 +1,183 @@
+"""Curriculum API schemas."""
+
+from datetime import datetime, date
+from typing import Annotated, Any, Dict, List
+
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, TypeAdapter
+
+from src.models.schemas.common import LLMConfig
+
+
+# ========== Curriculum Schemas ==========
+
+class CurriculumModuleBase(BaseModel):
+    title: str
+    description: str | None = None
+    module_type: str = "primer"
+    order: int = 0
+    estimated_time: str | None = None
+
+
+def _module_content_kind(value: Any) -> str:
+    """Pick the ModuleContent branch from the stored value's JSON type."""
+    if isinstance(value, str):
+        return "markdown"
+    if isinstance(value, list):
+        return "items"
+    if isinstance(value, dict):
+        return "object"
+    return "legacy"
+
+
+# Module content is markdown for primer/reading modules and LLM-generated JSON
+# (question or flashcard lists) for practice/srs modules. The stored JSON has no
+# type field of its own, so the union is tagged on the value's runtime type.
+# Older rows may hold bare scalars; the "legacy" branch passes those through
+# instead of failing response validation.
+ModuleContent = Annotated[
+    Annotated[str, Tag("markdown")]
+    | Annotated[List[Any], Tag("items")]
+    | Annotated[Dict[str, Any], Tag("object")]
+    | Annotated[Any, Tag("legacy")],
+    Discriminator(_module_content_kind),
+]
+
+
+class CurriculumModuleResponse(CurriculumModuleBase):
+    id: str
+    is_completed: bool
+    content: ModuleContent | None = None
+
+    completed_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class CurriculumBase(BaseModel):
+    title: str
+    description: str | None = None
+    target_concept: str | None = None
+
+
+class CurriculumCreate(CurriculumBase):
+    document_id: int | None = None
+    user_id: str = "default_user"
+    llm_config: LLMConfig | None = None
+
+
+class CurriculumGenerateRequest(CurriculumBase):
+    user_id: str = "default_user"
+    document_id: int | None = None
+    document_ids: List[int] = Field(default_factory=list)
+    time_budget_hours_per_week: int = 5
+    duration_weeks: int = 4
+    start_date: date | None = None
+    llm_enhance: bool = False
+    llm_config: LLMConfig | None = None
+    gating_mode: str | None = Field(default="recommend", description="recommend or strict")
+
+
+class CurriculumTaskResponse(BaseModel):
+    id: str
+    week_id: str
+    title: str
+    task_type: str = "reading"
+    linked_doc_id: int | None = None
+    linked_module_id: str | None = None
+    estimate_minutes: int = 30
+    notes: str | None = None
+    status: str = "pending"
+    action_metadata: Dict[str, Any] | None = None
+    gated: bool = False
+    gate_reason: str | None = None
+    mastery_score: float | None = None
+    mastery_required: float | None = None
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class CurriculumCheckpointResponse(BaseModel):
+    id: str
+    week_id: str
+    title: str
+    success_criteria: str | None = None
+    linked_doc_ids: List[int] = Field(default_factory=list)
+    linked_module_ids: List[str] = Field(default_factory=list)
+    assessment_type: str = "recall"
+    due_date: date | None = None
+    status: str = "pending"
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class CurriculumWeekResponse(BaseModel):
+    id: str
+    curriculum_id: str
+    week_index: int
+    goal: str | None = None
+    focus_concepts: List[str] = Field(default_factory=list)
+    estimated_hours: float = 0.0
+    status: str = "planned"
+    start_date: date | None = None
+    end_date: date | None = None
+    tasks: List[CurriculumTaskResponse] = Field(default_factory=list)
+    checkpoints: List[CurriculumCheckpointResponse] = Field(default_factory=list)
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class CurriculumTimelineResponse(BaseModel):
+    curriculum_id: str
+    weeks: List[CurriculumWeekResponse] = Field(default_factory=list)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class CurriculumMetricsResponse(BaseModel):
+    curriculum_id: str
+    weeks_total: int = 0
+    weeks_completed: int = 0
+    tasks_total: int = 0
+    tasks_completed: int = 0
+    progress_percent: float = 0.0
+    last_activity_at: datetime | None = None
+    next_checkpoint_title: str | None = None
+    next_checkpoint_due: date | None = None
+
+    model_config = ConfigDict(frozen=True)
+
+
+class CurriculumWeekReportResponse(BaseModel):
+    week_id: str
+    curriculum_id: str
+    week_index: int
+    title: str
+    markdown: str
+    stats: Dict[str, Any] = Field(default_factory=dict)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class CurriculumResponse(CurriculumBase):
+    id: str
+    user_id: str
+    document_id: int | None = None
+    document_ids: List[int] = Field(default_factory=list)
+    goal_id: str | None = None
+    status: str
+    progress: float
+    start_date: date | None = None
+    duration_weeks: int = 4
+    time_budget_hours_per_week: int = 5
+    llm_enhance: bool = False
+    gating_mode: str = "recommend"
+    created_at: datetime
+    updated_at: datetime
+    modules: List[CurriculumModuleResponse] = Field(default_factory=list)
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ========== List Adapters ==========
+
+CurriculumListAdapter = TypeAdapter(List[CurriculumResponse])
@@ -0,0 +1,324 @@
+"""Document, folder, ingestion and document-quiz API schemas."""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from src.models.enums import FileType, IngestionStatus
+from src.models.schemas.common import JsonObject, EpochMs, LLMConfig
+
+
+# ========== Document Schemas ==========
+
+class DocumentBase(BaseModel):
+    """Base schema for document data."""
+    title: str | None = None
+    filename: str | None = None
+    status: str | None = "pending"
+    tags: List[str] | None = Field(default_factory=list)
+    category: str | None = None
+    ai_summary: str | None = None
+    ingestion_step: str | None = "pending"
+    ingestion_progress: float = 0.0
+
+
+class DocumentCreate(DocumentBase):
+    """Schema for creating a new document."""
+    folder_id: str | None = None
+
+
+class DocumentLinkCreate(BaseModel):
+    """Schema for adding an external link."""
+    url: str
+    title: str
+    category: str | None = None
+    folder_id: str | None = None
+    tags: List[str] = Field(default_factory=list)
+    auto_ingest: bool | None = False
+
+
+class DocumentResponse(DocumentBase):
+    """Schema for document API responses."""
+    id: int  # Adapted to int match learn-fast-core DB
+    file_type: FileType | None = FileType.OTHER
+    display_type: str | None = None
+    file_path: str | None = None
+    upload_date: datetime
+    status: str = "pending"
+    extracted_text: str | None = None
+    raw_extracted_text: str | None = None
+    filtered_extracted_text: str | None = None
+    ai_summary: str | None = None
+    reading_progress: float = 0.0
+    folder_id: str | None = None
+    source_url: str | None = None
+    source_type: str | None = None
+    content_profile: Dict[str, Any] | None = None
+    ocr_status: str | None = None
+    ocr_provider: str | None = None
+
+    # Time tracking fields
+    time_spent_reading: int = 0
+    last_opened: datetime | None = None
+    first_opened: datetime | None = None
+    completion_estimate: int | None = None
+    page_count: int = 0
+    
+    # Advanced Metrics
+    reading_time_min: int | None = None
+    reading_time_max: int | None = None
+    reading_time_median: int | None = None
+    word_count: int = 0
+    difficulty_score: float | None = None
+    language: str | None = None
+    scanned_prob: float = 0.0
+    ingestion_error: str | None = None
+    linked_to_graph: bool = False
+    graph_link_count: int = 0
+    ingestion_job_status: str | None = None
+    ingestion_job_phase: str | None = None
+    ingestion_job_message: str | None = None
+    ingestion_job_updated_at: datetime | None = None
+    normalized_status: str | None = None
+    status_reason: str | None = None
+    progress_percent: float | None = None
+    processing_recommendation: Dict[str, Any] | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ========== Folder Schemas ==========
+
+class FolderBase(BaseModel):
+    """Base schema for folder data."""
+    name: str
+    color: str = "#8b5cf6"
+    icon: str = "folder"
+
+
+class FolderCreate(FolderBase):
+    """Schema for creating a new folder."""
+    pass
+
+
+class FolderUpdate(BaseModel):
+    """Schema for updating an existing folder."""
+    name: str | None = None
+    color: str | None = None
+    icon: str | None = None
+
+
+class FolderResponse(FolderBase):
+    """Schema for folder API responses."""
+    id: str
+    created_at: datetime
+    document_count: int = 0
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ========== Tracking Schemas ==========
+
+class TimeTrackingRequest(BaseModel):
+    """Request schema for updating document reading time."""
+    seconds_spent: int
+    reading_progress: float | None = None
+
+
+class DocumentSectionResponse(BaseModel):
+    id: str
+    document_id: int
+    section_index: int
+    title: str | None = None
+    content: str
+    excerpt: str | None = None
+    relevance_score: float = 0.0
+    included: bool = True
+    page_start: int | None = None
+    page_end: int | None = None
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class DocumentSectionUpdate(BaseModel):
+    included: bool | None = None
+
+
+class DocumentQualityResponse(BaseModel):
+    document_id: int
+    raw_word_count: int = 0
+    filtered_word_count: int = 0
+    dedup_ratio: float = 0.0
+    boilerplate_removed_lines: int = 0
+    sections_total: int = 0
+    sections_included: int = 0
+    ocr_status: str | None = None
+    ocr_provider: str | None = None
+    notes: str | None = None
+
+    model_config = ConfigDict(frozen=True)
+
+
+class IngestionJobResponse(BaseModel):
+    id: str
+    document_id: int
+    status: IngestionStatus
+    phase: str  # free-form: also carries the ingestion engine's progress step text
+    progress: float
+    message: str | None = None
+    partial_ready: bool = False
+    started_at: EpochMs | None = None
+    completed_at: EpochMs | None = None
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, use_enum_values=True)
+
+
+class DocumentQuizItem(BaseModel):
+    id: str
+    document_id: int
+    mode: str = "cloze"
+    passage_markdown: str
+    masked_markdown: str | None = None
+    answer_key: List[str] = Field(default_factory=list)
+    tags: List[str] = Field(default_factory=list)
+    difficulty: int = 3
+    source_span: JsonObject = Field(default_factory=dict)
+    created_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class DocumentQuizGenerateRequest(BaseModel):
+    mode: str = "cloze"
+    count: int = 5
+    max_length: int = 450
+    difficulty: int = 3
+    source_mode: str = "auto"
+    selection_text: str | None = None
+    llm_config: LLMConfig | None = None
+
+class DocumentQuizSessionCreate(BaseModel):
+    mode: str = "cloze"
+    item_ids: List[str] | None = None
+    settings: Dict[str, Any] | None = None
+
+class DocumentQuizSessionResponse(BaseModel):
+    id: str
+    document_id: int
+    mode: str
+    settings: Dict[str, Any] = Field(default_factory=dict)
+    status: str = "active"
+    items: List[DocumentQuizItem] = Field(default_factory=list)
+
+    model_config = ConfigDict(frozen=True)
+
+class MarkdownExportResponse(BaseModel):
+    markdown: str
+    page_start: int | None = None
+    page_end: int | None = None
+    image_mode: str = "base64"
+    warnings: List[str] = Field(default_factory=list)
+
+    model_config = ConfigDict(frozen=True)
+
+class MarkdownSaveRequest(BaseModel):
+    markdown: str
+
+class ExercisePreviewRequest(BaseModel):
+    source_mode: str = "auto"
+    selection_text: str | None = None
+    page_start: int | None = None
+    page_end: int | None = None
+    use_llm: bool = False
+    llm_config: LLMConfig | None = None
+
+class ExerciseCandidate(BaseModel):
+    question_number: str | None = None
+    text: str
+    page_start: int | None = None
+    page_end: int | None = None
+    confidence: float = 0.5
+
+class ExerciseCreateItem(BaseModel):
+    text: str
+    question_number: str | None = None
+    page_start: int | None = None
+    page_end: int | None = None
+
+class ExerciseCreateRequest(BaseModel):
+    items: List[ExerciseCreateItem]
+    mode: str = "exercise"
+
+class DocumentQuizGradeRequest(BaseModel):
+    session_id: str
+    quiz_item_id: str
+    answer_text: str
+    transcript: str | None = None
+    llm_config: LLMConfig | None = None
+    submission_id: str | None = None
+
+class DocumentQuizGradeResponse(BaseModel):
+    score: float
+    feedback: str
+    llm_eval: Dict[str, Any] = Field(default_factory=dict)
+    alternative_approaches: List[str] = Field(default_factory=list)
+
+    model_config = ConfigDict(frozen=True)
+
+class DocumentQuizBatchGradeItem(BaseModel):
+    quiz_item_id: str | None = None
+    question_number: str | None = None
+    answer_text: str | None = None
+    mapped: bool = False
+    score: float | None = None
+    feedback: str | None = None
+    llm_eval: Dict[str, Any] = Field(default_factory=dict)
+    alternative_approaches: List[str] = Field(default_factory=list)
+
+class DocumentQuizBatchGradeResponse(BaseModel):
+    submission_id: str | None = None
+    items: List[DocumentQuizBatchGradeItem] = Field(default_factory=list)
+    unmapped_text: str | None = None
+
+    model_config = ConfigDict(frozen=True)
+
+class HighlightActionRequest(BaseModel):
+    action: str
+    selection_text: str
+    question: str | None = None
+    llm_config: LLMConfig | None = None
+
+class HighlightActionResponse(BaseModel):
+    output: str
+
+    model_config = ConfigDict(frozen=True)
+
+class DocumentStudySettingsPayload(BaseModel):
+    reveal_config: Dict[str, Any] = Field(default_factory=dict)
+    llm_config: LLMConfig | None = None
+    voice_mode_enabled: bool = False
+
+class DocumentStudySettingsResponse(BaseModel):
+    reveal_config: Dict[str, Any] = Field(default_factory=dict)
+    llm_config: LLMConfig | None = None
+    voice_mode_enabled: bool = False
+
+    model_config = ConfigDict(frozen=True)
+
+
+class DocumentQuizStatsResponse(BaseModel):
+    document_id: int
+    total_attempts: int = 0
+    average_score: float = 0.0
+    best_score: float = 0.0
+    last_attempt_at: datetime | None = None
+    attempts_last_7d: int = 0
+    average_score_last_7d: float = 0.0
+
+    model_config = ConfigDict(frozen=True)
+
+
+# ========== List Adapters ==========
+
+DocumentListAdapter = TypeAdapter(List[DocumentResponse])
+DocumentSectionListAdapter = TypeAdapter(List[DocumentSectionResponse])
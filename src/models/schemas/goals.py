@@ -0,0 +1,148 @@
+"""Goal, daily-plan and focus-session API schemas."""
+
+from datetime import datetime, date as date_type
+from typing import List
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from src.models.schemas.common import SessionType, GoalDomain, ReminderFrequency, EpochMs
+
+
+# ========== Goal Schemas ==========
+
+class GoalBase(BaseModel):
+    """Base schema for goal data."""
+    title: str
+    description: str | None = None
+    domain: str = "learning"  # learning, health, career, project
+    target_hours: float = 100.0
+    deadline: datetime | None = None
+    priority: int = 1  # 1=high, 2=medium, 3=low
+    email_reminders: bool = True
+    reminder_frequency: str = "daily"  # daily, weekly, none
+    short_term_goals: List[str] = Field(default_factory=list)
+    near_term_goals: List[str] = Field(default_factory=list)
+    long_term_goals: List[str] = Field(default_factory=list)
+
+
+class GoalCreate(GoalBase):
+    """Schema for creating a new goal."""
+    domain: GoalDomain = "learning"
+    reminder_frequency: ReminderFrequency = "daily"
+
+
+class GoalUpdate(BaseModel):
+    """Schema for updating a goal."""
+    title: str | None = None
+    description: str | None = None
+    domain: GoalDomain | None = None
+    target_hours: float | None = None
+    deadline: datetime | None = None
+    priority: int | None = None
+    status: str | None = None
+    email_reminders: bool | None = None
+    reminder_frequency: ReminderFrequency | None = None
+    short_term_goals: List[str] | None = None
+    near_term_goals: List[str] | None = None
+    long_term_goals: List[str] | None = None
+
+
+class GoalResponse(GoalBase):
+    """Schema for goal API responses."""
+    id: str
+    user_id: str
+    logged_hours: float = 0.0
+    status: str = "active"
+    created_at: datetime
+    updated_at: datetime
+    
+    # Computed fields (set by API)
+    progress_percent: float | None = 0.0
+    days_remaining: int | None = None
+    is_on_track: bool | None = True
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class DailyPlanItem(BaseModel):
+    id: str
+    title: str
+    item_type: str = "study"
+    duration_minutes: int = 30
+    source_id: str | None = None
+    notes: str | None = None
+    completed: bool | None = False
+    completed_at: datetime | None = None
+
+
+class DailyPlanResponse(BaseModel):
+    date: date_type
+    items: List[DailyPlanItem] = Field(default_factory=list)
+    readiness_score: float | None = None
+    biometrics_mode: str | None = None
+
+    model_config = ConfigDict(frozen=True)
+
+
+class DailyPlanEntryUpdate(BaseModel):
+    completed: bool = True
+
+
+class DailyPlanEntryCreate(BaseModel):
+    title: str
+    item_type: str = "study"
+    duration_minutes: int = 30
+    notes: str | None = None
+    goal_id: str | None = None
+    date: date_type | None = None
+
+
+class DailyPlanHistoryItem(BaseModel):
+    id: str
+    date: date_type
+    title: str
+    item_type: str
+    duration_minutes: int
+    goal_id: str | None = None
+    notes: str | None = None
+    completed: bool = False
+    completed_at: EpochMs | None = None
+
+
+class DailyPlanHistoryResponse(BaseModel):
+    items: List[DailyPlanHistoryItem] = Field(default_factory=list)
+
+    model_config = ConfigDict(frozen=True)
+
+
+# ========== Focus Session Schemas ==========
+
+class FocusSessionCreate(BaseModel):
+    """Schema for starting a focus session."""
+    goal_id: str | None = None
+    session_type: SessionType = "focus"
+
+
+class FocusSessionEnd(BaseModel):
+    """Schema for ending a focus session."""
+    duration_minutes: int
+    notes: str | None = None
+
+
+class FocusSessionResponse(BaseModel):
+    """Schema for focus session responses."""
+    id: str
+    goal_id: str | None = None
+    user_id: str
+    start_time: datetime
+    end_time: datetime | None = None
+    duration_minutes: int
+    session_type: str
+    notes: str | None = None
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ========== List Adapters ==========
+
+FocusSessionListAdapter = TypeAdapter(List[FocusSessionResponse])
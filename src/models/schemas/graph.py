@@ -0,0 +1,292 @@
+"""Knowledge-graph value types used by ingestion, storage and navigation."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Iterable, List
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+from src.utils.time import utcnow
+from src.models.schemas.common import Probability, DepthLevel
+
+
+@pydantic_dataclass(slots=True, frozen=True)
+class PrerequisiteLink:
+    """
+    Represents a prerequisite relationship between concepts.
+
+    A slotted pydantic dataclass: links are built in bulk during ingestion, so
+    they skip BaseModel's per-instance __dict__ while still validating weight
+    bounds on LLM output.
+    """
+    
+    # Scoped IDs for document-specific relationships
+    source_concept: str = Field(..., description="The fundamental concept (scoped ID)")
+    target_concept: str = Field(..., description="The advanced concept (scoped ID)")
+    source_doc_id: int | None = Field(None, description="Document ID for source concept")
+    target_doc_id: int | None = Field(None, description="Document ID for target concept")
+    
+    weight: Probability = Field(..., description="Dependency strength")
+    reasoning: str = Field(..., description="Why source is needed for target")
+
+
+def _same_as_created(data: Dict[str, Any]) -> datetime:
+    """Default updated_at to the (validated) created_at instead of a second clock read."""
+    return data["created_at"]
+
+
+class ConceptChunkIndex(BaseModel):
+    """
+    Concept -> chunk index mapping in CSR layout.
+
+    Chunk ids for ``names[i]`` are ``chunk_ids[offsets[i]:offsets[i + 1]]``,
+    so the whole mapping is three flat lists instead of one list per concept.
+    """
+
+    names: List[str] = Field(default_factory=list, description="Concept names in insertion order")
+    offsets: List[int] = Field(default_factory=lambda: [0], description="Row offsets into chunk_ids (len(names) + 1)")
+    chunk_ids: List[int] = Field(default_factory=list, description="Flattened chunk indices")
+
+    _positions: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._positions = {name: i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def from_dict(cls, mapping: Dict[str, List[int]]) -> "ConceptChunkIndex":
+        """Pack a concept_mappings dict into CSR form."""
+        names: List[str] = []
+        offsets = [0]
+        chunk_ids: List[int] = []
+        for name, indices in mapping.items():
+            names.append(name)
+            chunk_ids.extend(indices)
+            offsets.append(len(chunk_ids))
+        return cls(names=names, offsets=offsets, chunk_ids=chunk_ids)
+
+    def to_dict(self) -> Dict[str, List[int]]:
+        """Unpack back to the concept_mappings dict shape."""
+        return {
+            name: self.chunk_ids[self.offsets[i]:self.offsets[i + 1]]
+            for i, name in enumerate(self.names)
+        }
+
+    def span(self, name: str) -> slice | None:
+        """Slice of chunk_ids belonging to ``name``, or None if unknown."""
+        i = self._positions.get(name)
+        if i is None:
+            return None
+        return slice(self.offsets[i], self.offsets[i + 1])
+
+    def get(self, name: str, default: List[int] | None = None) -> List[int] | None:
+        """Dict-style lookup of the chunk ids for ``name``."""
+        row = self.span(name)
+        if row is None:
+            return default
+        return self.chunk_ids[row]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class GraphSchema(BaseModel):
+    """Schema for extracted knowledge graph structure."""
+    
+    concepts: List[str] = Field(..., description="List of extracted concepts")
+    prerequisites: List[PrerequisiteLink] = Field(..., description="Concept dependencies")
+    concept_mappings: Dict[str, List[int]] = Field(default_factory=dict, description="Mapping of concept name to list of chunk indices (0-based within the processed context)")
+    document_id: int | None = Field(None, description="Document ID for scoping")
+
+    def chunk_index(self) -> ConceptChunkIndex:
+        """Concept mappings packed as a ConceptChunkIndex."""
+        return ConceptChunkIndex.from_dict(self.concept_mappings)
+
+
+class DocumentScopedConcept(BaseModel):
+    """Represents a concept scoped to a specific document."""
+    
+    scoped_id: str = Field(..., description="Unique scoped ID: doc{_id}_{concept_name}")
+    document_id: int = Field(..., description="Parent document ID")
+    global_name: str = Field(..., description="Human-readable concept name (original case)")
+    normalized_name: str = Field(..., description="Normalized name for searching")
+    description: str | None = Field(None, description="Concept description")
+    depth_level: DepthLevel | None = Field(None, description="Depth in prerequisite hierarchy")
+    chunk_ids: List[int] = Field(default_factory=list, description="Chunk indices where concept appears")
+    is_merged: bool = Field(False, description="Whether this concept is merged with others")
+    merged_with: Dict[str, str] | None = Field(None, description="Mapping of doc_id -> scoped_id for merged concepts")
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=_same_as_created)
+
+    # Concepts are read-only once built; DocumentGraph can hold thousands
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def from_record(cls, document_id: int, record: Dict[str, Any]) -> "DocumentScopedConcept":
+        """
+        Build from a DocumentConcept row as returned by get_document_graph.
+
+        Rows were validated when they were written, so validation is skipped.
+        """
+        return cls.model_construct(
+            scoped_id=record["scoped_id"],
+            document_id=document_id,
+            global_name=record["name"],
+            normalized_name=record["normalized"],
+            description=record.get("description"),
+            depth_level=record.get("depth_level"),
+            chunk_ids=record.get("chunk_ids") or [],
+            is_merged=bool(record.get("is_merged")),
+        )
+
+    @classmethod
+    def from_external(cls, data: Dict[str, Any]) -> "DocumentScopedConcept":
+        """Validate LLM- or client-produced data through the shared adapter."""
+        return _DSC_ADAPTER.validate_python(data)
+
+
+_DSC_ADAPTER = TypeAdapter(DocumentScopedConcept)
+
+
+class CrossDocumentConcept(BaseModel):
+    """Represents a concept that spans multiple documents."""
+    
+    global_id: str = Field(..., description="Global concept identifier")
+    global_name: str = Field(..., description="Canonical concept name")
+    document_scoped_ids: FrozenSet[str] = Field(..., description="All scoped IDs from different documents")
+    similarity_score: Probability = Field(..., description="Similarity between occurrences")
+    merged: bool = Field(False, description="Whether documents agree this is the same concept")
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class DocumentGraph(BaseModel):
+    """Represents a document's complete knowledge graph."""
+    
+    document_id: int
+    document_name: str
+    concepts: List[DocumentScopedConcept]
+    relationships: List[PrerequisiteLink]
+    global_connections: List[CrossDocumentConcept] = Field(default_factory=list, description="Concepts that connect to other documents")
+    node_count: int
+    relationship_count: int
+
+
+class GlobalConceptIndex(BaseModel):
+    """Global semantic index for cross-document concept discovery."""
+    
+    global_id: str = Field(..., description="Global concept identifier")
+    global_name: str = Field(..., description="Canonical name")
+    document_ids: FrozenSet[int] = Field(..., description="All documents containing this concept")
+    occurrence_count: int
+    avg_depth: float
+    embedding: bytes | None = Field(None, description="Semantic embedding packed as float16 bytes")
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=_same_as_created)
+
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
+    @staticmethod
+    def pack_embedding(vector: Iterable[float]) -> bytes:
+        """Quantize an embedding to float16 and pack it for storage."""
+        return np.asarray(vector, dtype=np.float16).tobytes()
+
+    @property
+    def vector(self) -> np.ndarray | None:
+        """Zero-copy float16 view over the packed embedding."""
+        if self.embedding is None:
+            return None
+        return np.frombuffer(self.embedding, dtype=np.float16)
+
+
+def embedding_matrix(entries: Iterable[GlobalConceptIndex]) -> np.ndarray:
+    """
+    Stack packed embeddings into a single (n, dim) float32 matrix.
+
+    Build this once per similarity pass so cosine scores come from one
+    matrix product instead of per-pair Python loops. Entries without an
+    embedding are skipped.
+    """
+    vectors = [np.frombuffer(entry.embedding, dtype=np.float16) for entry in entries if entry.embedding is not None]
+    if not vectors:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.stack(vectors).astype(np.float32)
+
+
+class UserState(BaseModel):
+    """Represents current user progress and available options."""
+    
+    user_id: str
+    completed_concepts: List[str]
+    in_progress_concepts: List[str]
+    available_concepts: List[str]
+
+
+@dataclass(slots=True, frozen=True)
+class ConceptNode:
+    """
+    Represents a concept node in the knowledge graph.
+
+    Internal-only (built from already-validated GraphSchema concepts), so a
+    plain slotted dataclass is used instead of a validating model.
+    """
+
+    name: str  # Unique concept name (lowercase)
+    description: str | None = None
+    depth_level: int | None = None  # Depth in prerequisite hierarchy
+
+
+@dataclass(slots=True, frozen=True)
+class UserNode:
+    """Represents a user node in the knowledge graph (internal-only)."""
+
+    uid: str  # Unique user identifier
+    name: str  # User display name
+
+
+class LearningChunk(BaseModel):
+    """Represents a content chunk stored in the vector database."""
+    
+    id: int | None = Field(None, description="Database ID")
+    doc_source: str = Field(..., description="Source filename or URL")
+    content: str = Field(..., description="Markdown text chunk")
+    concept_tag: str = Field(..., description="Associated concept name")
+    created_at: datetime | None = Field(None, description="Creation timestamp")
+
+
+class LearningPath(BaseModel):
+    """Represents a resolved learning path with time estimates."""
+    
+    concepts: List[str] = Field(..., description="Ordered list of concepts to learn")
+    estimated_time_minutes: int = Field(..., description="Total estimated learning time")
+    target_concept: str = Field(..., description="Final concept to reach")
+    pruned: bool = Field(False, description="Whether path was pruned due to time constraints")
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class DocumentMetadata(BaseModel):
+    """Metadata for an ingested document."""
+    
+    id: int = Field(..., description="Database ID")
+    filename: str = Field(..., description="Original filename")
+    upload_date: datetime = Field(..., description="Upload timestamp")
+    status: str = Field("pending", description="Processing status")
+    file_path: str | None = Field(None, description="Local storage path")
+
+
+# ========== Navigation/AI Schemas ==========
+
+class PathRequest(BaseModel):
+    """Request for generating a learning path."""
+    user_id: str
+    target_concept: str
+    time_budget_minutes: int = 60
+    document_id: int | None = None
+
+
+class ProgressUpdate(BaseModel):
+    """Request for updating concept progress."""
+    user_id: str
+    concept_name: str
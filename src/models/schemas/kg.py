@@ -0,0 +1,102 @@
+"""Saved knowledge-graph API schemas."""
+
+from datetime import datetime
+from typing import Any, Dict, List, TypedDict
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.models.schemas.common import Probability, JsonObject, JsonObjectList, LLMConfig
+
+
+# ========== Knowledge Graph Schemas ==========
+
+class KnowledgeGraphBase(BaseModel):
+    name: str
+    description: str | None = None
+
+
+class KnowledgeGraphCreate(KnowledgeGraphBase):
+    user_id: str = "default_user"
+    document_ids: List[int] = Field(default_factory=list)
+    llm_config: LLMConfig | None = None
+    extraction_max_chars: int | None = None
+    chunk_size: int | None = None
+
+
+class KnowledgeGraphUpdate(BaseModel):
+    name: str | None = None
+    description: str | None = None
+    document_ids: List[int] | None = None
+    llm_config: LLMConfig | None = None
+    extraction_max_chars: int | None = None
+    chunk_size: int | None = None
+
+
+class KnowledgeGraphResponse(KnowledgeGraphBase):
+    id: str
+    user_id: str
+    status: str
+    node_count: int
+    relationship_count: int
+    created_at: datetime
+    updated_at: datetime
+    last_built_at: datetime | None = None
+    document_ids: List[int] = Field(default_factory=list)
+    llm_config: LLMConfig | None = None
+    error_message: str | None = None
+    build_progress: float | None = None
+    build_stage: str | None = None
+    extraction_max_chars: int | None = None
+    chunk_size: int | None = None
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class KnowledgeGraphBuildRequest(BaseModel):
+    build_mode: str = Field(..., description="existing or rebuild")
+    llm_config: LLMConfig | None = None
+    source_mode: str = Field("filtered", description="filtered or raw")
+    extraction_max_chars: int | None = Field(None, description="Max chars per LLM extraction window")
+    chunk_size: int | None = Field(None, description="Chunk size for document splitting")
+
+
+class KnowledgeGraphConnectionSuggestion(BaseModel):
+    from_scoped_id: str
+    to_scoped_id: str
+    confidence: Probability
+    rationale: str | None = None
+
+
+class KnowledgeGraphConnectionRequest(BaseModel):
+    target_graph_id: str
+    context: str
+    connections: List[KnowledgeGraphConnectionSuggestion]
+    method: str = "llm"
+
+
+class KnowledgeGraphSuggestionRequest(BaseModel):
+    target_graph_id: str
+    context: str
+    max_links: int = 20
+    llm_config: LLMConfig | None = None
+
+
+class KnowledgeGraphDataResponse(BaseModel):
+    graph_id: str
+    nodes: JsonObjectList
+    links: JsonObjectList
+    node_count: int
+    relationship_count: int
+    graph_meta: JsonObject
+
+    model_config = ConfigDict(frozen=True)
+
+
+class KnowledgeGraphData(TypedDict):
+    """Plain-dict mirror of KnowledgeGraphDataResponse, encoded without building the model."""
+    graph_id: str
+    nodes: List[Dict[str, Any]]
+    links: List[Dict[str, Any]]
+    node_count: int
+    relationship_count: int
+    graph_meta: Dict[str, Any]
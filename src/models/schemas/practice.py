@@ -0,0 +1,92 @@
+"""Practice-session API schemas."""
+
+from datetime import datetime
+from typing import ClassVar, Dict, List
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.models.enums import SessionMode
+from src.models.schemas.common import Rating0_5, Rating1_5, JsonObject, EpochMs
+
+
+# ========== Practice Schemas ==========
+
+class PracticeSessionCreate(BaseModel):
+    mode: SessionMode = SessionMode.FOCUS
+    goal_id: str | None = None
+    curriculum_id: str | None = None
+    duration_minutes: int | None = Field(None, ge=5, le=180)
+    concept_filters: List[str] | None = None
+
+    # validate_default so the default reaches the engine/DB as a plain "focus" too
+    model_config = ConfigDict(use_enum_values=True, validate_default=True)
+
+
+class PracticeSessionItem(BaseModel):
+    id: str
+    item_type: str
+    prompt: str
+    expected_answer: str | None = None
+    source_id: str | None = None
+    metadata_json: JsonObject | None = None
+
+    _TRUSTED: ClassVar[bool] = True
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PracticeSessionStartResponse(BaseModel):
+    session_id: str
+    target_duration_minutes: int
+    items: List[PracticeSessionItem]
+    source_mix: Dict[str, int] = Field(default_factory=dict)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class PracticeItemSubmit(BaseModel):
+    item_id: str
+    response_text: str | None = None
+    rating: Rating0_5 | None = None
+    time_taken: int | None = None
+
+
+class PracticeItemResult(BaseModel):
+    score: float
+    feedback: str | None = None
+    next_review: datetime | None = None
+
+
+class PracticeSessionEnd(BaseModel):
+    reflection: str | None = None
+    effectiveness_rating: Rating1_5 | None = None
+
+
+class PracticeSessionSummary(BaseModel):
+    session_id: str
+    start_time: datetime
+    end_time: datetime | None = None
+    mode: str
+    target_duration_minutes: int
+    items_completed: int
+    average_score: float
+    total_time_seconds: int
+    reflection: str | None = None
+    effectiveness_rating: int | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PracticeHistoryItem(BaseModel):
+    session_id: str
+    start_time: EpochMs
+    end_time: EpochMs | None = None
+    mode: str
+    items_completed: int
+    average_score: float
+
+
+class PracticeHistoryResponse(BaseModel):
+    items: List[PracticeHistoryItem]
+
+    model_config = ConfigDict(frozen=True)
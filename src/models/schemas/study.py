@@ -0,0 +1,113 @@
+"""Flashcard, SRS and study-session API schemas."""
+
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from src.models.enums import CardType
+from src.models.schemas.common import Rating0_5, Rating1_5, StudyType
+
+
+# ========== Flashcard Schemas ==========
+
+class FlashcardBase(BaseModel):
+    """Base schema for flashcard data."""
+    front: str
+    back: str
+    card_type: CardType = CardType.BASIC
+    tags: List[str] = Field(default_factory=list)
+
+
+class FlashcardCreate(FlashcardBase):
+    """Schema for creating a new flashcard."""
+    document_id: int | None = None
+
+
+class FlashcardUpdate(BaseModel):
+    """Schema for updating an existing flashcard."""
+    front: str | None = None
+    back: str | None = None
+    tags: List[str] | None = None
+
+
+class SRSState(BaseModel):
+    """Spaced-repetition scheduling state of a flashcard, read and written as a unit."""
+    ease_factor: float
+    interval: int
+    repetitions: int
+    next_review: datetime
+    last_review: datetime | None = None
+
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+
+class FlashcardResponse(FlashcardBase):
+    """Schema for flashcard API responses, including SRS data."""
+    id: str
+    document_id: int | None
+    created_at: datetime
+    # SRS fields stay flat on the wire; the UI reads them directly
+    ease_factor: float
+    interval: int
+    repetitions: int
+    next_review: datetime
+    last_review: datetime | None
+
+    # Not _TRUSTED: card_type is a free String column and tags a nullable JSON
+    # column, so legacy rows must go through validation.
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    @property
+    def srs(self) -> SRSState:
+        """The SRS fields of this card as one SRSState (already validated)."""
+        return SRSState.model_construct(
+            ease_factor=self.ease_factor,
+            interval=self.interval,
+            repetitions=self.repetitions,
+            next_review=self.next_review,
+            last_review=self.last_review,
+        )
+
+
+# ========== Study Schemas ==========
+
+class StudyReviewCreate(BaseModel):
+    """Schema for submitting a card review."""
+    flashcard_id: str
+    rating: Rating0_5
+    time_taken: int | None = None
+
+
+class StudySessionCreate(BaseModel):
+    """Schema for creating a new study session with a goal."""
+    goal: str | None = None
+    study_type: StudyType = "deep"
+    document_id: int | None = None
+
+class StudySessionEnd(BaseModel):
+    """Schema for ending a study session with reflection."""
+    reflection: str | None = None
+    effectiveness_rating: Rating1_5 | None = None
+
+class StudySessionResponse(BaseModel):
+    """Schema for study session statistics."""
+    id: str
+    start_time: datetime
+    end_time: datetime | None
+    cards_reviewed: int
+    new_cards: int
+    review_cards: int
+    average_rating: float | None
+    goal: str | None
+    study_type: str
+    reflection: str | None
+    effectiveness_rating: int | None
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ========== List Adapters ==========
+
+FlashcardListAdapter = TypeAdapter(List[FlashcardResponse])
+StudySessionListAdapter = TypeAdapter(List[StudySessionResponse])
@@ -4,13 +4,183 @@ Navigation Engine for LearnFast Core.
 Handles concept traversal, root concept identification, and prerequisite validation.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 
 from src.database.connections import neo4j_conn
+from src.database.graph_storage import normalize_name
 
 logger = logging.getLogger(__name__)
 
+# How long find_root_concepts(), get_full_graph() and document roots may serve
+# a cached result without an explicit invalidation.
+ROOTS_TTL_SECONDS = 60.0
+
+# Variable-length previews grow exponentially with depth on dense graphs, so
+# depth is clamped to [1, MAX_PREVIEW_DEPTH] and deep requests are logged.
+MAX_PREVIEW_DEPTH = 6
+_DEEP_PREVIEW_WARNING = 4
+
+
+def _clamp_depth(depth: int) -> int:
+    """Clamp a requested preview depth to the supported range."""
+    if depth > _DEEP_PREVIEW_WARNING:
+        logger.warning("Deep path preview requested (depth=%s, max=%s)", depth, MAX_PREVIEW_DEPTH)
+    return max(1, min(depth, MAX_PREVIEW_DEPTH))
+
+
+# Shapes a matched `target` into the graph viewer's nodes/edges payload on the
+# server. One undirected expansion is split by edge direction (no second Expand
+# and no prerequisites x dependents row product); a concept that is both a
+# prerequisite and a dependent is listed once, as a prerequisite. Plain Cypher
+# only (collect(DISTINCT ...) instead of APOC), so it runs on any Neo4j.
+_NEIGHBORHOOD_PAYLOAD = """
+    OPTIONAL MATCH (target)-[r:PREREQUISITE]-(other:Concept)
+    WITH key, target,
+         collect(CASE WHEN startNode(r) <> target THEN other.name END) AS prerequisites,
+         collect(CASE WHEN startNode(r) = target THEN other.name END) AS dependents,
+         collect(DISTINCT CASE WHEN startNode(r) <> target THEN other.name END) AS prerequisite_names,
+         collect(DISTINCT CASE WHEN startNode(r) = target THEN other.name END) AS dependent_names
+    RETURN
+        key,
+        [{id: target.name, group: 'target'}]
+        + [name IN prerequisite_names WHERE name <> target.name | {id: name, group: 'prerequisite'}]
+        + [name IN dependent_names WHERE name <> target.name AND NOT name IN prerequisites
+           | {id: name, group: 'dependent'}] AS nodes,
+        [name IN prerequisites | {source: name, target: target.name, type: 'prerequisite'}]
+        + [name IN dependents | {source: target.name, target: name, type: 'dependent'}] AS edges
+"""
+
+
+# Queries shared by the sync and async engine methods.
+
+# Concepts that have no incoming PREREQUISITE relationships
+_ROOTS_QUERY = """
+    MATCH (c:Concept)
+    WHERE NOT (c)<-[:PREREQUISITE]-()
+    RETURN c.name AS name
+    ORDER BY c.name
+"""
+
+# Match the user once, then keep concepts that are not completed and have no
+# uncompleted prerequisite. OPTIONAL MATCH keeps root concepts visible for
+# users that have no User node yet.
+_UNLOCKED_QUERY = """
+    OPTIONAL MATCH (u:User {uid: $user_id})
+    WITH u
+    MATCH (c:Concept)
+    WHERE NOT EXISTS { MATCH (u)-[:COMPLETED]->(c) }
+    AND NOT EXISTS {
+        MATCH (p:Concept)-[:PREREQUISITE]->(c)
+        WHERE NOT EXISTS { MATCH (u)-[:COMPLETED]->(p) }
+    }
+    RETURN c.name AS name
+    ORDER BY c.name
+"""
+
+# One row per concept with the user's status, degrees and how many immediate
+# prerequisites the user has completed
+_FULL_GRAPH_NODES_QUERY = """
+    OPTIONAL MATCH (u:User {uid: $user_id})
+    WITH u
+    MATCH (c:Concept)
+    WITH u, c,
+         CASE WHEN u IS NULL THEN [] ELSE [(u)-[r:COMPLETED|IN_PROGRESS]->(c) | type(r)] END AS statuses,
+         [(p:Concept)-[:PREREQUISITE]->(c) | p] AS prereqs
+    RETURN
+        c.name AS name,
+        c.description AS description,
+        CASE
+            WHEN 'COMPLETED' IN statuses THEN 'COMPLETED'
+            WHEN 'IN_PROGRESS' IN statuses THEN 'IN_PROGRESS'
+        END AS status,
+        size(prereqs) AS in_degree,
+        COUNT { (c)-[:PREREQUISITE]->(:Concept) } AS out_degree,
+        CASE WHEN u IS NULL THEN 0
+             ELSE size([p IN prereqs WHERE (u)-[:COMPLETED]->(p)]) END AS completed_prereqs
+"""
+
+_FULL_GRAPH_LINKS_QUERY = """
+    MATCH (s:Concept)-[r:PREREQUISITE]->(t:Concept)
+    RETURN s.name as source, t.name as target, type(r) as type
+"""
+
+
+def _full_graph_nodes(nodes_result: Iterable) -> List[Dict[str, Any]]:
+    """Build the graph viewer's nodes from full-graph node rows, consuming them one at a time."""
+    # COMPLETED / IN_PROGRESS are kept; otherwise a concept is UNLOCKED
+    # when every immediate prerequisite (possibly none) is completed
+    nodes = []
+    for record in nodes_result:
+        name = record["name"]
+        if not name:
+            continue
+
+        status = record["status"]
+        if not status:
+            status = "UNLOCKED" if record["completed_prereqs"] == record["in_degree"] else "LOCKED"
+
+        nodes.append({
+            "id": name,
+            "name": name,
+            "description": record["description"] or "",
+            "status": status,
+            # Dynamic sizing based on connectivity (degree)
+            "val": 10 + (record["in_degree"] + record["out_degree"]) * 2
+        })
+    return nodes
+
+
+def _full_graph_links(links_result: Iterable) -> List[Dict[str, Any]]:
+    """Build the graph viewer's links from full-graph link rows, consuming them one at a time."""
+    return [
+        {"source": record["source"], "target": record["target"], "relationship": record["type"]}
+        for record in links_result
+        if record["source"] and record["target"]
+    ]
+
+
+def _copy_graph(graph: Dict[str, Any]) -> Dict[str, Any]:
+    """Give callers their own nodes/links lists, never the cached ones."""
+    return {"nodes": list(graph["nodes"]), "links": list(graph["links"])}
+
+
+class _GraphCache:
+    """
+    Small bounded TTL cache whose entries also expire when the graph version moves on.
+
+    Evicts the oldest entry once maxsize is reached.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = ROOTS_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Any, Tuple[int, float, Any]] = {}
+
+    def get(self, key: Any, version: int) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry and entry[0] == version and entry[1] > time.monotonic():
+            return entry[2]
+        return None
+
+    def put(self, key: Any, version: int, value: Any) -> None:
+        # Skip the store if the graph changed while the query was in flight
+        if version != NavigationEngine._graph_version:
+            return
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (version, time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Any) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
 
 class NavigationEngine:
     """
@@ -19,32 +189,89 @@ class NavigationEngine:
     Provides methods to find root concepts, preview learning paths,
     and validate prerequisites for concept unlocking.
     """
+
+    # Shared by every engine instance: (graph_version, expires_at, roots).
+    # Roots only change when PREREQUISITE edges are added or removed.
+    _graph_version: int = 0
+    _roots_cache: Optional[Tuple[int, float, List[str]]] = None
+    # Per-user full graphs keyed by (user_id, progress generation); a read
+    # that overlaps invalidate_progress(user_id) stores under the old
+    # generation, where no later read looks
+    _full_graph_cache = _GraphCache()
+    _progress_versions: Dict[str, int] = {}
+    # Neighborhood payloads keyed by normalized concept name
+    _neighborhood_cache = _GraphCache(maxsize=1024)
+    _INSTANCE: Optional["NavigationEngine"] = None
     
     def __init__(self):
         """Initialize the navigation engine."""
         self.connection = neo4j_conn
-        
+
+    @classmethod
+    def instance(cls) -> "NavigationEngine":
+        """Return the process-wide engine, creating it on first use."""
+        if cls._INSTANCE is None:
+            cls._INSTANCE = cls()
+        return cls._INSTANCE
+
+    def _read(self, query: str, parameters: Optional[dict] = None) -> list:
+        """Run a read-only query through the driver's retrying read transaction."""
+        return self.connection.execute_read(query, parameters)
+
+    @classmethod
+    def invalidate_roots(cls) -> None:
+        """Drop cached roots, neighborhoods and full graphs; call after PREREQUISITE edges change."""
+        cls._graph_version += 1
+        cls._roots_cache = None
+        cls._full_graph_cache.clear()
+        cls._neighborhood_cache.clear()
+
+    @classmethod
+    def invalidate_progress(cls, user_id: str) -> None:
+        """Drop the user's cached full graph; call after their progress changes."""
+        key = cls._full_graph_key(user_id)
+        cls._progress_versions[key[0]] = key[1] + 1
+        cls._full_graph_cache.pop(key)
+
+    @classmethod
+    def _full_graph_key(cls, user_id: str) -> Tuple[str, int]:
+        user_id = user_id or "default_user"
+        return user_id, cls._progress_versions.get(user_id, 0)
+
+    @staticmethod
+    def _cached_roots(version: int) -> Optional[List[str]]:
+        cached = NavigationEngine._roots_cache
+        if cached and cached[0] == version and cached[1] > time.monotonic():
+            return list(cached[2])
+        return None
+
+    @staticmethod
+    def _store_roots(version: int, roots: List[str]) -> None:
+        # Skip the store if invalidate_roots() ran while the query was in flight
+        if version == NavigationEngine._graph_version:
+            NavigationEngine._roots_cache = (version, time.monotonic() + ROOTS_TTL_SECONDS, roots)
+
     def find_root_concepts(self) -> List[str]:
         """
         Identify root concepts (concepts with no prerequisites).
+
+        Results are cached for ROOTS_TTL_SECONDS or until invalidate_roots().
         
         Returns:
             List of root concept names.
         """
+        version = NavigationEngine._graph_version
+        cached = self._cached_roots(version)
+        if cached is not None:
+            return cached
+
         try:
-            # Query for concepts that have no incoming PREREQUISITE relationships
-            query = """
-                MATCH (c:Concept)
-                WHERE NOT ()-[:PREREQUISITE]->(c)
-                RETURN c.name as name
-                ORDER BY c.name
-            """
-            
-            result = self.connection.execute_query(query)
-            return [record["name"] for record in result]
+            roots = list(self.connection.execute_stream(_ROOTS_QUERY, fetch="values"))
+            self._store_roots(version, roots)
+            return list(roots)
             
         except Exception as e:
-            logger.error(f"Error finding root concepts: {str(e)}")
+            logger.error("Error finding root concepts: %s", e)
             return []
             
     def get_path_preview(self, root_concept: str, depth: int = 3) -> List[str]:
@@ -61,33 +288,128 @@ class NavigationEngine:
         if not root_concept:
             return []
             
+        normalized_root = normalize_name(root_concept)
+        depth = _clamp_depth(depth)
+        
+        # Plain Cypher, so it runs without APOC. Variable-length bounds cannot
+        # be parameters; depth is a clamped int, so inlining it is safe.
+        # Grouping on c yields each concept once at its shortest hop distance,
+        # and only the name and hop count leave the server.
+        query = """
+            MATCH (root:Concept {name_key: $root_name})
+            USING INDEX root:Concept(name_key)
+            MATCH path = (root)-[:PREREQUISITE*0..%d]->(c:Concept)
+            WITH c, min(length(path)) AS hops
+            RETURN c.name AS name, hops
+            ORDER BY hops, name
+        """ % depth
+
+        try:
+            return list(self.connection.execute_stream(query, {"root_name": normalized_root}, fetch="values"))
+        except Exception as e:
+            logger.error("Error getting path preview for '%s': %s", root_concept, e)
+            return []
+
+    def get_all_path_previews(self, depth: int = 3) -> Dict[str, List[str]]:
+        """
+        Get the path preview of every root concept in one round-trip.
+
+        Prefer this over find_root_concepts() followed by get_path_preview()
+        per root, which costs one query per root.
+        
+        Args:
+            depth: Maximum depth to traverse from each root (default 3)
+            
+        Returns:
+            Dict mapping each root concept name to its preview (see get_path_preview),
+            ordered by root name
+        """
+        depth = _clamp_depth(depth)
+        
+        # Same expansion as get_path_preview, run once per root; rows are
+        # ordered before collect() so each preview keeps breadth-first order
+        query = """
+            MATCH (root:Concept)
+            WHERE NOT (root)<-[:PREREQUISITE]-()
+            MATCH path = (root)-[:PREREQUISITE*0..%d]->(c:Concept)
+            WITH root, c, min(length(path)) AS hops
+            ORDER BY hops, c.name
+            WITH root, collect(c.name) AS concepts
+            RETURN root.name AS root, concepts
+            ORDER BY root
+        """ % depth
+
         try:
-            normalized_root = root_concept.strip().lower()
+            result = self._read(query)
+        except Exception as e:
+            logger.error("Error getting path previews for all roots: %s", e)
+            return {}
+
+        return {r["root"]: r["concepts"] for r in result}
             
-            # Use variable-length path matching up to specified depth
-            query = """
-                MATCH path = (root:Concept {name: $root_name})-[:PREREQUISITE*0..%d]->(c:Concept)
-                RETURN c.name as name
-                ORDER BY length(path), c.name
-            """ % depth
-            
-            result = self.connection.execute_query(query, {"root_name": normalized_root})
-            
-            # Return unique concept names in order of appearance
-            seen = set()
-            path = []
-            for record in result:
-                name = record["name"]
-                if name not in seen:
-                    path.append(name)
-                    seen.add(name)
-                    
-            return path
+    def get_path_preview_between(self, root_concept: str, target_concept: str, depth: int = 3) -> List[str]:
+        """
+        Get the concepts on prerequisite chains from a root to a target concept.
+        
+        Expands forward from the root and backward from the target in one
+        query, then keeps the nodes where the two BFS distances meet within
+        depth, instead of enumerating every root-to-target path.
+        
+        Args:
+            root_concept: Name of the starting concept
+            target_concept: Name of the concept to reach
+            depth: Maximum chain length (clamped to MAX_PREVIEW_DEPTH)
             
+        Returns:
+            Concept names ordered by distance from the root
+        """
+        if not root_concept or not target_concept:
+            return []
+            
+        depth = _clamp_depth(depth)
+        # Each side keeps one row per concept at its shortest distance, as in
+        # get_path_preview()
+        query = """
+            MATCH (root:Concept {name_key: $root_name})
+            USING INDEX root:Concept(name_key)
+            CALL {
+                WITH root
+                MATCH path = (root)-[:PREREQUISITE*0..%(depth)d]->(c:Concept)
+                WITH c, min(length(path)) AS hops
+                RETURN collect([c.name, hops]) AS forward
+            }
+            WITH forward
+            MATCH (target:Concept {name_key: $target_name})
+            USING INDEX target:Concept(name_key)
+            CALL {
+                WITH target
+                MATCH path = (target)<-[:PREREQUISITE*0..%(depth)d]-(c:Concept)
+                WITH c, min(length(path)) AS hops
+                RETURN collect([c.name, hops]) AS backward
+            }
+            RETURN forward, backward
+        """ % {"depth": depth}
+
+        try:
+            result = self._read(query, {
+                "root_name": normalize_name(root_concept),
+                "target_name": normalize_name(target_concept)
+            })
         except Exception as e:
-            logger.error(f"Error getting path preview for '{root_concept}': {str(e)}")
+            logger.error("Error getting path preview from '%s' to '%s': %s", root_concept, target_concept, e)
+            return []
+
+        if not result:
             return []
             
+        from_root = dict(result[0]["forward"])
+        to_target = dict(result[0]["backward"])
+        on_path = [
+            name for name, hops in from_root.items()
+            if name in to_target and hops + to_target[name] <= depth
+        ]
+        return sorted(on_path, key=lambda name: (from_root[name], name))
+            
     def validate_prerequisites(self, user_id: str, concept: str) -> bool:
         """
         Validate if a user has completed all prerequisites for a specific concept.
@@ -99,38 +421,52 @@ class NavigationEngine:
         Returns:
             True if all prerequisites are completed or if there are no prerequisites.
         """
-        if not user_id or not concept:
+        if not concept:
             return False
+        return self.validate_prerequisites_batch(user_id, [concept])[concept]
+
+    def validate_prerequisites_batch(self, user_id: str, concepts: List[str]) -> Dict[str, bool]:
+        """
+        Validate prerequisites for several concepts in one round-trip.
+        
+        Args:
+            user_id: Unique user identifier
+            concepts: Target concept names
             
+        Returns:
+            Dict mapping each given concept name to True if all of its immediate
+            prerequisites are completed (or it has none).
+        """
+        if not user_id:
+            return {concept: False for concept in concepts}
+
+        normalized = {concept: normalize_name(concept) for concept in concepts if concept}
+        if not normalized:
+            return {concept: False for concept in concepts}
+            
+        # Only concepts with at least one uncompleted immediate prerequisite
+        # produce a row; everything else is unlocked.
+        query = """
+            UNWIND $concept_names AS cname
+            MATCH (prereq:Concept)-[:PREREQUISITE]->(target:Concept {name_key: cname})
+            USING INDEX target:Concept(name_key)
+            WHERE NOT EXISTS {
+                MATCH (:User {uid: $user_id})-[:COMPLETED]->(prereq)
+            }
+            RETURN cname, count(prereq) AS missing_prerequisites
+        """
+
         try:
-            normalized_concept = concept.strip().lower()
-            
-            # Check if there are any prerequisites that the user hasn't completed
-            # We look for immediate prerequisites of the target concept
-            # And check if there is NOT a COMPLETED relationship from the user to that prerequisite
-            query = """
-                MATCH (target:Concept {name: $concept_name})
-                OPTIONAL MATCH (prereq:Concept)-[:PREREQUISITE]->(target)
-                WHERE NOT EXISTS {
-                    MATCH (:User {uid: $user_id})-[:COMPLETED]->(prereq)
-                }
-                RETURN count(prereq) as missing_prerequisites
-            """
-            
-            result = self.connection.execute_query(query, {
-                "user_id": user_id, 
-                "concept_name": normalized_concept
+            result = self._read(query, {
+                "user_id": user_id,
+                "concept_names": list(set(normalized.values()))
             })
-            
-            if not result:
-                return False
-                
-            missing_count = result[0]["missing_prerequisites"]
-            return missing_count == 0
-            
         except Exception as e:
-            logger.error(f"Error validating prerequisites for user '{user_id}' and concept '{concept}': {str(e)}")
-            return False
+            logger.error("Error validating prerequisites for user '%s': %s", user_id, e)
+            return {concept: False for concept in concepts}
+
+        blocked = {record["cname"] for record in result if record["missing_prerequisites"]}
+        return {concept: bool(concept) and normalized[concept] not in blocked for concept in concepts}
 
     def get_unlocked_concepts(self, user_id: str) -> List[str]:
         """
@@ -151,34 +487,18 @@ class NavigationEngine:
             return []
             
         try:
-            # Find concepts where:
-            # 1. User hasn't completed/started it yet (optional - maybe we want to show started ones too? 
-            #    Spec says "available learning paths", usually implies new things to learn or continue.
-            #    Let's interpret unlocked as "ready to start".
-            
-            query = """
-                MATCH (c:Concept)
-                WHERE NOT EXISTS {
-                    MATCH (:User {uid: $user_id})-[:COMPLETED]->(c)
-                }
-                AND ALL(prereq IN [(p:Concept)-[:PREREQUISITE]->(c) | p] 
-                        WHERE EXISTS {
-                            MATCH (:User {uid: $user_id})-[:COMPLETED]->(prereq)
-                        })
-                RETURN c.name as name
-                ORDER BY c.name
-            """
-            
-            result = self.connection.execute_query(query, {"user_id": user_id})
-            return [record["name"] for record in result]
+            return list(self.connection.execute_stream(_UNLOCKED_QUERY, {"user_id": user_id}, fetch="values"))
             
         except Exception as e:
-            logger.error(f"Error getting unlocked concepts for user '{user_id}': {str(e)}")
+            logger.error("Error getting unlocked concepts for user '%s': %s", user_id, e)
             return []
 
     def get_neighborhood(self, concept_name: str) -> Dict[str, Any]:
         """
         Get immediate prerequisites and dependents of a concept.
+
+        Results are cached like find_root_concepts(), so repeated viewer
+        requests skip Neo4j for up to ROOTS_TTL_SECONDS.
         
         Args:
             concept_name: Name of the concept
@@ -189,50 +509,60 @@ class NavigationEngine:
         if not concept_name:
             return {"nodes": [], "edges": []}
             
-        try:
-            normalized_name = concept_name.strip().lower()
-            
-            # Query for immediate neighbors (in and out)
+        normalized_name = normalize_name(concept_name)
+        version = NavigationEngine._graph_version
+        cached = self._neighborhood_cache.get(normalized_name, version)
+        if cached is None:
             query = """
-                MATCH (target:Concept {name: $name})
-                OPTIONAL MATCH (pre:Concept)-[r1:PREREQUISITE]->(target)
-                OPTIONAL MATCH (target)-[r2:PREREQUISITE]->(post:Concept)
-                RETURN 
-                    target.name as target_name,
-                    collect(DISTINCT {name: pre.name, type: 'prerequisite'}) as prerequisites,
-                    collect(DISTINCT {name: post.name, type: 'dependent'}) as dependents
-            """
-            
-            result = self.connection.execute_query(query, {"name": normalized_name})
-            
-            if not result:
+                MATCH (target:Concept {name_key: $name})
+                USING INDEX target:Concept(name_key)
+                WITH $name AS key, target
+            """ + _NEIGHBORHOOD_PAYLOAD
+
+            try:
+                result = self._read(query, {"name": normalized_name})
+            except Exception as e:
+                logger.error("Error getting neighborhood for '%s': %s", concept_name, e)
                 return {"nodes": [], "edges": []}
-                
-            data = result[0]
-            nodes = [{"id": data["target_name"], "group": "target"}]
-            edges = []
-            
-            seen_nodes = {data["target_name"]}
-            
-            for p in data["prerequisites"]:
-                if p["name"]:
-                    if p["name"] not in seen_nodes:
-                        nodes.append({"id": p["name"], "group": "prerequisite"})
-                        seen_nodes.add(p["name"])
-                    edges.append({"source": p["name"], "target": data["target_name"], "type": "prerequisite"})
-                    
-            for d in data["dependents"]:
-                if d["name"]:
-                    if d["name"] not in seen_nodes:
-                        nodes.append({"id": d["name"], "group": "dependent"})
-                        seen_nodes.add(d["name"])
-                    edges.append({"source": data["target_name"], "target": d["name"], "type": "dependent"})
-                    
-            return {"nodes": nodes, "edges": edges}
+
+            cached = {"nodes": result[0]["nodes"], "edges": result[0]["edges"]} if result else {"nodes": [], "edges": []}
+            self._neighborhood_cache.put(normalized_name, version, cached)
+
+        # Callers get their own lists, never the cached ones
+        return {"nodes": list(cached["nodes"]), "edges": list(cached["edges"])}
+
+    def get_neighborhoods_batch(self, concept_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the neighborhoods of several concepts in one round-trip.
+        
+        Args:
+            concept_names: Names of the concepts
             
+        Returns:
+            Dict mapping each given name to its nodes/edges payload; unknown
+            concepts map to an empty payload.
+        """
+        normalized = {name: normalize_name(name) for name in concept_names if name}
+        if not normalized:
+            return {name: {"nodes": [], "edges": []} for name in concept_names}
+            
+        query = """
+            UNWIND $names AS key
+            MATCH (target:Concept {name_key: key})
+            USING INDEX target:Concept(name_key)
+        """ + _NEIGHBORHOOD_PAYLOAD
+
+        try:
+            result = self._read(query, {"names": list(set(normalized.values()))})
         except Exception as e:
-            logger.error(f"Error getting neighborhood for '{concept_name}': {str(e)}")
-            return {"nodes": [], "edges": []}
+            logger.error("Error getting neighborhoods for %s concepts: %s", len(normalized), e)
+            return {name: {"nodes": [], "edges": []} for name in concept_names}
+
+        by_key = {record["key"]: {"nodes": record["nodes"], "edges": record["edges"]} for record in result}
+        return {
+            name: by_key.get(normalized.get(name)) or {"nodes": [], "edges": []}
+            for name in concept_names
+        }
 
     def get_full_graph(self, user_id: str = None) -> Dict[str, Any]:
         """
@@ -244,121 +574,111 @@ class NavigationEngine:
         Returns:
             Dict containing nodes and links for the complete graph.
             Nodes will have a 'status' field: LOCKED, UNLOCKED, COMPLETED, IN_PROGRESS.
+            Cached per user like find_root_concepts(), and until invalidate_progress().
         """
+        user_id = user_id or "default_user"
+        version = NavigationEngine._graph_version
+        key = self._full_graph_key(user_id)
+        cached = self._full_graph_cache.get(key, version)
+        if cached is not None:
+            return _copy_graph(cached)
+
         try:
-            # Fetch all concepts with optional user status
-            nodes_query = """
-                MATCH (c:Concept)
-                OPTIONAL MATCH (:User {uid: $user_id})-[r_status:COMPLETED|IN_PROGRESS]->(c)
-                RETURN c.name as name, c.description as description, type(r_status) as status
-            """
-            
-            # Fetch all relationships
-            links_query = """
-                MATCH (s:Concept)-[r:PREREQUISITE]->(t:Concept)
-                RETURN s.name as source, t.name as target, type(r) as type
-            """
-            
-            nodes_result = self.connection.execute_query(nodes_query, {"user_id": user_id or "default_user"})
-            links_result = self.connection.execute_query(links_query)
-            
-            # 1. Normalization & Node Map Construction
-            # We map lower_case_name -> {canonical_name, data}
-            node_map = {}
-            
-            for record in nodes_result:
-                name = record["name"]
-                if not name: continue
-                
-                normalized = name.strip().lower()
-                status = record["status"] # COMPLETED, IN_PROGRESS, or None
-                
-                # If we encounter the same concept name (case-variant), prefer the one with status or longer description
-                # For now, simplistic first-wins or status-wins logic
-                if normalized not in node_map:
-                    node_map[normalized] = {
-                        "id": name, # Keep original casing of the first one found
-                        "name": name,
-                        "description": record["description"] or "",
-                        "status": status,
-                        "val": 10 # Default size
-                    }
-                else:
-                    # Update status if this variant has one and existing doesn't
-                    if status and not node_map[normalized]["status"]:
-                        node_map[normalized]["status"] = status
-                        
-            # 2. Build Adjacency List (for dependency checking)
-            # normalized_target -> set(normalized_sources)
-            dependencies = {n: set() for n in node_map}
-            
-            links = []
-            for record in links_result:
-                source = record["source"]
-                target = record["target"]
-                
-                if not source or not target: continue
-                
-                norm_source = source.strip().lower()
-                norm_target = target.strip().lower()
-                
-                # Only include link if both nodes exist in our cleaned map
-                if norm_source in node_map and norm_target in node_map:
-                    dependencies[norm_target].add(norm_source)
-                    
-                    # Use the canonical IDs from our node_map
-                    links.append({
-                        "source": node_map[norm_source]["id"],
-                        "target": node_map[norm_target]["id"],
-                        "relationship": record["type"]
-                    })
-                    
-            # 3. Calculate Status (LOCKED vs UNLOCKED)
-            # Logic:
-            # - If already COMPLETED or IN_PROGRESS -> Keep as is
-            # - If NO prerequisites -> UNLOCKED (Root)
-            # - If ALL prerequisites are COMPLETED -> UNLOCKED
-            # - Else -> LOCKED
-            
-            final_nodes = []
-            for norm_name, data in node_map.items():
-                current_status = data["status"]
-                
-                if current_status == "COMPLETED":
-                    final_status = "COMPLETED"
-                elif current_status == "IN_PROGRESS":
-                    final_status = "IN_PROGRESS"
-                else:
-                    # Check prerequisites
-                    prereqs = dependencies[norm_name]
-                    if not prereqs:
-                        final_status = "UNLOCKED" # Root concept
-                    else:
-                        all_met = True
-                        for p in prereqs:
-                            if node_map[p]["status"] != "COMPLETED":
-                                all_met = False
-                                break
-                        final_status = "UNLOCKED" if all_met else "LOCKED"
-                        
-                data["status"] = final_status
-                
-                # Dynamic sizing based on connectivity (degree)
-                degree = len([l for l in links if l["source"] == data["id"] or l["target"] == data["id"]])
-                data["val"] = 10 + (degree * 2)
-                
-                final_nodes.append(data)
-                
-            return {"nodes": final_nodes, "links": links}
+            # The two reads are independent and the driver releases the GIL
+            # during Bolt I/O, so overlap them instead of paying for both. Each
+            # worker streams its rows straight into the payload rather than
+            # materializing the record list first.
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                nodes_future = pool.submit(
+                    _full_graph_nodes, self.connection.execute_stream(_FULL_GRAPH_NODES_QUERY, {"user_id": user_id})
+                )
+                links_future = pool.submit(_full_graph_links, self.connection.execute_stream(_FULL_GRAPH_LINKS_QUERY))
+                graph = {"nodes": nodes_future.result(), "links": links_future.result()}
+            self._full_graph_cache.put(key, version, graph)
+            return _copy_graph(graph)
             
         except Exception as e:
-            logger.error(f"Error getting full graph: {str(e)}")
+            logger.error("Error getting full graph: %s", e)
+            return {"nodes": [], "links": []}
+
+    # ---- async variants ----
+    # Same queries and error handling as the sync methods above, run on the
+    # async driver so request handlers don't tie up a worker thread per query.
+
+    async def a_find_root_concepts(self) -> List[str]:
+        """Async find_root_concepts(); shares its cache."""
+        version = NavigationEngine._graph_version
+        cached = self._cached_roots(version)
+        if cached is not None:
+            return cached
+
+        try:
+            roots = await self.connection.execute_read_async(_ROOTS_QUERY, fetch="values")
+            self._store_roots(version, roots)
+            return list(roots)
+
+        except Exception as e:
+            logger.error("Error finding root concepts: %s", e)
+            return []
+
+    async def a_get_unlocked_concepts(self, user_id: str) -> List[str]:
+        """Async get_unlocked_concepts()."""
+        if not user_id:
+            return []
+
+        try:
+            return await self.connection.execute_read_async(_UNLOCKED_QUERY, {"user_id": user_id}, fetch="values")
+
+        except Exception as e:
+            logger.error("Error getting unlocked concepts for user '%s': %s", user_id, e)
+            return []
+
+    async def a_get_full_graph(self, user_id: str = None) -> Dict[str, Any]:
+        """Async get_full_graph(); shares its cache and runs the two queries concurrently."""
+        user_id = user_id or "default_user"
+        version = NavigationEngine._graph_version
+        key = self._full_graph_key(user_id)
+        cached = self._full_graph_cache.get(key, version)
+        if cached is not None:
+            return _copy_graph(cached)
+
+        try:
+            nodes_result, links_result = await asyncio.gather(
+                self.connection.execute_read_async(_FULL_GRAPH_NODES_QUERY, {"user_id": user_id}),
+                self.connection.execute_read_async(_FULL_GRAPH_LINKS_QUERY),
+            )
+            graph = {"nodes": _full_graph_nodes(nodes_result), "links": _full_graph_links(links_result)}
+            self._full_graph_cache.put(key, version, graph)
+            return _copy_graph(graph)
+
+        except Exception as e:
+            logger.error("Error getting full graph: %s", e)
             return {"nodes": [], "links": []}
 
 
 # ========== Multi-Document Navigation ==========
 
 
+def _document_neighborhood_payload(
+    target_id: str, target_name: str, prerequisites: List[Dict[str, Any]], dependents: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Shape a document concept's neighbors into nodes/edges, one node and edge per neighbor."""
+    nodes = [{"id": target_id, "name": target_name, "group": "target"}]
+    edges = []
+    seen = {target_id}
+    for group, neighbors in (("prerequisite", prerequisites), ("dependent", dependents)):
+        for neighbor in neighbors:
+            if neighbor["id"] in seen:
+                continue
+            seen.add(neighbor["id"])
+            nodes.append({"id": neighbor["id"], "name": neighbor["name"], "group": group})
+            if group == "prerequisite":
+                edges.append({"source": neighbor["id"], "target": target_id, "type": group})
+            else:
+                edges.append({"source": target_id, "target": neighbor["id"], "type": group})
+    return {"nodes": nodes, "edges": edges}
+
+
 class MultiDocNavigationEngine:
     """
     Handles navigation through document-specific knowledge graphs.
@@ -366,6 +686,9 @@ class MultiDocNavigationEngine:
     Provides methods to query concepts within a document's scope
     and discover cross-document connections.
     """
+
+    # Per-document roots, keyed by document ID; shares NavigationEngine's graph version
+    _roots_cache = _GraphCache()
     
     def __init__(self):
         self.connection = neo4j_conn
@@ -384,34 +707,54 @@ class MultiDocNavigationEngine:
         Returns:
             List of concept dictionaries with scoped_id, name, and metadata
         """
-        try:
-            query = """
-                MATCH (dc:DocumentConcept)
-                MATCH (d:Document {id: $doc_id})-[:CONTAINS]->(dc)
-                WHERE NOT ()-[:PREREQUISITE {document_id: $doc_id}]->(dc)
-                RETURN dc.id as scoped_id, dc.global_name as name,
-                       dc.normalized_name as normalized, dc.description,
-                       dc.depth_level, dc.chunk_ids
-                ORDER BY dc.global_name
-            """
-            
-            result = self.connection.execute_query(query, {"doc_id": document_id})
-            
-            return [
-                {
-                    "scoped_id": r["scoped_id"],
-                    "name": r["name"],
-                    "normalized": r["normalized"],
-                    "description": r["description"],
-                    "depth_level": r["depth_level"],
-                    "chunk_ids": r["chunk_ids"]
-                }
-                for r in result
-            ]
+        return self.get_document_root_concepts_batch([document_id])[document_id]
+
+    def get_document_root_concepts_batch(self, document_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Find the root concepts of several documents in one round-trip.
+        
+        Args:
+            document_ids: The documents to query
             
+        Returns:
+            Dict mapping each document ID to its root concepts (see
+            get_document_root_concepts), sorted by name. Cached per document
+            like find_root_concepts().
+        """
+        version = NavigationEngine._graph_version
+        roots: Dict[int, List[Dict[str, Any]]] = {}
+        for doc_id in document_ids:
+            cached = self._roots_cache.get(doc_id, version)
+            if cached is not None:
+                roots[doc_id] = list(cached)
+        missing = [doc_id for doc_id in dict.fromkeys(document_ids) if doc_id not in roots]
+        if not missing:
+            return roots
+        roots.update({doc_id: [] for doc_id in missing})
+            
+        query = """
+            UNWIND $doc_ids AS doc_id
+            MATCH (:Document {id: doc_id})-[:CONTAINS]->(dc:DocumentConcept)
+            WHERE NOT EXISTS { MATCH ()-[:PREREQUISITE {document_id: doc_id}]->(dc) }
+            WITH doc_id, dc
+            ORDER BY dc.global_name
+            RETURN doc_id, collect({
+                scoped_id: dc.id, name: dc.global_name, normalized: dc.normalized_name,
+                description: dc.description, depth_level: dc.depth_level, chunk_ids: dc.chunk_ids
+            }) AS roots
+        """
+
+        try:
+            result = self.connection.execute_query(query, {"doc_ids": missing})
         except Exception as e:
-            logger.error(f"Error getting document roots for doc {document_id}: {e}")
-            return []
+            logger.error("Error getting document roots for docs %s: %s", missing, e)
+            return {doc_id: [] for doc_id in document_ids}
+
+        for r in result:
+            roots[r["doc_id"]] = r["roots"]
+        for doc_id in missing:
+            self._roots_cache.put(doc_id, version, list(roots[doc_id]))
+        return {doc_id: roots[doc_id] for doc_id in document_ids}
     
     def get_document_path_preview(self, document_id: int, root_concept: str, depth: int = 3) -> List[str]:
         """
@@ -425,36 +768,31 @@ class MultiDocNavigationEngine:
         Returns:
             List of scoped concept names in order
         """
+        scoped_root = self.graph_storage.generate_scoped_id(document_id, root_concept)
+        depth = _clamp_depth(depth)
+        
+        # Variable-length bounds cannot be parameters; depth is a clamped int,
+        # so inlining it is safe. The document is matched once and reused, and
+        # grouping on c returns each concept once at its shortest distance.
+        query = """
+            MATCH (d:Document {id: $doc_id})-[:CONTAINS]->(root:DocumentConcept {id: $scoped_root})
+            MATCH path = (root)-[:PREREQUISITE*0..%d {document_id: $doc_id}]->(c:DocumentConcept)
+            WHERE (d)-[:CONTAINS]->(c)
+            WITH c, min(length(path)) AS hops
+            RETURN c.id as scoped_id, c.global_name as name
+            ORDER BY hops, c.global_name
+        """ % depth
+
         try:
-            normalized_root = root_concept.strip().lower()
-            scoped_root = self.graph_storage.generate_scoped_id(document_id, root_concept)
-            
-            query = """
-                MATCH path = (root:DocumentConcept {id: $scoped_root})-[:PREREQUISITE {document_id: $doc_id}*0..$depth]->(c:DocumentConcept)
-                WHERE (d:Document {id: $doc_id})-[:CONTAINS]->(root)
-                AND (d:Document {id: $doc_id})-[:CONTAINS]->(c)
-                RETURN c.id as scoped_id, c.global_name as name
-                ORDER BY length(path), c.global_name
-            """
-            
             result = self.connection.execute_query(query, {
                 "scoped_root": scoped_root,
-                "doc_id": document_id,
-                "depth": depth
+                "doc_id": document_id
             })
-            
-            seen = set()
-            path = []
-            for r in result:
-                if r["scoped_id"] not in seen:
-                    path.append(r["scoped_id"])
-                    seen.add(r["scoped_id"])
-            
-            return path
-            
         except Exception as e:
-            logger.error(f"Error getting document path preview: {e}")
+            logger.error("Error getting document path preview: %s", e)
             return []
+
+        return [r["scoped_id"] for r in result]
     
     def get_document_neighborhood(self, document_id: int, concept_name: str) -> Dict[str, Any]:
         """
@@ -467,49 +805,50 @@ class MultiDocNavigationEngine:
         Returns:
             Dict with nodes and edges for visualization
         """
-        try:
-            scoped_id = self.graph_storage.generate_scoped_id(document_id, concept_name)
-            
-            query = """
-                MATCH (target:DocumentConcept {id: $scoped_id})
-                OPTIONAL MATCH (pre:DocumentConcept)-[r1:PREREQUISITE {document_id: $doc_id}]->(target)
-                OPTIONAL MATCH (target)-[r2:PREREQUISITE {document_id: $doc_id}]->(post:DocumentConcept)
-                RETURN 
-                    target.id as target_id, target.global_name as target_name,
-                    collect(DISTINCT {id: pre.id, name: pre.global_name, type: 'prerequisite'}) as prerequisites,
-                    collect(DISTINCT {id: post.id, name: post.global_name, type: 'dependent'}) as dependents
-            """
-            
-            result = self.connection.execute_query(query, {
-                "scoped_id": scoped_id,
-                "doc_id": document_id
-            })
-            
-            if not result:
-                return {"nodes": [], "edges": []}
-            
-            data = result[0]
-            nodes = [{"id": data["target_id"], "name": data["target_name"], "group": "target"}]
-            edges = []
-            seen = {data["target_id"]}
-            
-            for p in data["prerequisites"]:
-                if p["id"] and p["id"] not in seen:
-                    nodes.append({"id": p["id"], "name": p["name"], "group": "prerequisite"})
-                    seen.add(p["id"])
-                    edges.append({"source": p["id"], "target": data["target_id"], "type": "prerequisite"})
-            
-            for d in data["dependents"]:
-                if d["id"] and d["id"] not in seen:
-                    nodes.append({"id": d["id"], "name": d["name"], "group": "dependent"})
-                    seen.add(d["id"])
-                    edges.append({"source": data["target_id"], "target": d["id"], "type": "dependent"})
-            
-            return {"nodes": nodes, "edges": edges}
+        scoped_id = self.graph_storage.generate_scoped_id(document_id, concept_name)
+        neighborhoods = self.get_document_neighborhoods_batch([(document_id, concept_name)])
+        return neighborhoods.get(scoped_id) or {"nodes": [], "edges": []}
+
+    def get_document_neighborhoods_batch(self, concepts: List[Tuple[int, str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get local neighborhoods for several (document_id, concept_name) pairs in one round-trip.
+        
+        Args:
+            concepts: (document_id, concept name) pairs; names are not scoped
             
+        Returns:
+            Dict mapping each found concept's scoped ID to its nodes/edges payload
+        """
+        targets = [
+            {"scoped_id": self.graph_storage.generate_scoped_id(doc_id, name), "doc_id": doc_id}
+            for doc_id, name in concepts
+        ]
+        if not targets:
+            return {}
+            
+        query = """
+            UNWIND $targets AS t
+            MATCH (target:DocumentConcept {id: t.scoped_id})
+            RETURN
+                target.id AS target_id, target.global_name AS target_name,
+                [(pre:DocumentConcept)-[:PREREQUISITE {document_id: t.doc_id}]->(target) |
+                    {id: pre.id, name: pre.global_name}] AS prerequisites,
+                [(target)-[:PREREQUISITE {document_id: t.doc_id}]->(post:DocumentConcept) |
+                    {id: post.id, name: post.global_name}] AS dependents
+        """
+
+        try:
+            result = self.connection.execute_query(query, {"targets": targets})
         except Exception as e:
-            logger.error(f"Error getting document neighborhood: {e}")
-            return {"nodes": [], "edges": []}
+            logger.error("Error getting document neighborhoods: %s", e)
+            return {}
+
+        return {
+            r["target_id"]: _document_neighborhood_payload(
+                r["target_id"], r["target_name"], r["prerequisites"], r["dependents"]
+            )
+            for r in result
+        }
     
     def get_cross_document_connections(self, document_id: int) -> List[Dict[str, Any]]:
         """
@@ -521,38 +860,39 @@ class MultiDocNavigationEngine:
         Returns:
             List of cross-document connection info
         """
+        # Only concepts merged into a global concept that other documents
+        # share survive the WHERE, already ordered by how many they share.
+        # Deduplicated with collect(DISTINCT ...) so APOC is not required.
+        query = """
+            MATCH (:Document {id: $doc_id})-[:CONTAINS]->(dc:DocumentConcept)-[:MERGED_INTO]->(gc:GlobalConcept)
+            OPTIONAL MATCH (gc)<-[:MERGED_INTO]-(other:DocumentConcept)
+            WHERE other.document_id <> $doc_id
+            WITH dc, gc, collect(DISTINCT other.document_id) AS other_doc_ids
+            WHERE size(other_doc_ids) > 0
+            RETURN 
+                dc.id as scoped_id, dc.global_name as name,
+                gc.id as global_id, gc.global_name as global_name,
+                other_doc_ids
+            ORDER BY size(other_doc_ids) DESC, dc.global_name
+        """
+
         try:
-            query = """
-                MATCH (dc:DocumentConcept)
-                MATCH (d:Document {id: $doc_id})-[:CONTAINS]->(dc)
-                OPTIONAL MATCH (dc)-[:MERGED_INTO]->(gc:GlobalConcept)
-                OPTIONAL MATCH (other:DocumentConcept)-[:MERGED_INTO]->(gc)
-                WHERE other.document_id <> $doc_id
-                RETURN 
-                    dc.id as scoped_id, dc.global_name as name,
-                    gc.id as global_id, gc.global_name as global_name,
-                    collect(DISTINCT other.document_id) as other_doc_ids
-            """
-            
             result = self.connection.execute_query(query, {"doc_id": document_id})
-            
-            connections = []
-            for r in result:
-                if r["other_doc_ids"]:
-                    connections.append({
-                        "scoped_id": r["scoped_id"],
-                        "local_name": r["name"],
-                        "global_id": r["global_id"],
-                        "global_name": r["global_name"],
-                        "other_documents": r["other_doc_ids"],
-                        "connection_count": len(r["other_doc_ids"])
-                    })
-            
-            return sorted(connections, key=lambda x: x["connection_count"], reverse=True)
-            
         except Exception as e:
-            logger.error(f"Error getting cross-document connections: {e}")
+            logger.error("Error getting cross-document connections: %s", e)
             return []
+
+        return [
+            {
+                "scoped_id": r["scoped_id"],
+                "local_name": r["name"],
+                "global_id": r["global_id"],
+                "global_name": r["global_name"],
+                "other_documents": r["other_doc_ids"],
+                "connection_count": len(r["other_doc_ids"])
+            }
+            for r in result
+        ]
     
     def find_concept_across_documents(self, concept_name: str) -> List[Dict[str, Any]]:
         """
@@ -564,36 +904,111 @@ class MultiDocNavigationEngine:
         Returns:
             List of {document_id, scoped_id, name, chunk_ids}
         """
-        normalized = concept_name.strip().lower()
+        normalized = normalize_name(concept_name)
         
+        # Each row is already the occurrence dict; the handful of rows is
+        # ordered in Python rather than sorted on the server
+        query = """
+            MATCH (dc:DocumentConcept {normalized_name: $normalized})
+            USING INDEX dc:DocumentConcept(normalized_name)
+            MATCH (d:Document)-[:CONTAINS]->(dc)
+            RETURN dc {
+                document_id: d.id, scoped_id: dc.id, name: dc.global_name,
+                .description, .chunk_ids, .is_merged
+            } AS occurrence
+        """
+
         try:
-            query = """
-                MATCH (dc:DocumentConcept {normalized_name: $normalized})
-                MATCH (d:Document)-[:CONTAINS]->(dc)
-                RETURN d.id as document_id, dc.id as scoped_id,
-                       dc.global_name as name, dc.description,
-                       dc.chunk_ids, dc.is_merged
-                ORDER BY d.id
-            """
-            
-            result = self.connection.execute_query(query, {"normalized_name": normalized})
-            
-            return [
-                {
-                    "document_id": r["document_id"],
-                    "scoped_id": r["scoped_id"],
-                    "name": r["name"],
-                    "description": r["description"],
-                    "chunk_ids": r["chunk_ids"],
-                    "is_merged": r["is_merged"]
-                }
-                for r in result
-            ]
-            
+            result = self.connection.execute_query(query, {"normalized": normalized}, fetch="values")
         except Exception as e:
-            logger.error(f"Error finding concept across documents: {e}")
+            logger.error("Error finding concept across documents: %s", e)
             return []
 
+        return sorted(result, key=lambda occurrence: occurrence["document_id"])
+
 
 # Global instance
 multi_doc_navigation = MultiDocNavigationEngine()
+
+
+# ========== Query Plan Audit (dev/CI) ==========
+
+# Methods that intentionally scan every Concept (joined against at most one
+# User row); everything else must start from an index seek.
+_FULL_SCAN_METHODS = {"find_root_concepts", "get_all_path_previews", "get_unlocked_concepts", "get_full_graph"}
+
+
+class _ExplainRecorder:
+    """Connection stand-in that EXPLAINs each query instead of running it."""
+
+    def __init__(self, driver, database: Optional[str] = None):
+        self.driver = driver
+        self.database = database
+        self.plans: List[Dict[str, Any]] = []
+
+    def _explain(self, query: str, parameters: Optional[dict] = None, fetch: str = "records") -> list:
+        with self.driver.session(database=self.database) as session:
+            self.plans.append(session.run("EXPLAIN " + query, parameters or {}).consume().plan)
+        return []
+
+    execute_read = execute_stream = _explain
+
+
+def _plan_operators(plan: Dict[str, Any]) -> List[str]:
+    """Flatten a plan tree into operator names (without the @runtime suffix)."""
+    operators = [plan["operatorType"].split("@")[0]]
+    for child in plan.get("children", []):
+        operators.extend(_plan_operators(child))
+    return operators
+
+
+def _audit_queries(driver=None) -> Dict[str, List[str]]:
+    """
+    EXPLAIN every NavigationEngine query and check the planned operators.
+    
+    Runs each method against an EXPLAIN-only connection with dummy arguments,
+    logs the operators per method and raises if a method outside the
+    full-graph ones plans a CartesianProduct or a NodeByLabelScan.
+    
+    Returns:
+        Dict mapping method name to its planned operators
+    """
+    driver = driver or neo4j_conn.connect()
+    calls = {
+        "find_root_concepts": (),
+        "get_path_preview": ("audit",),
+        "get_all_path_previews": (),
+        "get_path_preview_between": ("audit", "audit"),
+        "validate_prerequisites_batch": ("audit", ["audit"]),
+        "get_unlocked_concepts": ("audit",),
+        "get_neighborhood": ("audit",),
+        "get_neighborhoods_batch": (["audit"],),
+        "get_full_graph": ("audit",),
+    }
+    
+    NavigationEngine.invalidate_roots()
+    report, problems = {}, []
+    for method, args in calls.items():
+        engine = NavigationEngine()
+        engine.connection = _ExplainRecorder(driver, neo4j_conn.database)
+        getattr(engine, method)(*args)
+        operators = [op for plan in engine.connection.plans for op in _plan_operators(plan)]
+        report[method] = operators
+        logger.info("%s: %s", method, " <- ".join(operators) or "no plan (query failed)")
+        
+        if method in _FULL_SCAN_METHODS:
+            continue
+        if "CartesianProduct" in operators:
+            problems.append(f"{method} plans a CartesianProduct")
+        if "NodeByLabelScan" in operators:
+            problems.append(f"{method} plans a NodeByLabelScan")
+    NavigationEngine.invalidate_roots()
+            
+    if problems:
+        raise AssertionError("; ".join(problems))
+    return report
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    _audit_queries()
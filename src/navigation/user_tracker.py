@@ -4,17 +4,65 @@ User Progress Tracker for LearnFast Core.
 Handles user state management, progress recording, and state queries.
 """
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from datetime import datetime
 
 from src.database.connections import neo4j_conn
 from src.models.schemas import UserState, UserNode
-from src.database.graph_storage import graph_storage
+from src.database.graph_storage import graph_storage, normalize_name
 from src.navigation.navigation_engine import NavigationEngine
 
 logger = logging.getLogger(__name__)
 
+# Bulk progress writes: the user is merged once, then every concept row reports
+# whether it exists and whether its immediate prerequisites are completed.
+# FOREACH only writes for concepts that exist.
+_MARK_IN_PROGRESS_BULK_QUERY = """
+    MERGE (u:User {uid: $user_id})
+    ON CREATE SET u.name = $name, u.created_at = datetime()
+    WITH u
+    UNWIND $concept_names AS concept_name
+    OPTIONAL MATCH (c:Concept {name: concept_name})
+    WITH u, c, concept_name,
+         c IS NOT NULL AND NOT EXISTS {
+             MATCH (p:Concept)-[:PREREQUISITE]->(c)
+             WHERE NOT EXISTS { MATCH (u)-[:COMPLETED]->(p) }
+         } AS prereqs_met
+    FOREACH (_ IN CASE WHEN c IS NULL THEN [] ELSE [1] END |
+        MERGE (u)-[r:IN_PROGRESS]->(c)
+        ON CREATE SET r.started_at = datetime()
+    )
+    RETURN concept_name, c IS NOT NULL AS concept_exists, prereqs_met
+"""
+
+# Completed and in-progress concept names in one row; unknown users get empty lists
+_USER_PROGRESS_QUERY = """
+    OPTIONAL MATCH (u:User {uid: $user_id})
+    RETURN
+        CASE WHEN u IS NULL THEN [] ELSE [(u)-[:COMPLETED]->(c:Concept) | c.name] END AS completed,
+        CASE WHEN u IS NULL THEN [] ELSE [(u)-[:IN_PROGRESS]->(c:Concept) | c.name] END AS in_progress
+"""
+
+# Completing also removes any IN_PROGRESS relationship for the same concept
+_MARK_COMPLETED_BULK_QUERY = """
+    MERGE (u:User {uid: $user_id})
+    ON CREATE SET u.name = $name, u.created_at = datetime()
+    WITH u
+    UNWIND $concept_names AS concept_name
+    OPTIONAL MATCH (c:Concept {name: concept_name})
+    FOREACH (_ IN CASE WHEN c IS NULL THEN [] ELSE [1] END |
+        MERGE (u)-[r:COMPLETED]->(c)
+        SET r.finished_at = datetime()
+    )
+    WITH u, c, concept_name
+    OPTIONAL MATCH (u)-[ip:IN_PROGRESS]->(c)
+    DELETE ip
+    RETURN concept_name, c IS NOT NULL AS concept_exists, true AS prereqs_met
+"""
+
 
 class UserProgressTracker:
     """
@@ -24,7 +72,7 @@ class UserProgressTracker:
     def __init__(self):
         """Initialize the user progress tracker."""
         self.connection = neo4j_conn
-        self.navigation = NavigationEngine()
+        self.navigation = NavigationEngine.instance()
         
     def ensure_user_exists(self, user_id: str, name: str = "Learner") -> bool:
         """
@@ -47,6 +95,10 @@ class UserProgressTracker:
     def mark_in_progress(self, user_id: str, concept: str) -> bool:
         """
         Mark a concept as IN_PROGRESS for a user.
+
+        Creates the user if needed, checks the concept and its prerequisites
+        and writes the relationship in a single statement. Unmet prerequisites
+        are logged but allowed: generated path lessons are expected to cover them.
         
         Args:
             user_id: Unique user identifier
@@ -57,51 +109,14 @@ class UserProgressTracker:
         """
         if not user_id or not concept:
             return False
-            
-        try:
-            # First ensure user exists (lazy creation with default name if needed)
-            if not self.ensure_user_exists(user_id):
-                return False
-                
-            normalized_concept = concept.strip().lower()
-            
-            # Verify concept exists
-            if not graph_storage.concept_exists(normalized_concept):
-                logger.warning(f"Cannot mark unknown concept in progress: {concept}")
-                return False
-            
-            # Check prerequisites check before allowing start?
-            # Relaxed for Path Generator: Allow starting even if prerequisites aren't met
-            # because the generated lesson is expected to cover them.
-            if not self.navigation.validate_prerequisites(user_id, normalized_concept):
-                logger.warning(f"Prerequisites not met for user {user_id} starting {concept} - proceeding anyway (path mode)")
-                # Return True anyway to allow progress
-                
-            query = """
-                MATCH (u:User {uid: $user_id})
-                MATCH (c:Concept {name: $concept_name})
-                MERGE (u)-[r:IN_PROGRESS]->(c)
-                ON CREATE SET r.started_at = datetime()
-                RETURN r.started_at
-            """
-            
-            self.connection.execute_write_query(query, {
-                "user_id": user_id,
-                "concept_name": normalized_concept
-            })
-            
-            logger.info(f"User {user_id} started concept {normalized_concept}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error marking in-progress for user '{user_id}', concept '{concept}': {str(e)}")
-            return False
+        return self.mark_in_progress_bulk(user_id, [concept])[concept]
             
     def mark_completed(self, user_id: str, concept: str) -> bool:
         """
         Mark a concept as COMPLETED for a user.
         
-        Removes any IN_PROGRESS status for the same concept.
+        Removes any IN_PROGRESS status for the same concept. Creates the user
+        if needed and checks the concept in the same statement.
         
         Args:
             user_id: Unique user identifier
@@ -112,45 +127,75 @@ class UserProgressTracker:
         """
         if not user_id or not concept:
             return False
+        return self.mark_completed_bulk(user_id, [concept])[concept]
+
+    def mark_in_progress_bulk(self, user_id: str, concepts: List[str]) -> Dict[str, bool]:
+        """
+        Mark several concepts as IN_PROGRESS for a user in one round-trip.
+        
+        Args:
+            user_id: Unique user identifier
+            concepts: Concept names to start
             
-        try:
-            if not self.ensure_user_exists(user_id):
-                return False
-                
-            normalized_concept = concept.strip().lower()
+        Returns:
+            Dict mapping each given concept to True if it was marked
+        """
+        return self._mark_bulk(user_id, concepts, _MARK_IN_PROGRESS_BULK_QUERY, "started")
+
+    def mark_completed_bulk(self, user_id: str, concepts: List[str]) -> Dict[str, bool]:
+        """
+        Mark several concepts as COMPLETED for a user in one round-trip.
+        
+        Removes any IN_PROGRESS status for the same concepts.
+        
+        Args:
+            user_id: Unique user identifier
+            concepts: Concept names to complete
             
-            if not graph_storage.concept_exists(normalized_concept):
-                logger.warning(f"Cannot mark unknown concept completed: {concept}")
-                return False
-                
-            # Create COMPLETED relationship and delete IN_PROGRESS if exists
-            query = """
-                MATCH (u:User {uid: $user_id})
-                MATCH (c:Concept {name: $concept_name})
-                MERGE (u)-[r:COMPLETED]->(c)
-                ON CREATE SET r.finished_at = datetime()
-                ON MATCH SET r.finished_at = datetime()
-                WITH u, c
-                MATCH (u)-[ip:IN_PROGRESS]->(c)
-                DELETE ip
-                RETURN u.uid
-            """
+        Returns:
+            Dict mapping each given concept to True if it was marked
+        """
+        return self._mark_bulk(user_id, concepts, _MARK_COMPLETED_BULK_QUERY, "completed")
+
+    def _mark_bulk(self, user_id: str, concepts: List[str], query: str, action: str) -> Dict[str, bool]:
+        """Run one of the bulk progress queries and map its rows back to the given names."""
+        normalized = {concept: normalize_name(concept) for concept in concepts if concept and concept.strip()}
+        if not user_id or not user_id.strip() or not normalized:
+            return {concept: False for concept in concepts}
             
-            self.connection.execute_write_query(query, {
+        try:
+            result = self.connection.execute_query(query, {
                 "user_id": user_id,
-                "concept_name": normalized_concept
+                "name": "Learner",
+                "concept_names": list(set(normalized.values()))
             })
-            
-            logger.info(f"User {user_id} completed concept {normalized_concept}")
-            return True
-            
         except Exception as e:
-            logger.error(f"Error marking completed for user '{user_id}', concept '{concept}': {str(e)}")
-            return False
+            logger.error(f"Error marking {len(normalized)} concepts {action} for user '{user_id}': {str(e)}")
+            return {concept: False for concept in concepts}
+        NavigationEngine.invalidate_progress(user_id)
+            
+        rows = {record["concept_name"]: record for record in result}
+        marked = {}
+        for concept in concepts:
+            row = rows.get(normalized.get(concept))
+            if row is None or not row["concept_exists"]:
+                logger.warning(f"Cannot mark unknown concept {action}: {concept}")
+                marked[concept] = False
+                continue
+            if not row["prereqs_met"]:
+                # Relaxed for Path Generator: the generated lesson is expected to cover them
+                logger.warning(f"Prerequisites not met for user {user_id} starting {concept} - proceeding anyway (path mode)")
+            marked[concept] = True
             
+        logger.info(f"User {user_id} {action} {sum(marked.values())} concepts")
+        return marked
+
     def get_user_state(self, user_id: str) -> Optional[UserState]:
         """
         Get the full state of a user (completed, in-progress, and available concepts).
+
+        The completed / in-progress read and the unlocked-concepts read are
+        independent, so they run concurrently.
         
         Args:
             user_id: Unique user identifier
@@ -159,33 +204,36 @@ class UserProgressTracker:
             UserState object or None if user not found/error
         """
         try:
-            # Get completed concepts
-            completed_query = """
-                MATCH (:User {uid: $user_id})-[:COMPLETED]->(c:Concept)
-                RETURN c.name as name
-            """
-            completed_result = self.connection.execute_query(completed_query, {"user_id": user_id})
-            completed_concepts = [r["name"] for r in completed_result]
-            
-            # Get in-progress concepts
-            in_progress_query = """
-                MATCH (:User {uid: $user_id})-[:IN_PROGRESS]->(c:Concept)
-                RETURN c.name as name
-            """
-            in_progress_result = self.connection.execute_query(in_progress_query, {"user_id": user_id})
-            in_progress_concepts = [r["name"] for r in in_progress_result]
-            
-            # Get available (unlocked) concepts
-            # Using NavigationEngine logic
-            available_concepts = self.navigation.get_unlocked_concepts(user_id)
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                # Using NavigationEngine logic for available (unlocked) concepts
+                available_future = pool.submit(self.navigation.get_unlocked_concepts, user_id)
+                progress = self.connection.execute_query(_USER_PROGRESS_QUERY, {"user_id": user_id})
+                available_concepts = available_future.result()
+            return self._user_state(user_id, progress, available_concepts)
             
-            return UserState(
-                user_id=user_id,
-                completed_concepts=completed_concepts,
-                in_progress_concepts=in_progress_concepts,
-                available_concepts=available_concepts
+        except Exception as e:
+            logger.error(f"Error retrieving user state for '{user_id}': {str(e)}")
+            return None
+
+    async def a_get_user_state(self, user_id: str) -> Optional[UserState]:
+        """Async get_user_state(); both reads run concurrently on the async driver."""
+        try:
+            progress, available_concepts = await asyncio.gather(
+                self.connection.execute_read_async(_USER_PROGRESS_QUERY, {"user_id": user_id}),
+                self.navigation.a_get_unlocked_concepts(user_id),
             )
+            return self._user_state(user_id, progress, available_concepts)
             
         except Exception as e:
             logger.error(f"Error retrieving user state for '{user_id}': {str(e)}")
             return None
+
+    @staticmethod
+    def _user_state(user_id: str, progress: list, available_concepts: List[str]) -> UserState:
+        row = progress[0] if progress else {}
+        return UserState(
+            user_id=user_id,
+            completed_concepts=row.get("completed") or [],
+            in_progress_concepts=row.get("in_progress") or [],
+            available_concepts=available_concepts
+        )
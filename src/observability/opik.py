@@ -24,21 +24,28 @@ def opik_available() -> bool:
     return _opik_configure is not None
 
 
+# (config key, settings attribute) pairs where a falsy user value falls back to settings
+_OPIK_FALLBACK_FIELDS = (
+    ("api_key", "opik_api_key"),
+    ("workspace", "opik_workspace"),
+    ("url_override", "opik_url_override"),
+    ("project_name", "opik_project"),
+)
+
+
 def build_opik_config(user_settings: Optional[Any] = None) -> Dict[str, Any]:
-    cfg: Dict[str, Any] = {}
-    if user_settings and getattr(user_settings, "llm_config", None):
-        try:
-            cfg = (user_settings.llm_config or {}).get("opik", {})
-        except Exception:
-            cfg = {}
-    return {
+    llm_config = getattr(user_settings, "llm_config", None) or {}
+    try:
+        cfg = llm_config.get("opik") or {}
+    except Exception:
+        cfg = {}
+    config: Dict[str, Any] = {
         "enabled": bool(cfg.get("enabled", settings.use_opik)),
-        "api_key": cfg.get("api_key") or settings.opik_api_key,
-        "workspace": cfg.get("workspace") or settings.opik_workspace,
-        "url_override": cfg.get("url_override") or settings.opik_url_override,
-        "project_name": cfg.get("project_name") or settings.opik_project,
         "use_local": bool(cfg.get("use_local", settings.opik_use_local)),
     }
+    for key, attr in _OPIK_FALLBACK_FIELDS:
+        config[key] = cfg.get(key) or getattr(settings, attr)
+    return config
 
 
 def init_opik(config: Dict[str, Any]) -> bool:
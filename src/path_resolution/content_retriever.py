@@ -1,8 +1,14 @@
+import asyncio
+import io
 import logging
 import json
 import os
-from typing import List, Dict, Any, Optional
+import re
+import time
+from typing import List, Dict, Any, Optional, Tuple
+import orjson
 from dotenv import load_dotenv
+from starlette.concurrency import run_in_threadpool
 
 from src.database.connections import postgres_conn
 from src.models.schemas import LearningChunk
@@ -15,6 +21,37 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Body of the first markdown code fence (```json or bare ```); an unclosed fence runs to the end
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL)
+
+# In-process (L1) copy of cached_lessons, keyed by (lowercased concept, time budget).
+# Entries expire after LESSON_CACHE_TTL_SECONDS; the oldest is evicted at capacity.
+LESSON_CACHE_TTL_SECONDS = 3600.0
+LESSON_CACHE_MAXSIZE = 1024
+_lesson_cache: Dict[Tuple[str, int], Tuple[float, str]] = {}
+
+# Lesson generations currently running, keyed like _lesson_cache
+_inflight_lessons: Dict[Tuple[str, int], "asyncio.Future[str]"] = {}
+
+
+def clear_lesson_cache() -> None:
+    """Drop every in-process cached lesson (the cached_lessons table is untouched)."""
+    _lesson_cache.clear()
+
+
+def _recall_lesson(key: Tuple[str, int]) -> Optional[str]:
+    entry = _lesson_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _remember_lesson(key: Tuple[str, int], content: str) -> None:
+    _lesson_cache.pop(key, None)
+    if len(_lesson_cache) >= LESSON_CACHE_MAXSIZE:
+        _lesson_cache.pop(next(iter(_lesson_cache)))
+    _lesson_cache[key] = (time.monotonic() + LESSON_CACHE_TTL_SECONDS, content)
+
 
 class ContentRetriever:
     """
@@ -111,57 +148,94 @@ Return ONLY the JSON object, no other text:"""
         """
         if not concept:
             return []
+        return self.retrieve_chunks_by_concepts([concept])[concept]
+
+    def retrieve_chunks_by_concepts(self, concepts: List[str]) -> Dict[str, List[LearningChunk]]:
+        """
+        Retrieve the content chunks of several concepts in one query.
+        
+        Args:
+            concepts: Concept names
             
-        try:
-            query = """
-                SELECT id, doc_source, content, concept_tag, created_at
-                FROM learning_chunks
-                WHERE lower(concept_tag) = lower(%s)
-                ORDER BY id ASC
-            """
-            
-            results = self.connection.execute_query(query, (concept,))
-            
-            chunks = []
-            for row in results:
-                chunks.append(LearningChunk(
-                    id=row['id'],
-                    doc_source=row['doc_source'],
-                    content=row['content'],
-                    concept_tag=row['concept_tag'],
-                    created_at=row['created_at']
-                ))
+        Returns:
+            Dict mapping each given concept name to its chunks, ordered by id
+        """
+        by_tag: Dict[str, List[LearningChunk]] = {}
+        tags = list({concept.lower() for concept in concepts if concept})
+        if tags:
+            try:
+                query = """
+                    SELECT id, doc_source, content, concept_tag, created_at
+                    FROM learning_chunks
+                    WHERE concept_tag = ANY(%s)
+                    ORDER BY id ASC
+                """
                 
-            return chunks
-            
-        except Exception as e:
-            logger.error(f"Error retrieving chunks for concept '{concept}': {str(e)}")
-            return []
+                results = self.connection.execute_query(query, (tags,))
+                
+                for row in results:
+                    by_tag.setdefault(row['concept_tag'].lower(), []).append(LearningChunk(
+                        id=row['id'],
+                        doc_source=row['doc_source'],
+                        content=row['content'],
+                        concept_tag=row['concept_tag'],
+                        created_at=row['created_at']
+                    ))
+                    
+            except Exception as e:
+                logger.error(f"Error retrieving chunks for {len(tags)} concepts: {str(e)}")
+                
+        return {concept: list(by_tag.get(concept.lower(), [])) if concept else [] for concept in concepts}
 
     def _get_cached_lesson(self, concept_name: str, time_budget: int) -> Optional[str]:
-        """Check if a lesson is already cached."""
+        """Check if a lesson is already cached, in process first and then in Postgres."""
+        key = (concept_name.lower(), time_budget)
+        cached = _recall_lesson(key)
+        if cached is not None:
+            return cached
+
         try:
             query = """
                 SELECT content_markdown 
                 FROM cached_lessons 
-                WHERE lower(concept_name) = lower(%s) AND time_budget = %s
+                WHERE concept_name = %s AND time_budget = %s
                 LIMIT 1
             """
-            result = self.connection.execute_query(query, (concept_name, time_budget))
+            result = self.connection.execute_query(query, key)
             if result:
-                return result[0]['content_markdown']
+                content = result[0]['content_markdown']
+                _remember_lesson(key, content)
+                return content
         except Exception as e:
             logger.error(f"Error checking lesson cache: {e}")
         return None
 
+    def clear_cached_lessons(self) -> int:
+        """
+        Drop every cached lesson, in process and in the cached_lessons table.
+
+        Other worker processes keep their in-process copies until
+        LESSON_CACHE_TTL_SECONDS runs out.
+
+        Returns:
+            Number of cached_lessons rows deleted
+        """
+        clear_lesson_cache()
+        deleted = self.connection.execute_query("DELETE FROM cached_lessons RETURNING id")
+        logger.info(f"Cleared lesson cache ({len(deleted)} stored lessons)")
+        return len(deleted)
+
     def _cache_lesson(self, concept_name: str, time_budget: int, content: str):
         """Save a generated lesson to the cache."""
+        key = (concept_name.lower(), time_budget)
+        _remember_lesson(key, content)
         try:
             query = """
                 INSERT INTO cached_lessons (concept_name, time_budget, content_markdown)
                 VALUES (%s, %s, %s)
+                ON CONFLICT (concept_name, time_budget) DO NOTHING
             """
-            self.connection.execute_query(query, (concept_name, time_budget, content))
+            self.connection.execute_query(query, (*key, content))
         except Exception as e:
             logger.error(f"Error caching lesson: {e}")
 
@@ -248,12 +322,14 @@ Return ONLY the JSON object, no other text:"""
             )
 
             # Clean up response if it has markdown code blocks
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0]
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0]
+            fence = _JSON_FENCE.search(response_text)
+            payload = fence.group(1) if fence else response_text
 
-            flashcards = llm_service._extract_and_parse_json(response_text.strip())
+            # Well-formed JSON takes the orjson fast path; anything else gets the tolerant parser
+            try:
+                flashcards = orjson.loads(payload)
+            except orjson.JSONDecodeError:
+                flashcards = llm_service._extract_and_parse_json(payload.strip())
 
             # Validate and normalize structure
             # Handle both array of flashcards and single flashcard object
@@ -306,14 +382,37 @@ Return ONLY the JSON object, no other text:"""
         # 1. Check Cache (Skip if pruning is active? Or cache keyed by mastered state? 
         # For valid caching with pruning, we'd need to include state in key. 
         # For V1, let's skip cache if we have mastered concepts to ensure pruning happens)
-        if not completed_concepts:
-            cached = self._get_cached_lesson(target_concept, time_budget_minutes)
-            if cached:
-                logger.info(f"Returning cached lesson for {target_concept} ({time_budget_minutes}m)")
-                return cached
+        if completed_concepts:
+            return await self._build_lesson(path_concepts, time_budget_minutes, completed_concepts)
+
+        # In-process hits are served on the loop; only the Postgres lookup goes to a thread
+        key = (target_concept.lower(), time_budget_minutes)
+        cached = _recall_lesson(key) or await run_in_threadpool(self._get_cached_lesson, target_concept, time_budget_minutes)
+        if cached:
+            logger.info(f"Returning cached lesson for {target_concept} ({time_budget_minutes}m)")
+            return cached
+
+        # Single-flight: concurrent misses for the same lesson share one generation.
+        # shield() keeps it running for the others if the first caller goes away.
+        pending = _inflight_lessons.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._build_and_cache_lesson(path_concepts, time_budget_minutes))
+            _inflight_lessons[key] = pending
+            pending.add_done_callback(lambda _: _inflight_lessons.pop(key, None))
+        else:
+            logger.info(f"Joining in-flight lesson generation for {target_concept} ({time_budget_minutes}m)")
+        return await asyncio.shield(pending)
+
+    async def _build_and_cache_lesson(self, path_concepts: List[str], time_budget_minutes: int) -> str:
+        lesson = await self._build_lesson(path_concepts, time_budget_minutes, [])
+        await run_in_threadpool(self._cache_lesson, path_concepts[-1], time_budget_minutes, lesson)
+        return lesson
+
+    async def _build_lesson(self, path_concepts: List[str], time_budget_minutes: int, completed_concepts: List[str]) -> str:
+        """Gather chunks for the (pruned) path and turn them into a lesson with the LLM."""
+        target_concept = path_concepts[-1]
 
         # 2. Gather All Raw Content (Filtering out mastered concepts)
-        lesson_parts = []
         
         # We process the target concept AND its prerequisites traversing the path?
         # Typically the path includes prereqs. 
@@ -330,13 +429,19 @@ Return ONLY the JSON object, no other text:"""
 
         logger.info(f"Generating lesson for {target_concept}. Pruned {len(path_concepts) - len(relevant_concepts)} concepts.")
 
+        chunks_by_concept = await run_in_threadpool(self.retrieve_chunks_by_concepts, relevant_concepts)
+        # Numbered sections are written straight into one buffer
+        buf = io.StringIO()
+        idx = 0
         for concept in relevant_concepts:
-            chunks = self.retrieve_chunks_by_concept(concept)
-            for chunk in chunks:
+            for chunk in chunks_by_concept[concept]:
+                if idx:
+                    buf.write("\n\n")
+                idx += 1
                 # Add explicit concept label for LLM
-                lesson_parts.append(f"Source: {chunk.doc_source} (Concept: {concept})\nContent: ```\n{chunk.content}\n```")
+                buf.write(f"### {idx}\nSource: {chunk.doc_source} (Concept: {concept})\nContent: ```\n{chunk.content}\n```")
         
-        raw_full_content = "\n\n".join([f"### {i+1}\n{part}" for i,part in enumerate(lesson_parts)])
+        raw_full_content = buf.getvalue()
 
         if not raw_full_content.strip():
             # No chunks exist - generate lesson from scratch
@@ -347,10 +452,6 @@ Return ONLY the JSON object, no other text:"""
             logger.info(f"Generating new lesson for {target_concept} ({time_budget_minutes}m)")
             enhanced_lesson = await self._rewrite_with_llm(target_concept, time_budget_minutes, raw_full_content, completed_concepts)
 
-        # 4. Cache (Only if no pruning happened, to be safe?)
-        if not completed_concepts:
-            self._cache_lesson(target_concept, time_budget_minutes, enhanced_lesson)
-
         return enhanced_lesson
 
     async def get_lesson_with_flashcards(
@@ -25,7 +25,7 @@ class PathResolver:
         """Initialize the path resolver."""
         self.connection = neo4j_conn
         self.pg_connection = postgres_conn
-        self.navigation = NavigationEngine()
+        self.navigation = NavigationEngine.instance()
         
     def estimate_learning_time(self, concepts: List[str]) -> int:
         """
@@ -49,7 +49,7 @@ class PathResolver:
             query = f"""
                 SELECT count(*) as chunk_count 
                 FROM learning_chunks 
-                WHERE lower(concept_tag) IN ({placeholders})
+                WHERE concept_tag IN ({placeholders})
             """
             
             # Normalize names for query
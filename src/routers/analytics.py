@@ -8,28 +8,30 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timedelta, date as date_type
 from src.utils.time import utcnow
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from src.database.orm import get_db
 from src.models.orm import Document, Flashcard, StudySession, StudyReview, Goal, FocusSession, PracticeSession
 from src.models.schemas import (
     AnalyticsOverview,
     StudyStats,
+    ActivityLogListAdapter,
     ActivityLogResponse,
     AnalyticsGoalProgressResponse,
     AnalyticsGoalProgressItem,
     AnalyticsTimeAllocationResponse,
     AnalyticsTimeAllocationItem,
+    AnalyticsTimeAllocationSeries,
     AnalyticsConsistencyResponse,
     AnalyticsRecommendationsResponse,
     AnalyticsRecommendation,
 )
 from src.services.time_tracking_service import TimeTrackingService
 from src.services.activity_service import ActivityService
+from src.utils.responses import PydanticORJSONResponse, list_response, model_response
 
 router = APIRouter(prefix="/api/analytics", tags=["analytics"])
 
-
 def _parse_date(date_str: Optional[str], end: bool = False) -> Optional[datetime]:
     if not date_str:
         return None
@@ -59,15 +61,15 @@ def _goal_title(db: Session, goal_id: Optional[str]) -> Optional[str]:
     return goal.title if goal else None
 
 
-@router.get("/activity", response_model=List[ActivityLogResponse])
+@router.get("/activity", response_model=List[ActivityLogResponse], response_class=PydanticORJSONResponse)
 def get_recent_activity(limit: int = 10, db: Session = Depends(get_db)):
     """
     Retrieves the most recent activity log entries.
     """
-    return ActivityService.get_recent_activity(db, limit)
+    return list_response(ActivityLogListAdapter, ActivityService.get_recent_activity(db, limit))
 
 
-@router.get("/overview", response_model=AnalyticsOverview)
+@router.get("/overview", response_model=AnalyticsOverview, response_class=PydanticORJSONResponse)
 def get_analytics_overview(
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
@@ -120,7 +122,7 @@ def get_analytics_overview(
     learning_cards = db.query(func.count(Flashcard.id)).filter(Flashcard.repetitions > 0, Flashcard.interval <= 21).scalar()
     mastered_cards = db.query(func.count(Flashcard.id)).filter(Flashcard.interval > 21).scalar()
 
-    return AnalyticsOverview(
+    return model_response(AnalyticsOverview(
         total_documents=total_documents or 0,
         total_flashcards=total_flashcards or 0,
         total_reviews=total_reviews or 0,
@@ -134,7 +136,7 @@ def get_analytics_overview(
             "learning": learning_cards or 0,
             "mastered": mastered_cards or 0
         }
-    )
+    ))
 
 
 @router.get("/performance", response_model=List[StudyStats])
@@ -564,70 +566,93 @@ def get_goal_progress(
     return AnalyticsGoalProgressResponse(items=items)
 
 
-@router.get("/time-allocation", response_model=AnalyticsTimeAllocationResponse)
-def get_time_allocation(
-    date_from: Optional[str] = None,
-    date_to: Optional[str] = None,
-    user_id: str = "default_user",
-    db: Session = Depends(get_db)
-):
-    start, end = _get_date_range(date_from, date_to)
-    bucket: Dict[str, Dict[str, int]] = {}
+def _time_allocation_columns(
+    db: Session, user_id: str, start: datetime, end: datetime
+) -> Tuple[List[str], List[int], List[int], List[int]]:
+    """Per-day minutes as parallel (dates, focus, practice, study) columns, sorted by date."""
+    bucket: Dict[str, List[int]] = {}
 
-    focus_sessions = db.query(FocusSession).filter(
+    def _slot(started: datetime) -> List[int]:
+        return bucket.setdefault(started.date().isoformat(), [0, 0, 0])
+
+    # Column-only queries: no ORM entities are hydrated for what is just a sum per day
+    focus_rows = db.query(FocusSession.start_time, FocusSession.duration_minutes).filter(
         FocusSession.user_id == user_id,
         FocusSession.start_time >= start,
         FocusSession.start_time < end,
         FocusSession.end_time.isnot(None)
-    ).all()
-    for session in focus_sessions:
-        day = session.start_time.date().isoformat()
-        bucket.setdefault(day, {"focus": 0, "practice": 0, "study": 0})
-        bucket[day]["focus"] += int(session.duration_minutes or 0)
+    )
+    for start_time, duration in focus_rows:
+        _slot(start_time)[0] += int(duration or 0)
 
-    practice_sessions = db.query(PracticeSession).filter(
+    practice_rows = db.query(
+        PracticeSession.start_time, PracticeSession.end_time, PracticeSession.target_duration_minutes
+    ).filter(
         PracticeSession.user_id == user_id,
         PracticeSession.start_time >= start,
         PracticeSession.start_time < end
-    ).all()
-    for session in practice_sessions:
-        day = session.start_time.date().isoformat()
-        bucket.setdefault(day, {"focus": 0, "practice": 0, "study": 0})
-        if session.end_time and session.start_time:
-            minutes = int(round((session.end_time - session.start_time).total_seconds() / 60))
+    )
+    for start_time, end_time, target_minutes in practice_rows:
+        if end_time and start_time:
+            minutes = int(round((end_time - start_time).total_seconds() / 60))
         else:
-            minutes = int(session.target_duration_minutes or 0)
-        bucket[day]["practice"] += minutes
+            minutes = int(target_minutes or 0)
+        _slot(start_time)[1] += minutes
 
-    study_sessions = db.query(StudySession).filter(
+    study_rows = db.query(StudySession.start_time, StudySession.end_time).filter(
         StudySession.start_time >= start,
         StudySession.start_time < end,
         StudySession.end_time.isnot(None)
-    ).all()
-    for session in study_sessions:
-        day = session.start_time.date().isoformat()
-        bucket.setdefault(day, {"focus": 0, "practice": 0, "study": 0})
-        if session.end_time and session.start_time:
-            minutes = int(round((session.end_time - session.start_time).total_seconds() / 60))
-        else:
-            minutes = 0
-        bucket[day]["study"] += minutes
-
-    items = []
-    for day in sorted(bucket.keys()):
-        focus_minutes = bucket[day]["focus"]
-        practice_minutes = bucket[day]["practice"]
-        study_minutes = bucket[day]["study"]
-        total = focus_minutes + practice_minutes + study_minutes
-        items.append(AnalyticsTimeAllocationItem(
+    )
+    for start_time, end_time in study_rows:
+        _slot(start_time)[2] += int(round((end_time - start_time).total_seconds() / 60))
+
+    days = sorted(bucket)
+    if not days:
+        return [], [], [], []
+    focus, practice, study = (list(column) for column in zip(*(bucket[day] for day in days)))
+    return days, focus, practice, study
+
+
+@router.get("/time-allocation", response_model=AnalyticsTimeAllocationResponse, response_class=PydanticORJSONResponse)
+def get_time_allocation(
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    user_id: str = "default_user",
+    db: Session = Depends(get_db)
+):
+    start, end = _get_date_range(date_from, date_to)
+    days, focus, practice, study = _time_allocation_columns(db, user_id, start, end)
+    items = [
+        AnalyticsTimeAllocationItem(
             date=day,
-            focus_minutes=focus_minutes,
-            practice_minutes=practice_minutes,
-            study_minutes=study_minutes,
-            total_minutes=total
-        ))
+            focus_minutes=f,
+            practice_minutes=p,
+            study_minutes=s,
+            total_minutes=f + p + s
+        )
+        for day, f, p, s in zip(days, focus, practice, study)
+    ]
+    return model_response(AnalyticsTimeAllocationResponse(items=items))
+
 
-    return AnalyticsTimeAllocationResponse(items=items)
+@router.get("/time-allocation/series", response_model=AnalyticsTimeAllocationSeries, response_class=PydanticORJSONResponse)
+def get_time_allocation_series(
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    user_id: str = "default_user",
+    db: Session = Depends(get_db)
+):
+    """Column-wise time allocation, one array per chart dataset."""
+    start, end = _get_date_range(date_from, date_to)
+    days, focus, practice, study = _time_allocation_columns(db, user_id, start, end)
+    return PydanticORJSONResponse(content={
+        "dates": days,
+        "focus_minutes": focus,
+        "practice_minutes": practice,
+        "study_minutes": study,
+        "total_minutes": [f + p + s for f, p, s in zip(focus, practice, study)],
+    })
 
 
 @router.get("/consistency", response_model=AnalyticsConsistencyResponse)
@@ -4,6 +4,7 @@ from typing import List
 
 from src.database.orm import get_db
 from src.models.schemas import (
+    CurriculumListAdapter,
     CurriculumResponse,
     CurriculumGenerateRequest,
     CurriculumModuleResponse,
@@ -24,6 +25,7 @@ import json
 import re
 from src.services.curriculum_service import curriculum_service
 from src.dependencies import get_request_user_id
+from src.utils.responses import PydanticORJSONResponse, list_response, model_response
 
 router = APIRouter(prefix="/api/curriculum", tags=["Curriculum"])
 
@@ -56,25 +58,26 @@ async def generate_curriculum(
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/", response_model=List[CurriculumResponse])
+@router.get("/", response_model=List[CurriculumResponse], response_class=PydanticORJSONResponse)
 def list_curriculums(user_id: str = Depends(get_request_user_id), db: Session = Depends(get_db)):
-    return curriculum_service.get_user_curriculums(db, user_id)
+    return list_response(CurriculumListAdapter, curriculum_service.get_user_curriculums(db, user_id))
 
-@router.get("/{curriculum_id}", response_model=CurriculumResponse)
+@router.get("/{curriculum_id}", response_model=CurriculumResponse, response_class=PydanticORJSONResponse)
 def get_curriculum(curriculum_id: str, db: Session = Depends(get_db)):
     curriculum = curriculum_service.get_curriculum(db, curriculum_id)
     if not curriculum:
         raise HTTPException(status_code=404, detail="Curriculum not found")
-    return curriculum
+    return model_response(CurriculumResponse.model_validate(curriculum))
 
 
-@router.get("/{curriculum_id}/timeline", response_model=CurriculumTimelineResponse)
+@router.get("/{curriculum_id}/timeline", response_model=CurriculumTimelineResponse, response_class=PydanticORJSONResponse)
 def get_curriculum_timeline(curriculum_id: str, db: Session = Depends(get_db)):
     curriculum = curriculum_service.get_curriculum(db, curriculum_id)
     if not curriculum:
         raise HTTPException(status_code=404, detail="Curriculum not found")
     weeks = curriculum_service.get_curriculum_timeline(db, curriculum_id)
-    return {"curriculum_id": curriculum_id, "weeks": weeks}
+    # weeks are already CurriculumWeekResponse models; skip the outer model and FastAPI's re-validation
+    return PydanticORJSONResponse(content={"curriculum_id": curriculum_id, "weeks": weeks})
 
 
 @router.get("/{curriculum_id}/graph")
@@ -9,13 +9,14 @@ from src.database.orm import get_db
 from src.dependencies import get_request_user_id
 from src.models.schemas import DashboardOverviewResponse
 from src.services.dashboard_service import dashboard_service
+from src.utils.responses import PydanticORJSONResponse, model_response
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
 
-@router.get("/overview", response_model=DashboardOverviewResponse)
+@router.get("/overview", response_model=DashboardOverviewResponse, response_class=PydanticORJSONResponse)
 def get_dashboard_overview(user_id: str = Depends(get_request_user_id), db: Session = Depends(get_db)):
     """
     Returns consolidated dashboard data for the Actionable Today view.
     """
-    return dashboard_service.build_overview(db, user_id)
+    return model_response(dashboard_service.build_overview(db, user_id))
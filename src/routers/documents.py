@@ -26,7 +26,7 @@ from src.database.orm import get_db
 from src.dependencies import get_request_user_id
 from src.models.orm import Document, UserSettings, DocumentQuizItem as DocumentQuizItemORM, DocumentQuizSession, DocumentQuizAttempt, DocumentQuizSubmission, DocumentStudySettings, DocumentSection, IngestionJob, KnowledgeGraphDocument
 from src.models.enums import FileType
-from src.models.schemas import DocumentResponse, DocumentCreate, TimeTrackingRequest, DocumentLinkCreate, DocumentQuizGenerateRequest, DocumentQuizSessionCreate, DocumentQuizSessionResponse, DocumentQuizGradeRequest, DocumentQuizGradeResponse, DocumentStudySettingsPayload, DocumentStudySettingsResponse, DocumentQuizStatsResponse, DocumentQuizItem as DocumentQuizItemResponse, LLMConfig, DocumentSectionResponse, DocumentSectionUpdate, DocumentQualityResponse, IngestionJobResponse, MarkdownExportResponse, MarkdownSaveRequest, ExercisePreviewRequest, ExerciseCandidate, ExerciseCreateRequest, DocumentQuizBatchGradeResponse, DocumentQuizBatchGradeItem, HighlightActionRequest, HighlightActionResponse
+from src.models.schemas import DocumentListAdapter, DocumentSectionListAdapter, DocumentResponse, DocumentCreate, TimeTrackingRequest, DocumentLinkCreate, DocumentQuizGenerateRequest, DocumentQuizSessionCreate, DocumentQuizSessionResponse, DocumentQuizGradeRequest, DocumentQuizGradeResponse, DocumentStudySettingsPayload, DocumentStudySettingsResponse, DocumentQuizStatsResponse, DocumentQuizItem as DocumentQuizItemResponse, LLMConfig, DocumentSectionResponse, DocumentSectionUpdate, DocumentQualityResponse, IngestionJobResponse, MarkdownExportResponse, MarkdownSaveRequest, ExercisePreviewRequest, ExerciseCandidate, ExerciseCreateRequest, DocumentQuizBatchGradeResponse, DocumentQuizBatchGradeItem, HighlightActionRequest, HighlightActionResponse
 from src.services.time_tracking_service import TimeTrackingService
 from src.ingestion.document_processor import DocumentProcessor
 from src.ingestion.ingestion_engine import IngestionEngine
@@ -45,6 +45,8 @@ from src.services.web_extractor import extract_web_content
 from src.queue.ingestion_queue import enqueue_extraction, enqueue_ingestion
 from src.services.ingestion_orchestrator import schedule_extraction, schedule_ingestion
 from src.services.model_limits import recommend_extraction_settings
+from src.utils.request_body import json_body, json_body_openapi
+from src.utils.responses import PydanticORJSONResponse, list_response, model_response
 
 router = APIRouter(prefix="/api/documents", tags=["documents"])
 
@@ -1142,7 +1144,7 @@ async def ingest_link(
         raise HTTPException(status_code=500, detail=f"Link ingestion failed: {str(e)}")
 
 
-@router.get("", response_model=List[DocumentResponse])
+@router.get("", response_model=List[DocumentResponse], response_class=PydanticORJSONResponse)
 def get_documents(
     folder_id: Optional[str] = None,
     tag: Optional[str] = None,
@@ -1172,10 +1174,10 @@ def get_documents(
                 isinstance(t, str) and t.strip().lower() == normalized_tag for t in d.tags
             )
         ]
-    return _attach_ingestion_errors(db, documents, user_id=user_id)
+    return list_response(DocumentListAdapter, _attach_ingestion_errors(db, documents, user_id=user_id))
 
 
-@router.get("/{document_id}", response_model=DocumentResponse)
+@router.get("/{document_id}", response_model=DocumentResponse, response_class=PydanticORJSONResponse)
 def get_document(
     document_id: int,
     db: Session = Depends(get_db),
@@ -1188,10 +1190,10 @@ def get_document(
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     enriched = _attach_ingestion_errors(db, [document], user_id=user_id)
-    return enriched[0] if enriched else document
+    return model_response(enriched[0] if enriched else DocumentResponse.model_validate(document))
 
 
-@router.get("/{document_id}/sections", response_model=List[DocumentSectionResponse])
+@router.get("/{document_id}/sections", response_model=List[DocumentSectionResponse], response_class=PydanticORJSONResponse)
 def get_document_sections(
     document_id: int,
     include_all: bool = True,
@@ -1205,7 +1207,7 @@ def get_document_sections(
     if not include_all:
         query = query.filter(DocumentSection.included == True)
     sections = query.order_by(DocumentSection.section_index.asc()).all()
-    return sections
+    return list_response(DocumentSectionListAdapter, sections)
 
 
 @router.patch("/{document_id}/sections/{section_id}", response_model=DocumentSectionResponse)
@@ -1369,10 +1371,10 @@ def save_document_markdown(
     return document
 
 
-@router.put("/{document_id}", response_model=DocumentResponse)
+@router.put("/{document_id}", response_model=DocumentResponse, openapi_extra=json_body_openapi(DocumentCreate))
 def update_document(
     document_id: int,
-    document_base: DocumentCreate,
+    document_base: DocumentCreate = Depends(json_body(DocumentCreate)),
     db: Session = Depends(get_db)
 ):
     """
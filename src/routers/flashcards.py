@@ -12,14 +12,15 @@ from src.utils.time import utcnow
 from src.database.orm import get_db
 from src.models.orm import Flashcard, Document
 from src.database.graph_storage import graph_storage
-from src.models.schemas import FlashcardCreate, FlashcardResponse, FlashcardUpdate
+from src.models.schemas import FlashcardCreate, FlashcardListAdapter, FlashcardResponse, FlashcardUpdate
+from src.utils.request_body import json_body, json_body_openapi
+from src.utils.responses import PydanticORJSONResponse, fast_from_orm, list_response, model_response
 
 router = APIRouter(prefix="/api/flashcards", tags=["flashcards"])
 
-
-@router.post("/", response_model=FlashcardResponse)
+@router.post("/", response_model=FlashcardResponse, openapi_extra=json_body_openapi(FlashcardCreate))
 def create_flashcard(
-    flashcard: FlashcardCreate,
+    flashcard: FlashcardCreate = Depends(json_body(FlashcardCreate)),
     db: Session = Depends(get_db)
 ):
     """
@@ -74,7 +75,7 @@ def create_flashcard(
     return db_flashcard
 
 
-@router.get("/", response_model=List[FlashcardResponse])
+@router.get("/", response_model=List[FlashcardResponse], response_class=PydanticORJSONResponse)
 def get_flashcards(
     skip: int = 0,
     limit: int = 100,
@@ -99,10 +100,10 @@ def get_flashcards(
         query = query.filter(Flashcard.tags.contains([tag]))
     
     flashcards = query.offset(skip).limit(limit).all()
-    return flashcards
+    return list_response(FlashcardListAdapter, flashcards)
 
 
-@router.get("/due", response_model=List[FlashcardResponse])
+@router.get("/due", response_model=List[FlashcardResponse], response_class=PydanticORJSONResponse)
 def get_due_flashcards(
     limit: int = 50,
     interleave: bool = False,
@@ -124,12 +125,12 @@ def get_due_flashcards(
         query = query.filter(Flashcard.tags.contains([tag]))
 
     if not interleave:
-        return query.order_by(Flashcard.next_review).limit(limit).all()
+        return list_response(FlashcardListAdapter, query.order_by(Flashcard.next_review).limit(limit).all())
 
     fetch_limit = max(limit * 4, 50)
     cards = query.order_by(Flashcard.next_review).limit(fetch_limit).all()
     if not cards:
-        return []
+        return list_response(FlashcardListAdapter, [])
 
     # Group cards
     groups = {}
@@ -155,10 +156,10 @@ def get_due_flashcards(
                 new_keys.append(key)
         group_keys = new_keys
 
-    return result
+    return list_response(FlashcardListAdapter, result)
 
 
-@router.get("/{flashcard_id}", response_model=FlashcardResponse)
+@router.get("/{flashcard_id}", response_model=FlashcardResponse, response_class=PydanticORJSONResponse)
 def get_flashcard(flashcard_id: str, db: Session = Depends(get_db)):
     """
     Retrieves a single flashcard by its ID.
@@ -168,7 +169,7 @@ def get_flashcard(flashcard_id: str, db: Session = Depends(get_db)):
     if not flashcard:
         raise HTTPException(status_code=404, detail="Flashcard not found")
     
-    return flashcard
+    return model_response(fast_from_orm(FlashcardResponse, flashcard))
 
 
 @router.put("/{flashcard_id}", response_model=FlashcardResponse)
@@ -17,9 +17,10 @@ from src.dependencies import get_request_user_id
 from src.models.orm import Goal, FocusSession, DailyPlanEntry, AgentEmailMessage
 from src.models.schemas import (
     GoalCreate, GoalUpdate, GoalResponse,
-    FocusSessionCreate, FocusSessionEnd, FocusSessionResponse,
+    FocusSessionCreate, FocusSessionEnd, FocusSessionResponse, FocusSessionListAdapter,
     DailyPlanResponse, DailyPlanEntryUpdate, DailyPlanEntryCreate, DailyPlanHistoryResponse
 )
+from src.utils.responses import PydanticORJSONResponse, list_response, model_response
 
 router = APIRouter(prefix="/api/goals", tags=["goals"])
 
@@ -115,7 +116,7 @@ def create_daily_plan_entry(
     }
 
 
-@router.get("/daily-plan/history", response_model=DailyPlanHistoryResponse)
+@router.get("/daily-plan/history", response_model=DailyPlanHistoryResponse, response_class=PydanticORJSONResponse)
 def get_daily_plan_history(
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
@@ -132,7 +133,7 @@ def get_daily_plan_history(
         query = query.filter(DailyPlanEntry.completed == completed)
 
     entries = query.order_by(DailyPlanEntry.date.desc(), DailyPlanEntry.created_at.desc()).all()
-    return {
+    return model_response(DailyPlanHistoryResponse.model_validate({
         "items": [
             {
                 "id": e.id,
@@ -146,7 +147,7 @@ def get_daily_plan_history(
                 "completed_at": e.completed_at
             } for e in entries
         ]
-    }
+    }))
 
 
 @router.get("/{goal_id}", response_model=GoalResponse)
@@ -254,7 +255,7 @@ def end_focus_session(
     return session
 
 
-@router.get("/{goal_id}/sessions", response_model=List[FocusSessionResponse])
+@router.get("/{goal_id}/sessions", response_model=List[FocusSessionResponse], response_class=PydanticORJSONResponse)
 def get_goal_sessions(
     goal_id: str,
     limit: int = 20,
@@ -271,7 +272,7 @@ def get_goal_sessions(
         .order_by(FocusSession.start_time.desc())\
         .limit(limit)\
         .all()
-    return sessions
+    return list_response(FocusSessionListAdapter, sessions)
 
 
 def _enrich_goal_response(goal: Goal) -> GoalResponse:
@@ -12,7 +12,7 @@ import asyncio
 import json
 import os
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import List, Optional, Dict, Any
 
 from src.database.graph_storage import multi_doc_graph_storage
@@ -35,6 +35,7 @@ from src.services.knowledge_graph_service import KnowledgeGraphService
 from src.dependencies import get_ingestion_engine, get_request_user_id
 from src.services.llm_service import llm_service
 from src.ingestion.vector_storage import EmbeddingDimensionMismatchError
+from src.utils.responses import MsgPackResponse, PydanticORJSONResponse, wants_msgpack
 
 logger = logging.getLogger(__name__)
 
@@ -114,6 +115,8 @@ async def get_document_path_preview(
 ):
     """
     Get a learning path preview within a document.
+
+    Depths above MAX_PREVIEW_DEPTH are accepted and clamped by the engine.
     """
     try:
         path = multi_doc_navigation.get_document_path_preview(
@@ -402,9 +405,15 @@ async def build_graph(
     return _to_response(graph)
 
 
-@router.get("/{graph_id}/data", response_model=KnowledgeGraphDataResponse)
+@router.get(
+    "/{graph_id}/data",
+    response_model=KnowledgeGraphDataResponse,
+    response_class=PydanticORJSONResponse,
+    responses={200: {"content": {MsgPackResponse.media_type: {}}}},
+)
 async def get_graph_data(
     graph_id: str,
+    request: Request,
     include_connections: bool = True,
     target_graph_id: Optional[str] = None,
     db: Session = Depends(get_db)
@@ -413,15 +422,12 @@ async def get_graph_data(
     if not graph:
         raise HTTPException(status_code=404, detail="Graph not found")
 
+    # Large graphs: encode the service dicts directly; the model only documents the shape.
+    # Clients sending ``Accept: application/msgpack`` get the same payload as MessagePack.
     data = KnowledgeGraphService.get_graph_data(graph, include_connections=include_connections, target_graph_id=target_graph_id)
-    return KnowledgeGraphDataResponse(
-        graph_id=graph.id,
-        nodes=data["nodes"],
-        links=data["links"],
-        node_count=data["node_count"],
-        relationship_count=data["relationship_count"],
-        graph_meta=data["graph_meta"]
-    )
+    if wants_msgpack(request):
+        return MsgPackResponse(content=data)
+    return PydanticORJSONResponse(content=data)
 
 
 @router.post("/{graph_id}/connections/suggest")
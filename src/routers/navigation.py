@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List
-from src.navigation.navigation_engine import NavigationEngine
+from src.navigation.navigation_engine import MAX_PREVIEW_DEPTH, NavigationEngine
 from src.navigation.user_tracker import UserProgressTracker
 from src.path_resolution.path_resolver import PathResolver
 from src.path_resolution.content_retriever import ContentRetriever
@@ -16,7 +16,16 @@ async def get_root_concepts(
     navigation_engine: NavigationEngine = Depends(get_navigation_engine)
 ):
     """Get all concepts with no prerequisites."""
-    return navigation_engine.find_root_concepts()
+    return await navigation_engine.a_find_root_concepts()
+
+
+@router.get("/concepts/roots/previews", summary="Get path previews for every root concept")
+def get_root_path_previews(
+    depth: int = Query(3, ge=1, le=MAX_PREVIEW_DEPTH),
+    navigation_engine: NavigationEngine = Depends(get_navigation_engine)
+):
+    """Get each root concept's path preview in one call, keyed by root name."""
+    return navigation_engine.get_all_path_previews(depth)
 
 
 @router.get("/concepts/unlocked/{user_id}", summary="Get unlocked concepts for user", response_model=List[str])
@@ -25,11 +34,11 @@ async def get_unlocked_concepts(
     navigation_engine: NavigationEngine = Depends(get_navigation_engine)
 ):
     """Get concepts available for the user to start."""
-    return navigation_engine.get_unlocked_concepts(user_id)
+    return await navigation_engine.a_get_unlocked_concepts(user_id)
 
 
 @router.get("/concepts/neighborhood/{concept_name}", summary="Get concept neighborhood")
-async def get_concept_neighborhood(
+def get_concept_neighborhood(
     concept_name: str,
     navigation_engine: NavigationEngine = Depends(get_navigation_engine)
 ):
@@ -37,13 +46,22 @@ async def get_concept_neighborhood(
     return navigation_engine.get_neighborhood(concept_name)
 
 
+@router.get("/concepts/neighborhoods", summary="Get several concept neighborhoods")
+def get_concept_neighborhoods(
+    names: List[str] = Query(...),
+    navigation_engine: NavigationEngine = Depends(get_navigation_engine)
+):
+    """Get neighborhoods for several concepts at once, keyed by concept name."""
+    return navigation_engine.get_neighborhoods_batch(names)
+
+
 @router.get("/concepts/graph", summary="Get full concept graph")
 async def get_concept_graph(
     user_id: str = Query("default_user"),
     navigation_engine: NavigationEngine = Depends(get_navigation_engine)
 ):
     """Get the entire concept graph including all nodes and prerequisite relationships."""
-    return navigation_engine.get_full_graph(user_id=user_id)
+    return await navigation_engine.a_get_full_graph(user_id=user_id)
 
 
 # --- Content Retrieval Endpoints ---
@@ -74,7 +92,7 @@ async def get_lesson_content(
         raise HTTPException(status_code=404, detail="No content found for learning path")
         
     # 2. Get user state for Knowledge Pruning
-    user_state = user_tracker.get_user_state(user_id)
+    user_state = await user_tracker.a_get_user_state(user_id)
     completed_concepts = user_state.completed_concepts if user_state else []
     
     # 3. Retrieve formatted content with flashcards + Mastery Pruning
@@ -93,6 +111,18 @@ async def get_lesson_content(
     }
 
 
+@router.delete("/learning/lessons/cache", summary="Clear cached lessons")
+def clear_lesson_cache(
+    content_retriever: ContentRetriever = Depends(get_content_retriever)
+):
+    """Drop cached lessons so the next request regenerates them."""
+    try:
+        deleted = content_retriever.clear_cached_lessons()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to clear lesson cache: {e}")
+    return {"deleted": deleted}
+
+
 @router.get("/learning/path-preview", summary="Get learning path preview for map")
 async def get_path_preview(
     user_id: str, 
@@ -145,7 +175,7 @@ async def get_user_progress(
     user_tracker: UserProgressTracker = Depends(get_user_tracker)
 ):
     """Get user's completed, in-progress, and available concepts."""
-    state = user_tracker.get_user_state(user_id)
+    state = await user_tracker.a_get_user_state(user_id)
     if not state:
         raise HTTPException(status_code=404, detail="User not found")
         
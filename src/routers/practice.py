@@ -20,11 +20,12 @@ from src.models.schemas import (
 )
 from src.services.practice_engine_service import practice_engine_service
 from src.dependencies import get_request_user_id
+from src.utils.responses import PydanticORJSONResponse, fast_from_orm, model_response
 
 router = APIRouter(prefix="/api/practice", tags=["practice"])
 
 
-@router.post("/session", response_model=PracticeSessionStartResponse)
+@router.post("/session", response_model=PracticeSessionStartResponse, response_class=PydanticORJSONResponse)
 def create_practice_session(
     payload: PracticeSessionCreate,
     user_id: str = Depends(get_request_user_id),
@@ -43,13 +44,14 @@ def create_practice_session(
     except ValueError as e:
         raise HTTPException(status_code=409, detail=str(e))
 
-    items = [PracticeSessionItem.model_validate(i) for i in comp.items]
-    return PracticeSessionStartResponse(
+    # Rows were just written by the engine: copy them without re-validating
+    items = [fast_from_orm(PracticeSessionItem, i) for i in comp.items]
+    return model_response(PracticeSessionStartResponse.model_construct(
         session_id=comp.session.id,
         target_duration_minutes=comp.session.target_duration_minutes,
         items=items,
         source_mix=comp.source_mix,
-    )
+    ))
 
 
 @router.post("/session/{session_id}/item", response_model=PracticeItemResult)
@@ -106,7 +108,7 @@ def end_practice_session(session_id: str, payload: PracticeSessionEnd, db: Sessi
     )
 
 
-@router.get("/history", response_model=PracticeHistoryResponse)
+@router.get("/history", response_model=PracticeHistoryResponse, response_class=PydanticORJSONResponse)
 def get_practice_history(
     limit: int = 20,
     user_id: str = Depends(get_request_user_id),
@@ -130,5 +132,5 @@ def get_practice_history(
             items_completed=stats.get("items_completed", 0),
             average_score=stats.get("average_score", 0.0),
         ))
-    return PracticeHistoryResponse(items=items)
+    return model_response(PracticeHistoryResponse(items=items))
 
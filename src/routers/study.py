@@ -15,11 +15,14 @@ from src.models.orm import StudySession, StudyReview, Flashcard
 from src.models.schemas import (
     StudyReviewCreate, 
     StudySessionResponse, 
+    StudySessionListAdapter,
     FlashcardResponse,
     StudySessionCreate,
     StudySessionEnd
 )
 from src.services.srs_service import SRSService
+from src.utils.request_body import json_body, json_body_openapi
+from src.utils.responses import PydanticORJSONResponse, list_response
 
 router = APIRouter(prefix="/api/study", tags=["study"])
 srs_service = SRSService()
@@ -49,10 +52,10 @@ def start_study_session(
     return session
 
 
-@router.post("/session/{session_id}/review")
+@router.post("/session/{session_id}/review", openapi_extra=json_body_openapi(StudyReviewCreate))
 def submit_review(
     session_id: str,
-    review: StudyReviewCreate,
+    review: StudyReviewCreate = Depends(json_body(StudyReviewCreate)),
     db: Session = Depends(get_db),
     user_id: str = Depends(get_request_user_id)
 ):
@@ -98,21 +101,10 @@ def submit_review(
     target_retention = user_settings.target_retention if user_settings else 0.9
     
     # Calculate new SRS parameters with user's target retention
-    new_ease_factor, new_interval, new_repetitions, next_review_date = srs_service.calculate_next_review(
-        ease_factor=flashcard.ease_factor,
-        interval=flashcard.interval,
-        repetitions=flashcard.repetitions,
-        rating=review.rating,
-        target_retention=target_retention
-    )
+    new_state = srs_service.review(flashcard, review.rating, target_retention=target_retention)
 
-    
     # Update flashcard
-    flashcard.ease_factor = new_ease_factor
-    flashcard.interval = new_interval
-    flashcard.repetitions = new_repetitions
-    flashcard.next_review = next_review_date
-    flashcard.last_review = utcnow()
+    srs_service.apply(flashcard, new_state)
     
     # Create review record
     study_review = StudyReview(
@@ -134,9 +126,9 @@ def submit_review(
     
     return {
         "message": "Review submitted successfully",
-        "next_review": next_review_date,
-        "interval_days": new_interval,
-        "ease_factor": new_ease_factor
+        "next_review": new_state.next_review,
+        "interval_days": new_state.interval,
+        "ease_factor": new_state.ease_factor
     }
 
 
@@ -175,7 +167,7 @@ def end_study_session(
     return session
 
 
-@router.get("/sessions", response_model=List[StudySessionResponse])
+@router.get("/sessions", response_model=List[StudySessionResponse], response_class=PydanticORJSONResponse)
 def get_study_sessions(
     skip: int = 0,
     limit: int = 20,
@@ -190,7 +182,7 @@ def get_study_sessions(
         .limit(limit)\
         .all()
     
-    return sessions
+    return list_response(StudySessionListAdapter, sessions)
 
 
 @router.get("/upcoming")
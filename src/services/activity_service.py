@@ -3,6 +3,7 @@ Activity Service for tracking user actions.
 Logs events like document views, flashcard creation, and study sessions 
 to be displayed in the application's 'Memory' feed.
 """
+from sqlalchemy import BigInteger, cast, extract
 from sqlalchemy.orm import Session
 from src.models.orm import ActivityLog
 from datetime import datetime
@@ -50,12 +51,27 @@ class ActivityService:
     def get_recent_activity(db: Session, limit: int = 10):
         """
         Retrieves the most recent activities, sorted by timestamp descending.
-        
+
+        The timestamp is computed in SQL as Unix epoch milliseconds, matching
+        ``ActivityLogResponse`` without building ``datetime`` objects.
+
         Args:
             db (Session): Database session.
             limit (int): Maximum number of entries to return (default: 10).
-            
+
         Returns:
-            List[ActivityLog]: List of recent activity records.
+            List[Row]: Activity rows with ActivityLog's columns and an integer ``timestamp``.
         """
-        return db.query(ActivityLog).order_by(ActivityLog.timestamp.desc()).limit(limit).all()
+        return (
+            db.query(
+                ActivityLog.id,
+                ActivityLog.activity_type,
+                ActivityLog.description,
+                cast(extract("epoch", ActivityLog.timestamp) * 1000, BigInteger).label("timestamp"),
+                ActivityLog.document_id,
+                ActivityLog.extra_data,
+            )
+            .order_by(ActivityLog.timestamp.desc())
+            .limit(limit)
+            .all()
+        )
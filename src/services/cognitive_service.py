@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 class CognitiveService:
     def __init__(self):
-        self.nav = NavigationEngine()
+        self.nav = NavigationEngine.instance()
 
     def _parse_bedtime_offset(self, bedtime: str) -> int:
         try:
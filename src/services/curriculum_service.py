@@ -529,8 +529,7 @@ class CurriculumService:
         try:
             week = checkpoint.week
             if week and week.curriculum:
-                for concept in week.focus_concepts or []:
-                    self.user_tracker.mark_completed(week.curriculum.user_id, concept)
+                self.user_tracker.mark_completed_bulk(week.curriculum.user_id, week.focus_concepts or [])
         except Exception:
             pass
         return checkpoint
@@ -588,8 +587,7 @@ class CurriculumService:
         if curriculum and task.status == "done":
             try:
                 concepts = self._task_concepts(task, week) if week else []
-                for concept in concepts:
-                    self.user_tracker.mark_in_progress(curriculum.user_id, concept)
+                self.user_tracker.mark_in_progress_bulk(curriculum.user_id, concepts)
             except Exception:
                 pass
         return task
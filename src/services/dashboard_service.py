@@ -169,8 +169,9 @@ class DashboardService:
 
         # Daily plan (may create if missing)
         plan_data = daily_plan_service.build_daily_plan(db, user_id)
+        # Plan dicts are built by daily_plan_service, so skip per-item validation
         plan_items = [
-            DashboardPlanItem(
+            DashboardPlanItem.model_construct(
                 id=item["id"],
                 title=item["title"],
                 item_type=item["item_type"],
@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 
 from src.models.orm import KnowledgeGraph, KnowledgeGraphDocument, Document, UserSettings
-from src.models.schemas import LLMConfig
+from src.models.schemas import KnowledgeGraphData, LLMConfig
 from src.database.graph_storage import multi_doc_graph_storage
 from src.ingestion.ingestion_engine import IngestionEngine
 from src.ingestion.vector_storage import EmbeddingDimensionMismatchError
@@ -411,7 +411,7 @@ class KnowledgeGraphService:
         graph: KnowledgeGraph,
         include_connections: bool = True,
         target_graph_id: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> KnowledgeGraphData:
         doc_ids = [gd.document_id for gd in graph.documents]
         nodes: List[Dict[str, Any]] = []
         links: List[Dict[str, Any]] = []
@@ -452,6 +452,7 @@ class KnowledgeGraphService:
                 })
 
         return {
+            "graph_id": graph.id,
             "nodes": nodes,
             "links": links,
             "node_count": len(nodes),
@@ -8,6 +8,7 @@ Handles:
 import logging
 from typing import Optional, List, Any, Dict
 from datetime import datetime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from src.utils.time import utcnow
 from src.database.connections import postgres_conn
 from src.ingestion.vector_storage import VectorStorage
@@ -44,14 +45,15 @@ class MemoryService:
         """Set or update a structured memory value."""
         session = SessionLocal()
         try:
-            memory = session.query(AgentMemory).filter_by(user_id=user_id, key=key).first()
-            if memory:
-                memory.value = value
-                memory.category = category
-                memory.updated_at = utcnow()
-            else:
-                memory = AgentMemory(user_id=user_id, key=key, value=value, category=category)
-                session.add(memory)
+            now = utcnow()
+            stmt = pg_insert(AgentMemory).values(
+                user_id=user_id, key=key, value=value, category=category, updated_at=now
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[AgentMemory.user_id, AgentMemory.key],
+                set_={"value": stmt.excluded.value, "category": stmt.excluded.category, "updated_at": now},
+            )
+            session.execute(stmt)
             session.commit()
         except Exception as e:
             logger.error(f"Error setting memory {key}: {e}")
@@ -4,10 +4,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from src.utils.time import utcnow
 import asyncio
-import math
 import re
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from sqlalchemy.orm import Session
 
 from src.models.orm import Flashcard, Curriculum, CurriculumWeek, CurriculumTask, PracticeSession, PracticeItem, UserSettings
@@ -235,18 +235,11 @@ class PracticeEngineService:
             flashcard = db.query(Flashcard).filter(Flashcard.id == item.source_id).first()
             if flashcard:
                 from src.models.orm import StudyReview
-                new_ease, new_interval, new_reps, next_review_date = self.srs.calculate_next_review(
-                    ease_factor=flashcard.ease_factor,
-                    interval=flashcard.interval,
-                    repetitions=flashcard.repetitions,
-                    rating=rating,
+                self.srs.apply(flashcard, self.srs.review(
+                    flashcard,
+                    rating,
                     target_retention=_get_target_retention(db, item.session.user_id),
-                )
-                flashcard.ease_factor = new_ease
-                flashcard.interval = new_interval
-                flashcard.repetitions = new_reps
-                flashcard.next_review = next_review_date
-                flashcard.last_review = utcnow()
+                ))
                 review = StudyReview(
                     session_id=None,
                     flashcard_id=flashcard.id,
@@ -318,12 +311,14 @@ def _cosine_similarity(a: List[float], b: List[float]) -> float:
         return 0.0
     if len(a) != len(b):
         return 0.0
-    dot = sum(x * y for x, y in zip(a, b))
-    mag_a = math.sqrt(sum(x * x for x in a))
-    mag_b = math.sqrt(sum(y * y for y in b))
+    # One contiguous float32 buffer per side instead of per-element Python floats
+    vec_a = np.asarray(a, dtype=np.float32)
+    vec_b = np.asarray(b, dtype=np.float32)
+    mag_a = float(np.linalg.norm(vec_a))
+    mag_b = float(np.linalg.norm(vec_b))
     if mag_a == 0 or mag_b == 0:
         return 0.0
-    return max(0.0, min(1.0, dot / (mag_a * mag_b)))
+    return max(0.0, min(1.0, float(np.dot(vec_a, vec_b)) / (mag_a * mag_b)))
 
 
 def _semantic_score(expected: str, response: str) -> float:
@@ -3,9 +3,12 @@ Spaced Repetition System (SRS) service.
 Implements the SM-2 algorithm with optional retention rate adjustment for FSRS-like behavior.
 """
 from datetime import datetime, timedelta
-from typing import Tuple
+from typing import Any, Tuple
 import math
 
+from src.models.schemas import SRSState
+from src.utils.time import utcnow
+
 
 class SRSService:
     """
@@ -96,6 +99,43 @@ class SRSService:
         return new_ease_factor, new_interval, new_repetitions, next_review_date
 
     
+    @classmethod
+    def review(cls, card: Any, rating: int, target_retention: float = 0.9) -> SRSState:
+        """
+        Computes the post-review SRS state for a flashcard.
+
+        Args:
+            card: Any object exposing the SRS attributes (ORM row or FlashcardResponse).
+            rating (int): User-reported recall quality (0-5).
+            target_retention (float): Desired retention rate (0.7-0.97).
+
+        Returns:
+            SRSState: The new scheduling state, with last_review set to now.
+        """
+        ease_factor, interval, repetitions, next_review = cls.calculate_next_review(
+            ease_factor=card.ease_factor,
+            interval=card.interval,
+            repetitions=card.repetitions,
+            rating=rating,
+            target_retention=target_retention
+        )
+        return SRSState(
+            ease_factor=ease_factor,
+            interval=interval,
+            repetitions=repetitions,
+            next_review=next_review,
+            last_review=utcnow()
+        )
+
+    @staticmethod
+    def apply(card: Any, state: SRSState) -> None:
+        """Writes an SRSState back onto a flashcard row."""
+        card.ease_factor = state.ease_factor
+        card.interval = state.interval
+        card.repetitions = state.repetitions
+        card.next_review = state.next_review
+        card.last_review = state.last_review
+
     @staticmethod
     def get_rating_label(rating: int) -> str:
         """
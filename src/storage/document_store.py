@@ -250,7 +250,9 @@ class DocumentStore:
         # 1. Delete from Knowledge Graph (Neo4j)
         try:
             from src.database.graph_storage import graph_storage
+            from src.navigation.navigation_engine import NavigationEngine
             graph_storage.remove_document_provenance(doc_id)
+            NavigationEngine.invalidate_roots()
         except Exception as e:
             logger.error(f"Failed to cleanup graph for document {doc_id}: {e}")
             
@@ -0,0 +1,63 @@
+"""Request-body dependencies that validate raw JSON bytes in one pydantic-core pass."""
+
+from typing import Any, Callable, Dict, Type, Union
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+
+def json_body(schema: Union[Type[BaseModel], TypeAdapter]) -> Callable[[Request], Any]:
+    """
+    Build a dependency that parses and validates the request body directly from bytes.
+
+    FastAPI's default body handling decodes JSON into a dict before validating it;
+    ``model_validate_json`` / ``TypeAdapter.validate_json`` skip that intermediate
+    Python object. Pass a model class for object bodies or a module-level
+    ``TypeAdapter`` for array bodies. Validation errors surface as the usual 422.
+    """
+    if isinstance(schema, TypeAdapter):
+        validate = schema.validate_json
+    else:
+        validate = schema.model_validate_json
+
+    async def _dependency(request: Request) -> Any:
+        try:
+            return validate(await request.body())
+        except ValidationError as exc:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+            ) from exc
+
+    return _dependency
+
+
+def json_body_openapi(schema: Union[Type[BaseModel], TypeAdapter]) -> Dict[str, Any]:
+    """
+    Build the ``openapi_extra`` that documents a ``json_body`` request body.
+
+    FastAPI only documents bodies it parses itself, so routes using ``json_body``
+    pass this to keep their ``requestBody`` in the OpenAPI document. Nested
+    ``$defs`` are inlined so the schema does not depend on other routes
+    registering the same components.
+    """
+    adapter = schema if isinstance(schema, TypeAdapter) else TypeAdapter(schema)
+    body_schema = adapter.json_schema()
+    defs = body_schema.pop("$defs", {})
+
+    def _inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith("#/$defs/"):
+                return _inline(defs[ref[len("#/$defs/"):]])
+            return {key: _inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [_inline(item) for item in node]
+        return node
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline(body_schema)}},
+        }
+    }
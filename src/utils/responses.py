@@ -0,0 +1,115 @@
+"""orjson/ormsgpack-backed responses that bypass FastAPI's jsonable_encoder."""
+
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Type, TypeVar
+
+import orjson
+import ormsgpack
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_MISSING = object()
+
+
+def fast_from_orm(model: Type[ModelT], row: Any) -> ModelT:
+    """
+    Build ``model`` from an ORM row, skipping validation for trusted schemas.
+
+    Schemas opt in with ``_TRUSTED: ClassVar[bool] = True``: flat DTOs whose
+    rows were validated on write and have no constraints or converting
+    validators on the read path. Attributes missing on the row fall back to the
+    schema default. Any other schema is validated normally.
+    """
+    if not getattr(model, "_TRUSTED", False):
+        return model.model_validate(row, from_attributes=True)
+    values = {}
+    for name in model.model_fields:
+        value = getattr(row, name, _MISSING)
+        if value is not _MISSING:
+            values[name] = value
+    return model.model_construct(**values)
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    Shared fallback encoder for values orjson does not handle natively.
+
+    Covers the types our schemas actually carry so responses never need
+    FastAPI's reflective ``jsonable_encoder`` walk.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, date):
+        # datetime/date subclasses that orjson refuses to serialize directly
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        # Matches pydantic's JSON encoding of Decimal
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class PydanticORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Accepts either plain JSON-compatible content or bytes that were already
+    encoded by pydantic-core (e.g. ``TypeAdapter.dump_json``).
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(
+            content,
+            default=orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z,
+        )
+
+
+class MsgPackResponse(Response):
+    """
+    MessagePack response rendered with ormsgpack.
+
+    Same content contract as ``PydanticORJSONResponse``: plain data (models
+    and other non-native values go through ``orjson_default``) or bytes that
+    are already encoded.
+    """
+    media_type = "application/msgpack"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return ormsgpack.packb(
+            content,
+            default=orjson_default,
+            option=ormsgpack.OPT_NON_STR_KEYS | ormsgpack.OPT_SERIALIZE_NUMPY | ormsgpack.OPT_UTC_Z,
+        )
+
+
+def wants_msgpack(request: Request) -> bool:
+    """True when the client explicitly asks for MessagePack via ``Accept``."""
+    return MsgPackResponse.media_type in request.headers.get("accept", "")
+
+
+def model_response(model: BaseModel) -> PydanticORJSONResponse:
+    """Serialize a single response model without FastAPI re-validating it."""
+    return PydanticORJSONResponse(content=model.model_dump(mode="json"))
+
+
+def list_response(adapter: TypeAdapter, items: Iterable[Any]) -> PydanticORJSONResponse:
+    """Validate ORM rows (or models) once and encode them straight to JSON bytes."""
+    return PydanticORJSONResponse(
+        content=adapter.dump_json(adapter.validate_python(items, from_attributes=True))
+    )
+
@@ -2,12 +2,27 @@
 Tests for Content Retriever ordering and generation behavior.
 """
 
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
 import pytest
 
+from src.path_resolution import content_retriever
 from src.path_resolution.content_retriever import ContentRetriever
 from src.models.schemas import LearningChunk
 
 
+@pytest.fixture(autouse=True)
+def _empty_lesson_caches():
+    """Every test starts without in-process cached or in-flight lessons."""
+    content_retriever._lesson_cache.clear()
+    content_retriever._inflight_lessons.clear()
+    yield
+    content_retriever._lesson_cache.clear()
+    content_retriever._inflight_lessons.clear()
+
+
 @pytest.mark.asyncio
 async def test_content_ordering():
     """
@@ -16,25 +31,28 @@ async def test_content_ordering():
     retriever = ContentRetriever()
     concepts = ["alpha", "beta", "gamma"]
 
-    original_retrieve = retriever.retrieve_chunks_by_concept
+    original_retrieve = retriever.retrieve_chunks_by_concepts
     original_cached = retriever._get_cached_lesson
     original_cache = retriever._cache_lesson
     original_rewrite = retriever._rewrite_with_llm
 
-    def mock_retrieve(concept):
-        return [
-            LearningChunk(
-                id=1,
-                doc_source="test.md",
-                content=f"Content for {concept}",
-                concept_tag=concept,
-            )
-        ]
+    def mock_retrieve(concepts):
+        return {
+            concept: [
+                LearningChunk(
+                    id=1,
+                    doc_source="test.md",
+                    content=f"Content for {concept}",
+                    concept_tag=concept,
+                )
+            ]
+            for concept in concepts
+        }
 
     async def mock_rewrite(target_concept, time_budget, raw_content, completed_concepts=None):
         return raw_content
 
-    retriever.retrieve_chunks_by_concept = mock_retrieve
+    retriever.retrieve_chunks_by_concepts = mock_retrieve
     retriever._get_cached_lesson = lambda *args, **kwargs: None
     retriever._cache_lesson = lambda *args, **kwargs: None
     retriever._rewrite_with_llm = mock_rewrite
@@ -50,7 +68,7 @@ async def test_content_ordering():
             assert idx > last_index, f"Marker for {concept} out of order"
             last_index = idx
     finally:
-        retriever.retrieve_chunks_by_concept = original_retrieve
+        retriever.retrieve_chunks_by_concepts = original_retrieve
         retriever._get_cached_lesson = original_cached
         retriever._cache_lesson = original_cache
         retriever._rewrite_with_llm = original_rewrite
@@ -64,12 +82,12 @@ async def test_lesson_generation_fallback():
     retriever = ContentRetriever()
     concepts = ["alpha", "beta"]
 
-    original_retrieve = retriever.retrieve_chunks_by_concept
+    original_retrieve = retriever.retrieve_chunks_by_concepts
     original_cached = retriever._get_cached_lesson
     original_cache = retriever._cache_lesson
     original_generate = retriever._generate_lesson_from_scratch
 
-    retriever.retrieve_chunks_by_concept = lambda concept: []
+    retriever.retrieve_chunks_by_concepts = lambda concepts: {concept: [] for concept in concepts}
     retriever._get_cached_lesson = lambda *args, **kwargs: None
     retriever._cache_lesson = lambda *args, **kwargs: None
 
@@ -86,7 +104,189 @@ async def test_lesson_generation_fallback():
         assert lesson == "LESSON"
         assert calls == [("beta", 25)]
     finally:
-        retriever.retrieve_chunks_by_concept = original_retrieve
+        retriever.retrieve_chunks_by_concepts = original_retrieve
         retriever._get_cached_lesson = original_cached
         retriever._cache_lesson = original_cache
-        retriever._generate_lesson_from_scratch = original_generate
\ No newline at end of file
+        retriever._generate_lesson_from_scratch = original_generate
+
+
+def test_cached_lesson_is_served_in_process_after_first_read():
+    retriever = ContentRetriever()
+    retriever.connection = MagicMock()
+    retriever.connection.execute_query.return_value = [{"content_markdown": "LESSON"}]
+
+    assert retriever._get_cached_lesson("Alpha", 30) == "LESSON"
+    assert retriever._get_cached_lesson("alpha", 30) == "LESSON"
+    retriever.connection.execute_query.assert_called_once()
+
+    content_retriever.clear_lesson_cache()
+    assert retriever._get_cached_lesson("alpha", 30) == "LESSON"
+    assert retriever.connection.execute_query.call_count == 2
+
+
+def test_cache_keys_are_lowercased_for_index_lookups():
+    retriever = ContentRetriever()
+    retriever.connection = MagicMock()
+    retriever.connection.execute_query.return_value = []
+
+    retriever._cache_lesson("Alpha Beta", 30, "LESSON")
+    content_retriever.clear_lesson_cache()
+    retriever._get_cached_lesson("ALPHA beta", 30)
+
+    insert_query, insert_params = retriever.connection.execute_query.call_args_list[0].args
+    assert "ON CONFLICT (concept_name, time_budget) DO NOTHING" in insert_query
+    select_params = retriever.connection.execute_query.call_args_list[1].args[1]
+    assert insert_params == ("alpha beta", 30, "LESSON")
+    assert select_params == ("alpha beta", 30)
+
+
+def test_retrieve_chunks_by_concepts_uses_one_query():
+    retriever = ContentRetriever()
+    retriever.connection = MagicMock()
+    retriever.connection.execute_query.return_value = [
+        {"id": 1, "doc_source": "a.md", "content": "A", "concept_tag": "Alpha", "created_at": None},
+        {"id": 2, "doc_source": "b.md", "content": "B", "concept_tag": "beta", "created_at": None},
+    ]
+
+    result = retriever.retrieve_chunks_by_concepts(["alpha", "Beta", "gamma"])
+
+    assert [c.content for c in result["alpha"]] == ["A"]
+    assert [c.content for c in result["Beta"]] == ["B"]
+    assert result["gamma"] == []
+    retriever.connection.execute_query.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lesson_requests_share_one_generation():
+    retriever = ContentRetriever()
+    retriever._get_cached_lesson = lambda *args, **kwargs: None
+    retriever._cache_lesson = MagicMock()
+    retriever.retrieve_chunks_by_concepts = lambda concepts: {concept: [] for concept in concepts}
+    calls = []
+
+    async def mock_generate(target_concept, time_budget):
+        calls.append(target_concept)
+        await asyncio.sleep(0.01)
+        return "LESSON"
+
+    retriever._generate_lesson_from_scratch = mock_generate
+
+    lessons = await asyncio.gather(
+        retriever.get_lesson_content(["alpha"], time_budget_minutes=20),
+        retriever.get_lesson_content(["Alpha"], time_budget_minutes=20),
+    )
+
+    assert lessons == ["LESSON", "LESSON"]
+    assert calls == ["alpha"]
+    retriever._cache_lesson.assert_called_once_with("alpha", 20, "LESSON")
+
+
+@pytest.mark.asyncio
+async def test_cold_lesson_is_rewritten_once():
+    retriever = ContentRetriever()
+    retriever._get_cached_lesson = lambda *args, **kwargs: None
+    retriever._cache_lesson = MagicMock()
+    retriever.retrieve_chunks_by_concepts = lambda concepts: {
+        concept: [LearningChunk(id=1, doc_source="a.md", content="A", concept_tag=concept)]
+        for concept in concepts
+    }
+    calls = []
+
+    async def mock_rewrite(target_concept, time_budget, raw_content, completed_concepts=None):
+        calls.append(target_concept)
+        return "LESSON"
+
+    retriever._rewrite_with_llm = mock_rewrite
+
+    assert await retriever.get_lesson_content(["alpha"], time_budget_minutes=15) == "LESSON"
+    assert calls == ["alpha"]
+    retriever._cache_lesson.assert_called_once_with("alpha", 15, "LESSON")
+
+
+@pytest.mark.asyncio
+async def test_generate_flashcards_strips_code_fence(monkeypatch):
+    retriever = ContentRetriever()
+
+    async def mock_completion(**kwargs):
+        return 'Here you go:\n```json\n{"flashcards": [{"front": "Q", "back": "A"}]}\n```\nEnjoy'
+
+    monkeypatch.setattr(content_retriever.llm_service, "get_chat_completion", mock_completion)
+
+    assert await retriever._generate_flashcards("lesson", 3) == [{"front": "Q", "back": "A"}]
+
+
+@pytest.mark.asyncio
+async def test_generate_flashcards_falls_back_to_tolerant_parser(monkeypatch):
+    retriever = ContentRetriever()
+
+    async def mock_completion(**kwargs):
+        return '{"flashcards": [{"front": "Q", "back": "A"},]}'
+
+    monkeypatch.setattr(content_retriever.llm_service, "get_chat_completion", mock_completion)
+
+    assert await retriever._generate_flashcards("lesson", 3) == [{"front": "Q", "back": "A"}]
+
+
+@pytest.mark.asyncio
+async def test_raw_content_sections_are_numbered_in_path_order():
+    retriever = ContentRetriever()
+    retriever.retrieve_chunks_by_concepts = lambda concepts: {
+        "alpha": [
+            LearningChunk(id=1, doc_source="a.md", content="A1", concept_tag="alpha"),
+            LearningChunk(id=2, doc_source="a.md", content="A2", concept_tag="alpha"),
+        ],
+        "beta": [LearningChunk(id=3, doc_source="b.md", content="B1", concept_tag="beta")],
+    }
+    captured = {}
+
+    async def mock_rewrite(target_concept, time_budget, raw_content, completed_concepts=None):
+        captured["raw"] = raw_content
+        return "LESSON"
+
+    retriever._rewrite_with_llm = mock_rewrite
+
+    await retriever._build_lesson(["alpha", "beta"], 30, [])
+
+    assert captured["raw"] == (
+        "### 1\nSource: a.md (Concept: alpha)\nContent: ```\nA1\n```\n\n"
+        "### 2\nSource: a.md (Concept: alpha)\nContent: ```\nA2\n```\n\n"
+        "### 3\nSource: b.md (Concept: beta)\nContent: ```\nB1\n```"
+    )
+
+
+@pytest.mark.asyncio
+async def test_lesson_database_calls_run_off_the_event_loop():
+    retriever = ContentRetriever()
+    loop_thread = threading.get_ident()
+    threads = {}
+
+    def record(name, result):
+        def call(*args, **kwargs):
+            threads[name] = threading.get_ident()
+            return result
+        return call
+
+    retriever._get_cached_lesson = record("cache_read", None)
+    retriever._cache_lesson = record("cache_write", None)
+    retriever.retrieve_chunks_by_concepts = record("chunks", {"alpha": []})
+
+    async def mock_generate(target_concept, time_budget):
+        return "LESSON"
+
+    retriever._generate_lesson_from_scratch = mock_generate
+
+    assert await retriever.get_lesson_content(["alpha"], time_budget_minutes=10) == "LESSON"
+    assert set(threads) == {"cache_read", "cache_write", "chunks"}
+    assert loop_thread not in threads.values()
+
+
+def test_clear_cached_lessons_drops_both_cache_levels():
+    retriever = ContentRetriever()
+    retriever.connection = MagicMock()
+    retriever.connection.execute_query.return_value = [{"id": 1}, {"id": 2}]
+    retriever._cache_lesson("alpha", 30, "LESSON")
+
+    assert retriever.clear_cached_lessons() == 2
+    assert content_retriever._lesson_cache == {}
+    query = retriever.connection.execute_query.call_args.args[0]
+    assert query.startswith("DELETE FROM cached_lessons")
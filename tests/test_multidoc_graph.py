@@ -10,7 +10,9 @@ from src.models.schemas import (
     GlobalConceptIndex,
     GraphSchema,
     ConceptNode,
-    PrerequisiteLink
+    PrerequisiteLink,
+    ConceptChunkIndex,
+    embedding_matrix
 )
 
 
@@ -64,6 +66,30 @@ class TestDocumentScopedConcept:
         assert concept.chunk_ids == []
         assert concept.is_merged is False
         assert concept.merged_with is None
+        assert concept.updated_at == concept.created_at
+
+    def test_scoped_concept_from_record(self):
+        """Test building a concept from a stored graph row."""
+        concept = DocumentScopedConcept.from_record(7, {
+            "scoped_id": "doc7_graphs",
+            "name": "Graphs",
+            "normalized": "graphs",
+            "description": None,
+            "depth_level": 2,
+            "chunk_ids": None,
+            "is_merged": None
+        })
+
+        assert concept.document_id == 7
+        assert concept.global_name == "Graphs"
+        assert concept.chunk_ids == []
+        assert concept.is_merged is False
+        assert concept.created_at is not None
+
+    def test_scoped_concept_from_external_validates(self):
+        """Test external data goes through validation."""
+        with pytest.raises(Exception):
+            DocumentScopedConcept.from_external({"scoped_id": "doc1_x", "document_id": "not-an-int"})
 
 
 class TestCrossDocumentConcept:
@@ -96,6 +122,24 @@ class TestCrossDocumentConcept:
         
         assert cross_concept.merged is True
 
+    def test_cross_document_ids_are_deduplicated_and_hashable(self):
+        """Test scoped IDs form a set, so equal concepts hash equal."""
+        first = CrossDocumentConcept(
+            global_id="global_dl",
+            global_name="Deep Learning",
+            document_scoped_ids=["doc1_dl", "doc2_dl", "doc1_dl"],
+            similarity_score=0.88
+        )
+        second = CrossDocumentConcept(
+            global_id="global_dl",
+            global_name="Deep Learning",
+            document_scoped_ids=["doc2_dl", "doc1_dl"],
+            similarity_score=0.88
+        )
+
+        assert first.document_scoped_ids == frozenset({"doc1_dl", "doc2_dl"})
+        assert hash(first) == hash(second)
+
 
 class TestDocumentGraph:
     """Tests for DocumentGraph model."""
@@ -185,6 +229,31 @@ class TestGlobalConceptIndex:
         assert len(index.document_ids) == 2
         assert index.occurrence_count == 5
         assert index.avg_depth == 2.5
+        assert index.vector is None
+
+    def test_global_index_packed_embedding(self):
+        """Test float16 embedding packing and matrix stacking."""
+        entries = [
+            GlobalConceptIndex(
+                global_id=f"global_{i}",
+                global_name=f"Concept {i}",
+                document_ids=[1],
+                occurrence_count=1,
+                avg_depth=1.0,
+                embedding=GlobalConceptIndex.pack_embedding([float(i), 0.5, 1.0])
+            )
+            for i in range(3)
+        ]
+
+        assert len(entries[0].embedding) == 6
+        assert entries[2].vector.tolist() == [2.0, 0.5, 1.0]
+
+        matrix = embedding_matrix(entries)
+        assert matrix.shape == (3, 3)
+        assert matrix.dtype.name == "float32"
+
+        restored = GlobalConceptIndex.model_validate_json(entries[1].model_dump_json())
+        assert restored.embedding == entries[1].embedding
 
 
 class TestGraphSchemaWithDocumentId:
@@ -210,6 +279,25 @@ class TestGraphSchemaWithDocumentId:
         assert len(schema.concepts) == 2
         assert len(schema.prerequisites) == 1
 
+    def test_concept_chunk_index_round_trip(self):
+        """Test CSR packing of concept mappings."""
+        schema = GraphSchema(
+            concepts=["concept1", "concept2", "concept3"],
+            prerequisites=[],
+            concept_mappings={"concept1": [1, 2], "concept2": [], "concept3": [3]}
+        )
+
+        index = schema.chunk_index()
+
+        assert index.offsets == [0, 2, 2, 3]
+        assert index.chunk_ids == [1, 2, 3]
+        assert index.get("concept1") == [1, 2]
+        assert index.get("concept2") == []
+        assert index.get("missing") is None
+        assert index.span("concept3") == slice(2, 3)
+        assert index.to_dict() == schema.concept_mappings
+        assert ConceptChunkIndex.model_validate_json(index.model_dump_json()).get("concept3") == [3]
+
 
 class TestConceptNode:
     """Tests for ConceptNode model."""
@@ -1,95 +1,478 @@
 """Unit tests for navigation logic without external Neo4j dependencies."""
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.navigation.navigation_engine import NavigationEngine
+from src.navigation.navigation_engine import MAX_PREVIEW_DEPTH, MultiDocNavigationEngine, NavigationEngine, _audit_queries
 from src.navigation.user_tracker import UserProgressTracker
-import src.navigation.user_tracker as user_tracker_module
 
 
 def test_find_root_concepts_returns_names():
+    NavigationEngine.invalidate_roots()
     engine = NavigationEngine()
     engine.connection = MagicMock()
-    engine.connection.execute_query.return_value = [{"name": "root_a"}, {"name": "root_b"}]
+    engine.connection.execute_stream.return_value = ["root_a", "root_b"]
 
     assert engine.find_root_concepts() == ["root_a", "root_b"]
 
 
-def test_get_path_preview_uses_depth_and_dedupes():
+def test_find_root_concepts_is_cached_until_invalidated():
+    NavigationEngine.invalidate_roots()
     engine = NavigationEngine()
     engine.connection = MagicMock()
-    engine.connection.execute_query.return_value = [
-        {"name": "alpha"},
-        {"name": "beta"},
-        {"name": "beta"},
-    ]
+    engine.connection.execute_stream.return_value = ["root_a"]
+
+    assert engine.find_root_concepts() == ["root_a"]
+    assert NavigationEngine().find_root_concepts() == ["root_a"]
+    engine.connection.execute_stream.assert_called_once()
+
+    NavigationEngine.invalidate_roots()
+    engine.connection.execute_stream.return_value = ["root_b"]
+    assert engine.find_root_concepts() == ["root_b"]
+    NavigationEngine.invalidate_roots()
+
+
+def test_instance_returns_shared_engine():
+    assert NavigationEngine.instance() is NavigationEngine.instance()
+
+
+def test_get_path_preview_uses_depth():
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_stream.return_value = ["alpha", "beta"]
 
     result = engine.get_path_preview("Alpha", depth=2)
 
     assert result == ["alpha", "beta"]
 
-    query, params = engine.connection.execute_query.call_args[0]
-    assert "*0..2" in query
-    assert params["root_name"] == "alpha"
+    query, params = engine.connection.execute_stream.call_args[0]
+    assert "apoc" not in query
+    assert "[:PREREQUISITE*0..2]" in query
+    assert "min(length(path)) AS hops" in query
+    assert "{name_key: $root_name}" in query
+    assert params == {"root_name": "alpha"}
+
+
+def test_get_path_preview_clamps_depth():
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_stream.return_value = []
+
+    engine.get_path_preview("alpha", depth=50)
+
+    query, _ = engine.connection.execute_stream.call_args[0]
+    assert f"*0..{MAX_PREVIEW_DEPTH}]" in query
+
+
+def test_get_all_path_previews_keys_by_root():
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_read.return_value = [
+        {"root": "a", "concepts": ["a", "b"]},
+        {"root": "c", "concepts": ["c"]},
+    ]
+
+    assert engine.get_all_path_previews(depth=2) == {"a": ["a", "b"], "c": ["c"]}
+    query = engine.connection.execute_read.call_args[0][0]
+    assert "apoc" not in query
+    assert "[:PREREQUISITE*0..2]" in query
+
+
+def test_get_path_preview_between_joins_on_distances():
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_read.return_value = [{
+        "forward": [["a", 0], ["b", 1], ["side", 1], ["c", 2], ["far", 3]],
+        "backward": [["c", 0], ["b", 1], ["a", 2], ["other", 1]],
+    }]
+
+    assert engine.get_path_preview_between("A", "C", depth=2) == ["a", "b", "c"]
+    query, params = engine.connection.execute_read.call_args[0]
+    assert "apoc" not in query
+    assert "(root)-[:PREREQUISITE*0..2]->" in query and "(target)<-[:PREREQUISITE*0..2]-" in query
+    assert params == {"root_name": "a", "target_name": "c"}
 
 
 def test_validate_prerequisites_true_when_none_missing():
     engine = NavigationEngine()
     engine.connection = MagicMock()
-    engine.connection.execute_query.return_value = [{"missing_prerequisites": 0}]
+    engine.connection.execute_read.return_value = []
 
     assert engine.validate_prerequisites("u1", "Concept") is True
 
 
+def test_validate_prerequisites_batch_uses_one_query():
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_read.return_value = [{"cname": "beta", "missing_prerequisites": 2}]
+
+    result = engine.validate_prerequisites_batch("u1", ["Alpha", " Beta", "alpha"])
+
+    assert result == {"Alpha": True, " Beta": False, "alpha": True}
+    engine.connection.execute_read.assert_called_once()
+    _, params = engine.connection.execute_read.call_args[0]
+    assert sorted(params["concept_names"]) == ["alpha", "beta"]
+
+
 def test_get_unlocked_concepts_returns_list():
     engine = NavigationEngine()
     engine.connection = MagicMock()
-    engine.connection.execute_query.return_value = [{"name": "alpha"}, {"name": "beta"}]
+    engine.connection.execute_stream.return_value = ["alpha", "beta"]
 
     assert engine.get_unlocked_concepts("u1") == ["alpha", "beta"]
 
 
-def test_user_tracker_marks_progress(monkeypatch):
+def test_get_neighborhood_returns_server_shaped_payload():
+    NavigationEngine.invalidate_roots()
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    nodes = [{"id": "beta", "group": "target"}, {"id": "alpha", "group": "prerequisite"}]
+    edges = [{"source": "alpha", "target": "beta", "type": "prerequisite"}]
+    engine.connection.execute_read.return_value = [{"key": "beta", "nodes": nodes, "edges": edges}]
+
+    result = engine.get_neighborhood("Beta")
+
+    assert result == {"nodes": nodes, "edges": edges}
+    query, params = engine.connection.execute_read.call_args[0]
+    assert params == {"name": "beta"}
+    assert "{id: target.name, group: 'target'}" in query
+    assert "apoc" not in query
+
+
+def test_get_neighborhood_is_cached_per_graph_version():
+    NavigationEngine.invalidate_roots()
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_read.return_value = [
+        {"key": "beta", "nodes": [{"id": "beta", "group": "target"}], "edges": []}
+    ]
+
+    engine.get_neighborhood("Beta")
+    engine.get_neighborhood("beta ")
+    assert engine.connection.execute_read.call_count == 1
+
+    NavigationEngine.invalidate_roots()
+    engine.get_neighborhood("beta")
+    assert engine.connection.execute_read.call_count == 2
+
+
+def test_get_neighborhood_cache_expires_and_is_not_shared(monkeypatch):
+    NavigationEngine.invalidate_roots()
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_read.return_value = [
+        {"key": "beta", "nodes": [{"id": "beta", "group": "target"}], "edges": []}
+    ]
+
+    first = engine.get_neighborhood("beta")
+    first["nodes"].append({"id": "mutated"})
+    assert engine.get_neighborhood("beta")["nodes"] == [{"id": "beta", "group": "target"}]
+    assert engine.connection.execute_read.call_count == 1
+
+    # Entries expire on their own, e.g. after ingestion in another worker process
+    monkeypatch.setattr(NavigationEngine._neighborhood_cache, "ttl", 0.0)
+    NavigationEngine._neighborhood_cache.clear()
+    engine.get_neighborhood("beta")
+    engine.get_neighborhood("beta")
+    assert engine.connection.execute_read.call_count == 3
+
+
+def test_get_neighborhoods_batch_keys_by_input_name():
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_read.return_value = [
+        {"key": "beta", "nodes": [], "edges": [{"source": "alpha", "target": "beta", "type": "prerequisite"}]}
+    ]
+
+    result = engine.get_neighborhoods_batch(["Beta", "missing"])
+
+    assert result["Beta"]["edges"] == [{"source": "alpha", "target": "beta", "type": "prerequisite"}]
+    assert result["missing"] == {"nodes": [], "edges": []}
+    engine.connection.execute_read.assert_called_once()
+
+
+def test_get_full_graph_derives_status_from_prerequisite_counts():
+    NavigationEngine.invalidate_roots()
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    nodes = [
+        {"name": "a", "description": None, "status": "COMPLETED", "in_degree": 0, "out_degree": 2, "completed_prereqs": 0},
+        {"name": "b", "description": "B", "status": None, "in_degree": 1, "out_degree": 0, "completed_prereqs": 1},
+        {"name": "c", "description": "", "status": None, "in_degree": 2, "out_degree": 0, "completed_prereqs": 1},
+        {"name": "d", "description": "", "status": None, "in_degree": 0, "out_degree": 1, "completed_prereqs": 0},
+    ]
+    links = [
+        {"source": "a", "target": "b", "type": "PREREQUISITE"},
+        {"source": "a", "target": "c", "type": "PREREQUISITE"},
+        {"source": "d", "target": "c", "type": "PREREQUISITE"},
+    ]
+    # The two queries run concurrently, so answer by query rather than call order
+    engine.connection.execute_stream.side_effect = lambda query, params=None: iter(nodes if params else links)
+
+    graph = engine.get_full_graph("u1")
+
+    statuses = {node["id"]: (node["status"], node["val"]) for node in graph["nodes"]}
+    assert statuses == {"a": ("COMPLETED", 14), "b": ("UNLOCKED", 12), "c": ("LOCKED", 14), "d": ("UNLOCKED", 12)}
+    assert graph["links"][0] == {"source": "a", "target": "b", "relationship": "PREREQUISITE"}
+
+    assert engine.get_full_graph("u1") == graph
+    NavigationEngine.invalidate_progress("u1")
+    engine.get_full_graph("u1")
+    assert engine.connection.execute_stream.call_count == 4
+
+
+def test_get_full_graph_cache_is_not_shared_with_callers():
+    NavigationEngine.invalidate_roots()
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    node = {"name": "a", "description": None, "status": None, "in_degree": 0, "out_degree": 0, "completed_prereqs": 0}
+    engine.connection.execute_stream.side_effect = lambda query, params=None: iter([node] if params else [])
+
+    first = engine.get_full_graph("u1")
+    first["nodes"].append({"id": "mutated"})
+    first["links"].append({"source": "a", "target": "mutated"})
+
+    second = engine.get_full_graph("u1")
+    assert [n["id"] for n in second["nodes"]] == ["a"]
+    assert second["links"] == []
+    assert engine.connection.execute_stream.call_count == 2
+
+
+def test_get_full_graph_read_overlapping_progress_change_is_not_cached():
+    NavigationEngine.invalidate_roots()
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    node = {"name": "a", "description": None, "status": None, "in_degree": 0, "out_degree": 0, "completed_prereqs": 0}
+
+    def stream(query, params=None):
+        # mark_completed() lands while the first read is still in flight
+        if params and engine.connection.execute_stream.call_count <= 2:
+            NavigationEngine.invalidate_progress("u1")
+        return iter([node] if params else [])
+
+    engine.connection.execute_stream.side_effect = stream
+
+    engine.get_full_graph("u1")
+    engine.get_full_graph("u1")
+    assert engine.connection.execute_stream.call_count == 4
+
+
+def test_async_variants_share_queries_and_roots_cache():
+    NavigationEngine.invalidate_roots()
+    engine = NavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_read_async = AsyncMock(side_effect=[
+        ["a"],
+        [{"name": "a", "description": None, "status": None, "in_degree": 0, "out_degree": 0, "completed_prereqs": 0}],
+        [],
+    ])
+
+    assert asyncio.run(engine.a_find_root_concepts()) == ["a"]
+    assert engine.find_root_concepts() == ["a"]
+    graph = asyncio.run(engine.a_get_full_graph("u1"))
+
+    assert graph == {"nodes": [{"id": "a", "name": "a", "description": "", "status": "UNLOCKED", "val": 10}], "links": []}
+    assert engine.connection.execute_read_async.await_count == 3
+    engine.connection.execute_stream.assert_not_called()
+    NavigationEngine.invalidate_roots()
+
+
+def test_document_root_concepts_batch_groups_by_document():
+    NavigationEngine.invalidate_roots()
+    engine = MultiDocNavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_query.return_value = [{"doc_id": 2, "roots": [{"scoped_id": "doc2_a", "name": "A"}]}]
+
+    assert engine.get_document_root_concepts_batch([1, 2]) == {1: [], 2: [{"scoped_id": "doc2_a", "name": "A"}]}
+    assert engine.get_document_root_concepts(2) == [{"scoped_id": "doc2_a", "name": "A"}]
+    engine.connection.execute_query.assert_called_once()
+
+
+def test_document_path_preview_inlines_clamped_depth():
+    engine = MultiDocNavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_query.return_value = [{"scoped_id": "doc2_a"}, {"scoped_id": "doc2_b"}]
+
+    assert engine.get_document_path_preview(2, "A", depth=50) == ["doc2_a", "doc2_b"]
+
+    query, params = engine.connection.execute_query.call_args.args
+    assert f"*0..{MAX_PREVIEW_DEPTH} " in query
+    assert "$depth" not in query and "depth" not in params
+    assert "min(length(path)) AS hops" in query
+
+
+def test_document_neighborhoods_batch_keys_by_scoped_id():
+    engine = MultiDocNavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_query.return_value = [{
+        "target_id": "doc1_b", "target_name": "B",
+        "prerequisites": [{"id": "doc1_a", "name": "A"}], "dependents": [{"id": "doc1_c", "name": "C"}],
+    }]
+
+    result = engine.get_document_neighborhoods_batch([(1, "B"), (1, "missing")])
+
+    assert list(result) == ["doc1_b"]
+    assert result["doc1_b"]["edges"] == [
+        {"source": "doc1_a", "target": "doc1_b", "type": "prerequisite"},
+        {"source": "doc1_b", "target": "doc1_c", "type": "dependent"},
+    ]
+    _, params = engine.connection.execute_query.call_args[0]
+    assert params["targets"] == [{"scoped_id": "doc1_b", "doc_id": 1}, {"scoped_id": "doc1_missing", "doc_id": 1}]
+
+
+def test_cross_document_connections_filters_and_orders_in_cypher():
+    engine = MultiDocNavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_query.return_value = [
+        {"scoped_id": "doc1_a", "name": "a", "global_id": "g1", "global_name": "a", "other_doc_ids": [2, 3]},
+    ]
+
+    result = engine.get_cross_document_connections(1)
+
+    assert result == [{
+        "scoped_id": "doc1_a", "local_name": "a", "global_id": "g1", "global_name": "a",
+        "other_documents": [2, 3], "connection_count": 2,
+    }]
+    query, _ = engine.connection.execute_query.call_args[0]
+    assert "WHERE size(other_doc_ids) > 0" in query
+    assert "collect(DISTINCT other.document_id)" in query
+    assert "apoc" not in query
+
+
+def test_find_concept_across_documents_binds_normalized_name():
+    engine = MultiDocNavigationEngine()
+    engine.connection = MagicMock()
+    engine.connection.execute_query.return_value = [
+        {"document_id": 3, "scoped_id": "doc3_a"},
+        {"document_id": 1, "scoped_id": "doc1_a"},
+    ]
+
+    result = engine.find_concept_across_documents(" A ")
+
+    assert [r["document_id"] for r in result] == [1, 3]
+    _, params = engine.connection.execute_query.call_args[0]
+    assert params == {"normalized": "a"}
+
+
+def _fake_explain_driver(operator_for):
+    def run(query, parameters):
+        summary = MagicMock()
+        summary.plan = {"operatorType": "ProduceResults@neo4j", "children": [
+            {"operatorType": f"{operator_for(query)}@neo4j", "children": []}
+        ]}
+        return MagicMock(consume=MagicMock(return_value=summary))
+
+    session = MagicMock()
+    session.run.side_effect = run
+    driver = MagicMock()
+    driver.session.return_value.__enter__.return_value = session
+    return driver
+
+
+def test_audit_queries_allows_label_scans_only_for_full_graph_methods():
+    seek = _fake_explain_driver(lambda query: "NodeByLabelScan" if "MATCH (c:Concept)" in query else "NodeIndexSeek")
+    report = _audit_queries(seek)
+
+    assert report["get_neighborhood"] == ["ProduceResults", "NodeIndexSeek"]
+
+    scan = _fake_explain_driver(lambda query: "NodeByLabelScan")
+    with pytest.raises(AssertionError, match="get_neighborhood plans a NodeByLabelScan"):
+        _audit_queries(scan)
+
+
+def test_user_tracker_marks_progress():
     tracker = UserProgressTracker()
     tracker.connection = MagicMock()
-    tracker.navigation = MagicMock()
-    tracker.navigation.validate_prerequisites.return_value = True
-
-    mock_graph_storage = MagicMock()
-    mock_graph_storage.store_user.return_value = True
-    mock_graph_storage.concept_exists.return_value = True
-    monkeypatch.setattr(user_tracker_module, "graph_storage", mock_graph_storage)
+    tracker.connection.execute_query.return_value = [
+        {"concept_name": "concept", "concept_exists": True, "prereqs_met": True}
+    ]
 
     assert tracker.mark_in_progress("user1", "Concept") is True
-    tracker.connection.execute_write_query.assert_called_once()
+    tracker.connection.execute_query.assert_called_once()
+    tracker.connection.execute_write_query.assert_not_called()
 
 
-def test_user_tracker_completes_progress(monkeypatch):
+def test_user_tracker_completes_progress():
     tracker = UserProgressTracker()
     tracker.connection = MagicMock()
-
-    mock_graph_storage = MagicMock()
-    mock_graph_storage.store_user.return_value = True
-    mock_graph_storage.concept_exists.return_value = True
-    monkeypatch.setattr(user_tracker_module, "graph_storage", mock_graph_storage)
+    tracker.connection.execute_query.return_value = [
+        {"concept_name": "concept", "concept_exists": True, "prereqs_met": True}
+    ]
 
     assert tracker.mark_completed("user1", "Concept") is True
-    tracker.connection.execute_write_query.assert_called_once()
+    query, _ = tracker.connection.execute_query.call_args[0]
+    assert "MERGE (u:User {uid: $user_id})" in query
+    assert "DELETE ip" in query
+
+
+def test_user_tracker_rejects_unknown_concept():
+    tracker = UserProgressTracker()
+    tracker.connection = MagicMock()
+    tracker.connection.execute_query.return_value = [
+        {"concept_name": "concept", "concept_exists": False, "prereqs_met": False}
+    ]
+
+    assert tracker.mark_completed("user1", "Concept") is False
 
 
-def test_user_tracker_get_user_state(monkeypatch):
+def test_user_tracker_marks_progress_in_bulk():
     tracker = UserProgressTracker()
     tracker.connection = MagicMock()
-    tracker.connection.execute_query.side_effect = [
-        [{"name": "completed"}],
-        [{"name": "in_progress"}],
+    tracker.connection.execute_query.return_value = [
+        {"concept_name": "a", "concept_exists": True, "prereqs_met": False},
+        {"concept_name": "missing", "concept_exists": False, "prereqs_met": False},
     ]
+
+    result = tracker.mark_in_progress_bulk("user1", ["A", "missing", ""])
+
+    assert result == {"A": True, "missing": False, "": False}
+    _, params = tracker.connection.execute_query.call_args[0]
+    assert sorted(params["concept_names"]) == ["a", "missing"]
+    tracker.connection.execute_query.assert_called_once()
+
+
+def test_user_tracker_get_user_state():
+    tracker = UserProgressTracker()
+    tracker.connection = MagicMock()
+    tracker.connection.execute_query.return_value = [{"completed": ["completed"], "in_progress": ["in_progress"]}]
     tracker.navigation = MagicMock()
     tracker.navigation.get_unlocked_concepts.return_value = ["unlocked"]
 
     state = tracker.get_user_state("user1")
     assert state.completed_concepts == ["completed"]
     assert state.in_progress_concepts == ["in_progress"]
-    assert state.available_concepts == ["unlocked"]
\ No newline at end of file
+    assert state.available_concepts == ["unlocked"]
+    tracker.connection.execute_query.assert_called_once()
+
+
+def test_user_tracker_get_user_state_async():
+    tracker = UserProgressTracker()
+    tracker.connection = MagicMock()
+    tracker.connection.execute_read_async = AsyncMock(return_value=[{"completed": [], "in_progress": ["a"]}])
+    tracker.navigation = MagicMock()
+    tracker.navigation.a_get_unlocked_concepts = AsyncMock(return_value=["b"])
+
+    state = asyncio.run(tracker.a_get_user_state("user1"))
+
+    assert state.in_progress_concepts == ["a"]
+    assert state.available_concepts == ["b"]
+
+def test_document_path_route_accepts_depth_up_to_ten(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from src.routers import multidoc_graph
+
+    navigation = MagicMock()
+    navigation.get_document_path_preview.return_value = ["doc2_a"]
+    monkeypatch.setattr(multidoc_graph, "multi_doc_navigation", navigation)
+    app = FastAPI()
+    app.include_router(multidoc_graph.router)
+    client = TestClient(app)
+    path = app.url_path_for("get_document_path_preview", document_id=2)
+
+    assert client.get(path, params={"root_concept": "A", "depth": 10}).status_code == 200
+    navigation.get_document_path_preview.assert_called_once_with(document_id=2, root_concept="A", depth=10)
+    assert client.get(path, params={"root_concept": "A", "depth": 11}).status_code == 422
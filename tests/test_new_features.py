@@ -8,13 +8,17 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 import sys
 import os
+import uuid
+from datetime import datetime
 
 # Ensure src is in path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from main import app
 from src.database.orm import Base, get_db
-from src.models.orm import Folder, Flashcard, StudySession, Document, ActivityLog, StudyReview, UserSettings
+from src.models.orm import (
+    Folder, Flashcard, StudySession, Document, ActivityLog, StudyReview, UserSettings, FocusSession, PracticeSession
+)
 
 # Setup test DB:
 # 1) Try Postgres test DB if available.
@@ -46,7 +50,7 @@ app.dependency_overrides[get_db] = override_get_db
 
 # Create only required tables for this test module.
 # (Using a subset avoids backend-specific types from unrelated tables.)
-for model in (UserSettings, Folder, Document, Flashcard, StudySession, StudyReview, ActivityLog):
+for model in (UserSettings, Folder, Document, Flashcard, StudySession, StudyReview, ActivityLog, FocusSession, PracticeSession):
     model.__table__.create(bind=engine, checkfirst=True)
 
 client = TestClient(app)
@@ -129,6 +133,40 @@ def test_analytics_overview():
     assert "total_flashcards" in data
     assert "retention_rate" in data
 
+def test_time_allocation_series_matches_items():
+    """Column-wise time allocation carries the same numbers as the row form."""
+    sessions = [
+        StudySession(id=str(uuid.uuid4()), start_time=datetime(2020, 3, 2, 9), end_time=datetime(2020, 3, 2, 9, 25)),
+        StudySession(id=str(uuid.uuid4()), start_time=datetime(2020, 3, 3, 18), end_time=datetime(2020, 3, 3, 18, 40)),
+    ]
+    db = TestingSessionLocal()
+    db.add_all(sessions)
+    db.commit()
+    try:
+        params = {"date_from": "2020-03-01", "date_to": "2020-03-05"}
+        rows = client.get("/api/analytics/time-allocation", params=params).json()["items"]
+        series = client.get("/api/analytics/time-allocation/series", params=params).json()
+    finally:
+        for session in sessions:
+            db.delete(session)
+        db.commit()
+        db.close()
+
+    assert [row["date"] for row in rows] == ["2020-03-02", "2020-03-03"]
+    assert [row["study_minutes"] for row in rows] == [25, 40]
+    assert series["dates"] == [row["date"] for row in rows]
+    assert series["study_minutes"] == [row["study_minutes"] for row in rows]
+    assert series["total_minutes"] == [row["total_minutes"] for row in rows]
+
+def test_activity_timestamps_are_epoch_millis():
+    """Activity feed timestamps are computed in SQL as integer epoch milliseconds."""
+    _create_flashcard()
+    response = client.get("/api/analytics/activity")
+    assert response.status_code == 200
+    activities = response.json()
+    assert activities
+    assert all(isinstance(item["timestamp"], int) for item in activities)
+
 def test_documents_api():
     """Test documents API lists content (even if empty)."""
     response = client.get("/api/documents/")
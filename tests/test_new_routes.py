@@ -61,7 +61,7 @@ class TestNewRoutes:
 
     def test_get_root_concepts(self):
         """Test GET /api/concepts/roots"""
-        mock_nav_engine.find_root_concepts.return_value = ["root_a", "root_b"]
+        mock_nav_engine.a_find_root_concepts = AsyncMock(return_value=["root_a", "root_b"])
 
         response = client.get("/api/concepts/roots")
         assert response.status_code == 200
@@ -69,6 +69,15 @@ class TestNewRoutes:
         assert len(data) == 2
         assert data[0] == "root_a"
 
+    def test_clear_lesson_cache(self):
+        """Test DELETE /api/learning/lessons/cache"""
+        mock_content_retriever.clear_cached_lessons.return_value = 3
+
+        response = client.delete("/api/learning/lessons/cache")
+        assert response.status_code == 200
+        assert response.json() == {"deleted": 3}
+        mock_content_retriever.clear_cached_lessons.assert_called_once_with()
+
     def test_progress_start(self):
         """Test POST /api/progress/start"""
         mock_user_tracker.mark_in_progress.return_value = True
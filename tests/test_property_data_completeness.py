@@ -1,5 +1,7 @@
 """Deterministic tests for data completeness validation."""
 
+from dataclasses import asdict
+
 from pydantic import ValidationError
 import pytest
 
@@ -76,7 +78,7 @@ def test_prerequisite_link_completeness_invariant():
         reasoning="reason",
     )
 
-    data = original.model_dump()
+    data = asdict(original)
     reconstructed = PrerequisiteLink(**data)
 
     assert reconstructed.source_concept == original.source_concept
@@ -1,5 +1,6 @@
 """Deterministic tests for concept name normalization."""
 
+from src.database.graph_storage import MultiDocGraphStorage, scoped_id
 from src.ingestion.ingestion_engine import IngestionEngine
 
 
@@ -41,4 +42,12 @@ def test_normalize_preserves_content():
 
     normalized = engine._normalize_concept_name(name)
 
-    assert normalized == name.strip().lower()
\ No newline at end of file
+    assert normalized == name.strip().lower()
+
+def test_scoped_id_is_normalized_and_interned():
+    first = scoped_id(7, "  Graph Theory ")
+    second = scoped_id(7, "graph theory")
+
+    assert first == "doc7_graph_theory"
+    assert first is second
+    assert MultiDocGraphStorage.generate_scoped_id(7, "Graph Theory") == first
@@ -1,9 +1,25 @@
 """Deterministic tests for schema validation."""
 
-from pydantic import ValidationError
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
 import pytest
 
-from src.models.schemas import GraphSchema, PrerequisiteLink, UserState
+from src.models import schemas
+from src.models.schemas import (
+    CurriculumModuleResponse,
+    GraphSchema,
+    IngestionJobResponse,
+    KnowledgeGraphDataResponse,
+    PracticeSessionCreate,
+    PrerequisiteLink,
+    UserState,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
 
 
 def test_graph_schema_json_round_trip():
@@ -85,4 +101,107 @@ def test_user_state_json_round_trip():
     assert reconstructed.user_id == state.user_id
     assert reconstructed.completed_concepts == state.completed_concepts
     assert reconstructed.in_progress_concepts == state.in_progress_concepts
-    assert reconstructed.available_concepts == state.available_concepts
\ No newline at end of file
+    assert reconstructed.available_concepts == state.available_concepts
+
+
+@pytest.mark.parametrize("content", ["# Primer", [{"front": "a", "back": "b"}], {"questions": []}, None])
+def test_curriculum_module_content_variants(content):
+    module = CurriculumModuleResponse(id="m1", title="Module", is_completed=False, content=content)
+
+    assert CurriculumModuleResponse.model_validate_json(module.model_dump_json()).content == content
+
+
+@pytest.mark.parametrize("content", [3, 2.5, True])
+def test_curriculum_module_content_passes_legacy_scalars_through(content):
+    module = CurriculumModuleResponse.model_validate(
+        {"id": "m1", "title": "Module", "is_completed": False, "content": content}
+    )
+
+    assert module.content == content
+    assert CurriculumModuleResponse.model_validate_json(module.model_dump_json()).content == content
+
+
+def test_json_passthrough_fields_keep_payload_and_schema():
+    nodes = [{"id": "a", "nested": {"weights": [1, 2]}}]
+    graph = KnowledgeGraphDataResponse(
+        graph_id="g1", nodes=nodes, links=[], node_count=1, relationship_count=0, graph_meta={}
+    )
+
+    assert graph.nodes is nodes
+    properties = KnowledgeGraphDataResponse.model_json_schema()["properties"]
+    assert properties["nodes"]["items"]["type"] == "object"
+
+
+def test_epoch_ms_fields_convert_datetimes():
+    started = datetime(2026, 1, 1, 12, 0, 0, 500000)
+    job = IngestionJobResponse(
+        id="j1", document_id=1, status="running", phase="parse", progress=0.1,
+        started_at=started, completed_at=started.replace(tzinfo=timezone.utc),
+    )
+
+    assert job.started_at == job.completed_at == 1767268800500
+    assert IngestionJobResponse.model_json_schema()["properties"]["started_at"]["anyOf"][0]["type"] == "integer"
+
+
+def _schema_models():
+    for name in schemas.__all__:
+        obj = getattr(schemas, name)
+        if isinstance(obj, type) and issubclass(obj, BaseModel):
+            yield name, obj
+
+
+def test_all_schemas_are_built_at_import():
+    incomplete = [name for name, obj in _schema_models() if not obj.__pydantic_complete__]
+
+    assert incomplete == []
+
+
+def test_response_trees_are_frozen():
+    # DocumentResponse is enriched in place by the documents router
+    mutable = [
+        name for name, obj in _schema_models()
+        if name.endswith("Response") and name != "DocumentResponse" and not obj.model_config.get("frozen")
+    ]
+
+    assert mutable == []
+    week = schemas.CurriculumWeekResponse(
+        id="w1", curriculum_id="c1", week_index=1, goal="g",
+        tasks=[schemas.CurriculumTaskResponse(id="t1", week_id="w1", title="Read", task_type="reading")],
+    )
+    with pytest.raises(ValidationError):
+        week.tasks[0].title = "Skim"
+
+
+def test_daily_plan_entry_accepts_a_date():
+    entry = schemas.DailyPlanEntryCreate(title="Review", date="2026-03-01")
+
+    assert entry.date.isoformat() == "2026-03-01"
+
+
+def test_schemas_use_factories_for_mutable_defaults():
+    shared = [
+        f"{name}.{field_name}"
+        for name, obj in _schema_models()
+        for field_name, field in obj.model_fields.items()
+        if isinstance(field.default, (list, dict, set))
+    ]
+
+    assert shared == []
+
+
+def test_enum_fields_validate_and_store_plain_values():
+    assert PracticeSessionCreate().mode == "focus"
+    assert type(PracticeSessionCreate(mode="deep").mode) is str
+    with pytest.raises(ValidationError):
+        PracticeSessionCreate(mode="marathon")
+
+
+def test_schema_domains_load_lazily():
+    code = (
+        "import sys\n"
+        "from src.models.schemas import KnowledgeGraphDataResponse\n"
+        "print(sorted(m.rsplit('.', 1)[1] for m in sys.modules if m.startswith('src.models.schemas.')))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT)
+
+    assert result.stdout.strip() == "['common', 'kg']"
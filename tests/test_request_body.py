@@ -0,0 +1,61 @@
+"""Tests for the raw-JSON request body dependency."""
+
+from typing import List
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from src.models.schemas import StudyReviewCreate
+from src.utils.request_body import json_body
+
+app = FastAPI()
+
+
+@app.post("/review")
+def _review(review: StudyReviewCreate = Depends(json_body(StudyReviewCreate))):
+    return {"rating": review.rating}
+
+
+@app.post("/reviews")
+def _reviews(reviews: List[StudyReviewCreate] = Depends(json_body(TypeAdapter(List[StudyReviewCreate])))):
+    return {"count": len(reviews)}
+
+
+client = TestClient(app)
+
+
+def test_json_body_validates_model():
+    response = client.post("/review", json={"flashcard_id": "c1", "rating": 4})
+
+    assert response.status_code == 200
+    assert response.json() == {"rating": 4}
+
+
+def test_json_body_accepts_type_adapter_for_arrays():
+    response = client.post("/reviews", json=[{"flashcard_id": "c1", "rating": 1}, {"flashcard_id": "c2", "rating": 2}])
+
+    assert response.json() == {"count": 2}
+
+
+def test_json_body_reports_errors_under_body():
+    response = client.post("/review", json={"flashcard_id": "c1", "rating": 9})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "rating"]
+
+
+def test_json_body_routes_keep_request_body_schema_in_openapi():
+    from main import app as main_app
+
+    paths = main_app.openapi()["paths"]
+    for path, method, field in [
+        ("/api/flashcards/", "post", "card_type"),
+        ("/api/study/session/{session_id}/review", "post", "rating"),
+        ("/api/documents/{document_id}", "put", "title"),
+    ]:
+        body = paths[path][method]["requestBody"]
+        schema = body["content"]["application/json"]["schema"]
+        assert body["required"] is True
+        assert field in schema["properties"]
+        assert "$ref" not in str(schema)
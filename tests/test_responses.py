@@ -0,0 +1,116 @@
+"""Tests for the orjson-backed response helpers."""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import List
+
+import ormsgpack
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from src.models.enums import CardType
+from src.models.schemas import FlashcardListAdapter, FlashcardResponse, LearningPath, PracticeSessionItem, SRSState
+from src.utils.responses import (
+    MsgPackResponse,
+    PydanticORJSONResponse,
+    fast_from_orm,
+    list_response,
+    model_response,
+)
+
+
+def _card(card_id: str) -> SimpleNamespace:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        id=card_id,
+        front="front",
+        back="back",
+        card_type="basic",
+        tags=["tag"],
+        document_id=None,
+        created_at=now,
+        ease_factor=2.5,
+        interval=1,
+        repetitions=0,
+        next_review=now,
+        last_review=None,
+    )
+
+
+def test_render_passes_pre_encoded_bytes_through():
+    response = PydanticORJSONResponse(content=b'{"ok":true}')
+
+    assert response.body == b'{"ok":true}'
+    assert response.media_type == "application/json"
+
+
+def test_render_encodes_nested_models():
+    path = LearningPath(concepts=["a"], estimated_time_minutes=5, target_concept="a")
+    response = PydanticORJSONResponse(content={"path": path})
+
+    assert json.loads(response.body)["path"]["concepts"] == ["a"]
+
+
+def test_render_falls_back_for_non_native_types():
+    response = PydanticORJSONResponse(content={"price": Decimal("1.50"), "ids": frozenset([3]), "type": CardType.CLOZE})
+
+    assert json.loads(response.body) == {"price": "1.50", "ids": [3], "type": "cloze"}
+
+
+def test_model_response_matches_pydantic_json():
+    path = LearningPath(concepts=["a", "b"], estimated_time_minutes=10, target_concept="b")
+
+    assert json.loads(model_response(path).body) == json.loads(path.model_dump_json())
+
+
+def test_list_response_validates_orm_rows():
+    adapter = TypeAdapter(List[FlashcardResponse])
+    response = list_response(adapter, [_card("c1"), _card("c2")])
+
+    payload = json.loads(response.body)
+    assert [item["id"] for item in payload] == ["c1", "c2"]
+    assert payload[0]["next_review"] == "2026-01-01T00:00:00Z"
+
+
+def test_flashcard_list_adapter_fills_defaults_and_rejects_bad_rows():
+    rows = [_card("c1"), _card("c2")]
+    del rows[1].tags
+
+    payload = json.loads(list_response(FlashcardListAdapter, rows).body)
+
+    assert payload[1]["tags"] == []
+    rows[0].card_type = "legacy"
+    with pytest.raises(ValidationError):
+        list_response(FlashcardListAdapter, rows)
+
+
+def test_msgpack_response_matches_json_payload():
+    content = {"nodes": [{"id": "a", "created": datetime(2026, 1, 1, tzinfo=timezone.utc)}], "ids": frozenset([3])}
+
+    packed = ormsgpack.unpackb(MsgPackResponse(content=content).body)
+
+    assert packed == json.loads(PydanticORJSONResponse(content=content).body)
+
+
+def test_fast_from_orm_constructs_only_trusted_schemas():
+    item = SimpleNamespace(id="i1", item_type="flashcard", prompt="Q", expected_answer=None, source_id=None, metadata_json=None)
+
+    assert fast_from_orm(PracticeSessionItem, item) == PracticeSessionItem.model_validate(item)
+
+    item.prompt = 42
+    assert fast_from_orm(PracticeSessionItem, item).prompt == 42
+    card = _card("c1")
+    card.interval = "soon"
+    with pytest.raises(ValidationError):
+        fast_from_orm(SRSState, card)
+
+
+@pytest.mark.parametrize("field, value", [("tags", None), ("card_type", "legacy")])
+def test_fast_from_orm_validates_flashcard_rows(field, value):
+    card = _card("c1")
+    setattr(card, field, value)
+
+    with pytest.raises(ValidationError):
+        fast_from_orm(FlashcardResponse, card)
@@ -0,0 +1,37 @@
+"""Tests for SRSState handling in the SRS service."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from src.services.srs_service import SRSService
+
+
+def _card(**overrides):
+    fields = dict(ease_factor=2.5, interval=1, repetitions=0, next_review=datetime(2026, 1, 1), last_review=None)
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_review_matches_calculate_next_review():
+    card = _card(repetitions=2, interval=6)
+
+    state = SRSService.review(card, rating=4)
+    ease, interval, repetitions, _ = SRSService.calculate_next_review(2.5, 6, 2, 4)
+
+    assert (state.ease_factor, state.interval, state.repetitions) == (ease, interval, repetitions)
+    assert state.last_review is not None
+
+
+def test_apply_writes_state_back_and_state_is_frozen():
+    card = _card()
+    state = SRSService.review(card, rating=1)
+
+    SRSService.apply(card, state)
+
+    assert card.repetitions == 0
+    assert card.next_review == state.next_review
+    with pytest.raises(ValidationError):
+        state.interval = 10